@@ -0,0 +1,197 @@
+'''
+缓存页表的三种实现对比(16K缓存页)
+- dict + tuple: 原来BufManager中的fdpd_to_idx(fd -> {pd: 缓存页号})和idx_to_fdpd(缓存页号 -> (fd, pd))
+- PageTable: 现在的实现, 正向每个文件一个dict, 反向是两个定长数组
+- open addressing: 以打包的(fd << 32 | pd)为键做线性探测的哈希表, 批量查找用NumPy一起探测, 只是原型, 没有采用
+测量单页查找, 换出后再放入, 批量查找64页和4096页的时间, 以及建表后占用的内存
+最后通过BufManager用512页的缓存顺序读一个19MB的文件
+用法: python bench/page_table.py [仓库路径], 给出旧版本的仓库时只在它上面测顺序读
+'''
+import os
+import sys
+import random
+import tempfile
+import time
+import timeit
+import tracemalloc
+from array import array
+import numpy as np
+sys.path.insert(0, sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from fakedb.filesystem.buf_manager import BufManager
+from fakedb.config import PAGE_SIZE
+try:
+    from fakedb.filesystem.page_table import PageTable
+except ImportError: # 旧版本还没有PageTable
+    PageTable = None
+
+
+CAPACITY = 16384
+SCAN_PAGES = 19 * 1024 * 1024 // PAGE_SIZE
+
+
+class DictPageTable:
+    '''原来的两个dict'''
+    def __init__(self, capacity):
+        self.fdpd_to_idx = {}
+        self.idx_to_fdpd = {}
+
+    def put(self, fd, pd, idx):
+        self.fdpd_to_idx.setdefault(fd, {})[pd] = idx
+        self.idx_to_fdpd[idx] = (fd, pd)
+
+    def remove(self, idx):
+        fd, pd = self.idx_to_fdpd.pop(idx)
+        pages = self.fdpd_to_idx[fd]
+        del pages[pd]
+        if not pages:
+            del self.fdpd_to_idx[fd]
+        return fd, pd
+
+    def get(self, fd, pd):
+        return self.fdpd_to_idx[fd][pd]
+
+    def lookup_many(self, fd, pds):
+        get = self.fdpd_to_idx.get(fd, {}).get
+        return np.array([get(pd, -1) for pd in np.asarray(pds).tolist()], dtype=np.int32)
+
+
+HASH_MULT = 0x9E3779B1 # 乘法哈希的常数(2^32 / 黄金分割比)
+FD_MULT = 0x85EBCA77 # 先把fd混进低32位, 否则不同文件的同一页号总是冲突
+BATCH_MIN = 2048 # 少于这么多页的批量查找逐个查dict更快
+EMPTY = -1
+
+
+class OpenAddressingPageTable:
+    '''
+    开放寻址的原型: 表的大小是缓存页数的2倍以上, 删除时后移同一探测链上的元素而不留墓碑
+    单页查找仍走每个文件一个的dict, 逐个探测数组在CPython中比两次dict查找慢
+    '''
+    def __init__(self, capacity):
+        bits = (capacity * 2 - 1).bit_length()
+        self.mask = (1 << bits) - 1
+        self.shift = 32 - bits
+        self.keys = array('q', [EMPTY]) * (1 << bits)
+        self.vals = array('i', [-1]) * (1 << bits)
+        self.keys_np = np.frombuffer(self.keys, dtype=np.int64)
+        self.vals_np = np.frombuffer(self.vals, dtype=np.int32)
+        self.idx_fd = array('i', [-1]) * capacity
+        self.idx_pd = array('i', [-1]) * capacity
+        self.fd_pages = {}
+
+    def _slot(self, key):
+        x = (key & 0xFFFFFFFF) ^ ((key >> 32) * FD_MULT)
+        return ((x * HASH_MULT) & 0xFFFFFFFF) >> self.shift
+
+    def get(self, fd, pd):
+        return self.fd_pages[fd][pd]
+
+    def put(self, fd, pd, idx):
+        self.fd_pages.setdefault(fd, {})[pd] = idx
+        self.idx_fd[idx] = fd
+        self.idx_pd[idx] = pd
+        key = fd << 32 | pd
+        slot = self._slot(key)
+        while self.keys[slot] != EMPTY:
+            slot = (slot + 1) & self.mask
+        self.keys[slot] = key
+        self.vals[slot] = idx
+
+    def remove(self, idx):
+        fd, pd = self.idx_fd[idx], self.idx_pd[idx]
+        pages = self.fd_pages[fd]
+        del pages[pd]
+        if not pages:
+            del self.fd_pages[fd]
+        self.idx_fd[idx] = -1
+        key = fd << 32 | pd
+        keys, vals, mask = self.keys, self.vals, self.mask
+        i = self._slot(key)
+        while keys[i] != key:
+            i = (i + 1) & mask
+        j = i
+        while True:
+            j = (j + 1) & mask
+            k = keys[j]
+            if k == EMPTY:
+                break
+            home = self._slot(k)
+            if (i < j and i < home <= j) or (i > j and (home > i or home <= j)):
+                continue # 起始槽在(i, j]中, 不能前移到i
+            keys[i] = k
+            vals[i] = vals[j]
+            i = j
+        keys[i] = EMPTY
+        vals[i] = -1
+        return fd, pd
+
+    def lookup_many(self, fd, pds):
+        pds = np.asarray(pds, dtype=np.int64)
+        if len(pds) < BATCH_MIN:
+            pages = self.fd_pages.get(fd, {})
+            return np.array([pages.get(pd, -1) for pd in pds.tolist()], dtype=np.int32)
+        keys = (np.int64(fd) << 32) | pds
+        x = (pds.astype(np.uint64) & np.uint64(0xFFFFFFFF)) ^ np.uint64((fd * FD_MULT) & 0xFFFFFFFF)
+        slots = (((x * np.uint64(HASH_MULT)) & np.uint64(0xFFFFFFFF)) >> np.uint64(self.shift)).astype(np.int64)
+        res = np.full(len(keys), -1, dtype=np.int32)
+        todo = np.arange(len(keys))
+        while len(todo):
+            found = self.keys_np[slots]
+            hit = found == keys[todo]
+            res[todo[hit]] = self.vals_np[slots[hit]]
+            more = ~hit & (found != EMPTY)
+            todo = todo[more]
+            slots = (slots[more] + 1) & self.mask
+        return res
+
+
+def best(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number
+
+
+def bench_table(name, cls):
+    rnd = random.Random(1)
+    keys = list(dict.fromkeys((rnd.randrange(3, 8), rnd.randrange(200000)) for _ in range(CAPACITY * 2)))[:CAPACITY]
+    tracemalloc.start()
+    table = cls(CAPACITY)
+    for idx, (fd, pd) in enumerate(keys):
+        table.put(fd, pd, idx)
+    memory = tracemalloc.get_traced_memory()[0] / 1024 / 1024
+    tracemalloc.stop()
+
+    queries = keys[:4000]
+    get = best(lambda: [table.get(fd, pd) for fd, pd in queries], 50) / len(queries) * 1e9
+
+    def churn():
+        for idx in range(CAPACITY):
+            fd, pd = table.remove(idx)
+            table.put(fd, pd, idx)
+    evict = best(churn, 3) / CAPACITY * 1e9
+    fd = keys[0][0]
+    batch = [best(lambda: table.lookup_many(fd, np.arange(n)), 20) * 1e6 for n in (64, 4096)]
+    print(f'{name:16s} {get:5.0f} ns  {evict:9.0f} ns  {batch[0]:6.0f} us  {batch[1]:7.0f} us  {memory:4.1f} MB')
+
+
+def bench_scan():
+    '''512页的缓存顺序读19MB的文件, 每页都缺页'''
+    fd, path = tempfile.mkstemp(prefix='fakedb_bench_')
+    os.ftruncate(fd, SCAN_PAGES * PAGE_SIZE)
+    buf_manager = BufManager('lru', 512, bg_writer=False)
+    times = []
+    for _ in range(20):
+        start = time.perf_counter()
+        for pd in range(SCAN_PAGES):
+            buf_manager.read(fd, pd)
+        times.append(time.perf_counter() - start)
+    buf_manager.close(fd)
+    os.close(fd)
+    os.remove(path)
+    print(f'scan {SCAN_PAGES} pages through a 512-page cache: {min(times):.3f}s')
+
+
+if __name__ == '__main__':
+    if PageTable is not None:
+        print(f'{CAPACITY} frames       get       evict+insert  batch 64  batch 4096  memory')
+        bench_table('dict + tuple', DictPageTable)
+        bench_table('PageTable', PageTable)
+        bench_table('open addressing', OpenAddressingPageTable)
+    bench_scan()
@@ -0,0 +1,64 @@
+'''
+替换策略的抗扫描能力: 点查和全表扫描交替时索引页的命中率
+每轮先做500次点查(索引根页 + 上两层各1页 + 表中随机1页), 再顺序扫描4000页的表
+用法: python bench/replacer_hit_rate.py [轮数 缓存页数 替换策略...]
+'''
+import os
+import sys
+import random
+import tempfile
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from fakedb.filesystem.buf_manager import BufManager, REPLACERS
+from fakedb.config import PAGE_SIZE
+
+
+TABLE_PAGES, INDEX_PAGES = 4000, 300
+LOOKUPS = 500 # 每轮的点查次数
+
+
+def make_file(path, page_num):
+    with open(path, 'wb') as f:
+        f.truncate(page_num * PAGE_SIZE)
+    return os.open(path, os.O_RDWR)
+
+
+def run(replacer, rounds, cache_size, data_dir):
+    buf_manager = BufManager(replacer, cache_size, bg_writer=False, partitions={}, cold_tier_size=0)
+    table_fd = make_file(os.path.join(data_dir, 'table'), TABLE_PAGES)
+    index_fd = make_file(os.path.join(data_dir, 'index'), INDEX_PAGES)
+    rnd = random.Random(0)
+    hits = total = 0
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for _ in range(LOOKUPS):
+            for pd in (0, rnd.randrange(1, 20), rnd.randrange(20, 200)):
+                total += 1
+                hits += pd in buf_manager.page_table.pages_of(index_fd)
+                buf_manager.read(index_fd, pd)
+            buf_manager.read(table_fd, rnd.randrange(1, TABLE_PAGES))
+        for pd in range(1, TABLE_PAGES):
+            buf_manager.read(table_fd, pd)
+    elapsed = time.perf_counter() - start
+    for fd in (table_fd, index_fd):
+        buf_manager.close(fd)
+        os.close(fd)
+    return hits / total, elapsed
+
+
+def main(rounds=20, cache_size=512, replacers=('lru', '2q', 'clock')):
+    data_dir = tempfile.mkdtemp(prefix='fakedb_bench_')
+    print(f'{cache_size} frames, {rounds} rounds of {LOOKUPS} point lookups + {TABLE_PAGES}-page scan')
+    for replacer in replacers:
+        hit_rate, elapsed = run(replacer, rounds, cache_size, data_dir)
+        print(f'{replacer:6s} index-page hit rate {hit_rate:.3f}  ({elapsed:.2f}s)')
+    for name in os.listdir(data_dir):
+        os.remove(os.path.join(data_dir, name))
+    os.rmdir(data_dir)
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    main(rounds=int(args[0]) if len(args) > 0 else 20,
+         cache_size=int(args[1]) if len(args) > 1 else 512,
+         replacers=args[2:] or list(REPLACERS))
@@ -0,0 +1,58 @@
+'''
+替换策略本身的开销: 16K缓存页, 100万次访问
+- 全部命中: 只调用access
+- 命中率约25%: 在4倍于缓存的页中随机访问, 缺页时assign并维护一个简单的页表dict
+用法: python bench/replacer_micro.py [访问次数 缓存页数 替换策略...]
+'''
+import os
+import sys
+import random
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from fakedb.filesystem.buf_manager import REPLACERS
+
+
+def all_hits(cls, n, size):
+    replacer = cls(size)
+    for _ in range(size):
+        idx, _ = replacer.assign()
+        replacer.access(idx)
+    rnd = random.Random(0)
+    order = [rnd.randrange(size) for _ in range(n)]
+    access = replacer.access
+    start = time.perf_counter()
+    for idx in order:
+        access(idx)
+    return time.perf_counter() - start
+
+
+def mixed(cls, n, size):
+    replacer = cls(size)
+    rnd = random.Random(0)
+    keys = [rnd.randrange(size * 4) for _ in range(n)]
+    key_idx, idx_key = {}, {}
+    start = time.perf_counter()
+    for key in keys:
+        idx = key_idx.get(key)
+        if idx is None:
+            idx, need_evict = replacer.assign(key)
+            if need_evict:
+                key_idx.pop(idx_key[idx])
+            key_idx[key] = idx
+            idx_key[idx] = key
+        replacer.access(idx)
+    return time.perf_counter() - start
+
+
+def main(n=1000000, size=16384, replacers=('lru', 'clock')):
+    print(f'{size} frames, {n} accesses')
+    for name in replacers:
+        cls = REPLACERS[name]
+        print(f'{name:6s} all hits {all_hits(cls, n, size):.2f}s  25% hits {mixed(cls, n, size):.2f}s')
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    main(n=int(args[0]) if len(args) > 0 else 1000000,
+         size=int(args[1]) if len(args) > 1 else 16384,
+         replacers=args[2:] or ('lru', 'clock'))
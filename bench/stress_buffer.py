@@ -0,0 +1,165 @@
+'''
+缓存池多线程压力测试
+- 更新线程: 各自改写第0个文件中的一部分页(write_page或独占fetch后直接修改), 记下每页的版本号
+- 扫描线程: 顺序fetch(触发预读)或随机读各文件的页, 偶尔批量预读, 检查页号和页内容没有错位或撕裂
+- 追加线程: 各自往一个文件末尾追加新页
+- 预热线程: 把随机的页读进还没用过的缓存页
+结束后关闭再重新打开, 检查每页都是最后写入的版本, 文件大小正确
+用法: python bench/stress_buffer.py [替换策略 缓存页数 后台写(0/1) 第二级缓存字节数 秒数]
+'''
+import os
+import sys
+import random
+import tempfile
+import threading
+import time
+import traceback
+import numpy as np
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from fakedb.filesystem import FileManager
+from fakedb.config import PAGE_SIZE
+
+
+N_UPDATERS, N_SCANNERS, N_INSERTERS = 4, 4, 3
+N_PAGES = 300 # 第0个文件的页数
+
+
+def make_page(fid, pd, version):
+    '''页头是(文件号, 页号, 版本号), 其余字节都是版本号的低8位'''
+    page = np.full(PAGE_SIZE, version & 0xFF, dtype=np.uint8)
+    page[:24] = np.array([fid, pd, version], dtype=np.int64).view(np.uint8)
+    return page
+
+
+def check_page(page, fid, pd):
+    '''页内容不对时返回错误信息'''
+    head = page[:24].view(np.int64)
+    if head[0] != fid or head[1] != pd:
+        return f'page {fid}.{pd} holds {head[0]}.{head[1]}'
+    if not (page[24:] == (int(head[2]) & 0xFF)).all():
+        return f'torn page {fid}.{pd} version {head[2]}'
+
+
+def main(replacer='2q', cache_size=64, bg_writer=True, cold_tier_size=0, seconds=4.0):
+    data_dir = tempfile.mkdtemp(prefix='fakedb_stress_')
+    names = [os.path.join(data_dir, f'f{i}') for i in range(1 + N_INSERTERS)]
+    for name in names:
+        open(name, 'wb').close()
+
+    fm = FileManager(replacer=replacer, cache_size=cache_size, bg_writer=bg_writer, cold_tier_size=cold_tier_size)
+    fds = [fm.open_file(name) for name in names]
+    for pd in range(N_PAGES):
+        fm.new_page(fds[0], make_page(0, pd, 0))
+    versions = [0] * N_PAGES
+    inserted = [0] * len(names) # 每个文件已追加完的页数
+    errors = []
+    ops = [0]
+    stop = time.time() + seconds
+
+    def updater(t):
+        rnd = random.Random(t)
+        mine = [pd for pd in range(N_PAGES) if pd % N_UPDATERS == t] # 每页只有一个线程改, 版本号不会乱
+        while time.time() < stop:
+            pd = rnd.choice(mine)
+            versions[pd] += 1
+            if rnd.random() < 0.5:
+                fm.write_page(fds[0], pd, make_page(0, pd, versions[pd]))
+            else: # 独占fetch后直接改缓存页
+                page = fm.fetch_page(fds[0], pd, exclusive=True)
+                page[:] = make_page(0, pd, versions[pd])
+                fm.unpin_page(fds[0], pd, dirty=True)
+            ops[0] += 1
+
+    def scanner(t):
+        rnd = random.Random(100 + t)
+        while time.time() < stop:
+            fid = rnd.randrange(len(fds))
+            n = N_PAGES if fid == 0 else inserted[fid]
+            if n == 0:
+                continue
+            if rnd.random() < 0.3: # 顺序扫描一段
+                start = rnd.randrange(n)
+                for pd in range(start, min(n, start + 100)):
+                    page = fm.fetch_page(fds[fid], pd)
+                    error = check_page(page, fid, pd) # fetch共享latch住了这一页, 不会读到写了一半的页
+                    fm.unpin_page(fds[fid], pd)
+                    if error:
+                        errors.append(error)
+            else:
+                pd = rnd.randrange(n)
+                error = check_page(fm.read_page(fds[fid], pd), fid, pd)
+                if error:
+                    errors.append(error)
+                if rnd.random() < 0.1:
+                    fm.prefetch_page_list(fds[fid], [rnd.randrange(n) for _ in range(16)])
+            ops[0] += 1
+
+    def inserter(t):
+        fid = 1 + t
+        while time.time() < stop:
+            pd = fm.new_page(fds[fid], make_page(fid, inserted[fid], 7))
+            if pd != inserted[fid]:
+                errors.append(f'new_page of file {fid} returned {pd}, expected {inserted[fid]}')
+            inserted[fid] += 1
+            ops[0] += 1
+
+    def warmer():
+        rnd = random.Random(200)
+        while time.time() < stop:
+            fid = rnd.randrange(len(fds))
+            n = N_PAGES if fid == 0 else inserted[fid]
+            if n > 0:
+                fm.file_buf[fds[fid]].warm(fds[fid], [rnd.randrange(n) for _ in range(32)])
+            time.sleep(0.001)
+
+    def guard(target):
+        def run(*args):
+            try:
+                target(*args)
+            except Exception:
+                errors.append(traceback.format_exc())
+        return run
+
+    threads = [threading.Thread(target=guard(updater), args=(t,)) for t in range(N_UPDATERS)] + \
+              [threading.Thread(target=guard(scanner), args=(t,)) for t in range(N_SCANNERS)] + \
+              [threading.Thread(target=guard(inserter), args=(t,)) for t in range(N_INSERTERS)] + \
+              [threading.Thread(target=guard(warmer))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    fm.shutdown()
+
+    fm = FileManager(replacer=replacer, cache_size=cache_size)
+    for fid, name in enumerate(names):
+        fd = fm.open_file(name)
+        n = N_PAGES if fid == 0 else inserted[fid]
+        if os.path.getsize(name) != n * PAGE_SIZE:
+            errors.append(f'{name} has {os.path.getsize(name)} bytes, expected {n * PAGE_SIZE}')
+        for pd in range(n):
+            page = fm.read_page(fd, pd)
+            error = check_page(page, fid, pd)
+            if error:
+                errors.append('after reopen: ' + error)
+            elif fid == 0 and page[:24].view(np.int64)[2] != versions[pd]:
+                errors.append(f'lost update of page {pd}: version {page[:24].view(np.int64)[2]}, expected {versions[pd]}')
+    fm.shutdown()
+    for name in names:
+        os.remove(name)
+    os.rmdir(data_dir)
+
+    print(f'{replacer} cache={cache_size} bg_writer={bg_writer} cold_tier={cold_tier_size}: '
+          f'ops {ops[0]} inserted {inserted[1:]} errors {len(errors)}')
+    for error in errors[:5]:
+        print(error)
+    return not errors
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    ok = main(replacer=args[0] if len(args) > 0 else '2q',
+              cache_size=int(args[1]) if len(args) > 1 else 64,
+              bg_writer=args[2] != '0' if len(args) > 2 else True,
+              cold_tier_size=int(args[3]) if len(args) > 3 else 0,
+              seconds=float(args[4]) if len(args) > 4 else 4.0)
+    sys.exit(0 if ok else 1)
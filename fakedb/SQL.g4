@@ -41,6 +41,8 @@ db_statement
     | 'USE' Identifier                  # use_db                  
     | 'SHOW' 'TABLES'                   # show_tables
 	| 'SHOW' 'INDEXES'					# show_indexes
+    | 'SHOW' 'BUFFER' 'STATUS'          # show_buffer_status
+    | 'RESET' 'BUFFER' 'STATUS'         # reset_buffer_status
     ;
 
 io_statement
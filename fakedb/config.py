@@ -3,15 +3,71 @@
 '''
 
 
+import os
+
+
 PAGE_SIZE = 8192 # 采用文档中的设定, 每页8192字节
 PAGE_SIZE_BITS = 13 # 8192字节为13位
+MAX_PAGE_SIZE = 65536 # 单独设定的页大小须为2的幂, 在PAGE_SIZE和MAX_PAGE_SIZE之间
+# 单独设定页大小的数据库, 其中新建的表和索引文件用这个页大小, 页大小记在文件头中, 之后打开文件时以文件头为准
+# 如FAKEDB_PAGE_SIZES=tpch:32768, 扫描为主的大表用大页可以减少每页的开销
+PAGE_SIZES = {db: int(size) for db, size in
+              (item.split(':') for item in filter(None, os.environ.get('FAKEDB_PAGE_SIZES', '').split(',')))}
+
+# 缓存最多的页数, 可用环境变量FAKEDB_CACHE_SIZE覆盖
+# 其他页大小的文件各用一个缓存池, 字节数和默认页大小的缓存池相同
+CACHE_SIZE = int(os.environ.get('FAKEDB_CACHE_SIZE', 1024 * 16)) # 采用文档中的设定, 缓存有16k页
+CACHE_CHUNK_SIZE = 256 # 缓存页按块分配, 每块256个默认大小的页(2MB)
+# 缓存页替换策略: 'lru', '2q'(抗扫描) 或 'clock', 可用环境变量FAKEDB_REPLACER覆盖
+REPLACER = os.environ.get('FAKEDB_REPLACER', 'lru')
+READ_AHEAD_SIZE = 64 # 顺序扫描时每次预读的页数(512KB)
+LATCH_STRIPES = 64 # 缓存池中按(fd, pd)分条的锁的个数, 缺页的线程持有一条直到读完
+
+# 缓存分区, 分区名 -> 页数, 剩下的页属于default分区; 如FAKEDB_BUFFER_PARTITIONS=hot:1024,index:4096
+BUFFER_PARTITIONS = {name: int(size) for name, size in
+                     (item.split(':') for item in filter(None, os.environ.get('FAKEDB_BUFFER_PARTITIONS', '').split(',')))}
+# 文件分到哪个分区, 按ROOT_DIR下的相对路径通配, 先匹配的优先, 都不匹配的用default分区
+# 如FAKEDB_BUFFER_PARTITION_FILES=tpch/nation.table:hot,tpch/*.index:index
+BUFFER_PARTITION_FILES = [tuple(item.rsplit(':', 1)) for item in
+                          filter(None, os.environ.get('FAKEDB_BUFFER_PARTITION_FILES', '').split(','))]
+
+# 文件后端: 'buffer'(经过BufManager) 或 'mmap'(内存映射, 由内核页缓存代替BufManager)
+FILE_BACKEND = os.environ.get('FAKEDB_FILE_BACKEND', 'buffer')
+# 单独使用mmap的数据库, 逗号分隔, 如FAKEDB_MMAP_DATABASES=tpch,test
+MMAP_DATABASES = set(filter(None, os.environ.get('FAKEDB_MMAP_DATABASES', '').split(',')))
+MMAP_GROW_SIZE = 1024 # 内存映射文件每次至少扩展的页数(8MB)
+
+# 后台写线程: 提前写回将被换出的脏页, 使换出时不必同步写盘; 用环境变量FAKEDB_BG_WRITER=1开启
+BG_WRITER = os.environ.get('FAKEDB_BG_WRITER', '0') == '1'
+BG_WRITER_INTERVAL = 0.05 # 后台写线程两轮之间的间隔(秒)
+BG_WRITER_BATCH = 64 # 后台写线程每轮检查的将被换出的页数
 
-CACHE_SIZE = 1024 * 16 # 采用文档中的设定, 缓存有60k页
+# 压缩的第二级缓存: 换出的干净页压缩后留在内存中的字节数上限, 0表示不开启; 如FAKEDB_COLD_TIER_SIZE=67108864
+COLD_TIER_SIZE = int(os.environ.get('FAKEDB_COLD_TIER_SIZE', 0))
+COLD_TIER_LEVEL = 1 # zlib压缩级别, 换出时同步压缩, 用最快的一级
 
-NEXT_AVAILABLE_PAGE_OFFSET = 0 # 每一页中记录下个空闲页的id
+# 预热: 退出时记下每个数据库在缓存中的页, 重启后第一次use该数据库时在后台读回来; 用环境变量FAKEDB_WARM_RESTART=1开启
+WARM_RESTART = os.environ.get('FAKEDB_WARM_RESTART', '0') == '1'
+WARM_BATCH = 64 # 预热线程每次读入的页数
+
+NEXT_AVAILABLE_PAGE_OFFSET = 0 # 每一页中记录下个空闲页的id, 版本3起数据页不再使用, FSM页用来记录下一个FSM页
 NEXT_AVAILABLE_PAGE_SIZE = 4 # 每一页中花几个字节记录下个空闲页的id
 
-BITMAP_START_OFFSET = 4 # bitmap的起始字节数
+FSM_ENTRY_OFFSET = 8 # FSM页中各页的空闲槽数的起始字节数
+
+# 版本2起每页在bitmap前记录[空闲槽数, 第一个空闲槽的下界], 各为2字节大端整数, 插入时不必解开整个bitmap
+SLOT_HINT_OFFSET = 4
+
+BITMAP_START_OFFSET = 4 # 版本1的bitmap起始字节数
+HINTED_BITMAP_START_OFFSET = 8 # 版本2起的bitmap起始字节数
+
+# 索引文件第0页是文件头: [INDEX_HEADER_MAGIC, 空闲页链表头], 没有这个标记的旧索引文件不回收空闲页
+INDEX_HEADER_MAGIC = int.from_bytes(b'FDBINDEX', 'little')
+
+# 表文件第0页是文件头: [TABLE_HEADER_MAGIC, 版本, 各字段], 都是int64; 没有这个标记的旧表文件头是JSON
+# 版本1: 页中只有下个空闲页和bitmap; 版本2: 页中还有空闲槽数和第一个空闲槽; 版本3: 用FSM页记录各页的空闲槽数
+TABLE_HEADER_MAGIC = int.from_bytes(b'FDBTABLE', 'little')
+TABLE_HEADER_VERSION = 3
 
 NULL_VALUE = -1e10
 
@@ -19,6 +75,7 @@ NULL_VALUE = -1e10
 TABLE_SUFFIX = '.table' # 表文件后缀
 INDEX_SUFFIX = '.index' # 索引文件后缀
 META_SUFFIX = '.meta'
+WARM_PAGES_FILE = 'warm_pages.json' # 数据库目录下记录退出时缓存中的页的文件
 
 # 存储路径
 ROOT_DIR = 'log'
\ No newline at end of file
@@ -1 +1,2 @@
-from .file_manager import FileManager
\ No newline at end of file
+from .file_manager import FileManager
+from .io_stats import IOStats
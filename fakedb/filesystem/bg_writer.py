@@ -0,0 +1,25 @@
+import threading
+
+
+class BgWriter(threading.Thread):
+    '''
+    后台写线程
+    每隔interval秒把替换策略接下来要换出的batch页中的脏页写回存储,
+    这样前台换出时大多是干净页, 缺页不必等一次同步写
+    '''
+    def __init__(self, buf_manager, interval, batch):
+        super().__init__(name='fakedb-bg-writer', daemon=True)
+        self.buf_manager = buf_manager
+        self.interval = interval
+        self.batch = batch
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            # 一轮写满了说明脏页多, 不等间隔继续写
+            while not self.stopped.is_set() and self.buf_manager.clean_victims(self.batch) == self.batch:
+                pass
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
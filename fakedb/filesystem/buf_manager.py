@@ -1,101 +1,598 @@
 import os
+import threading
+import time
 import numpy as np
-from ..config import CACHE_SIZE, PAGE_SIZE, PAGE_SIZE_BITS
+from ..config import CACHE_SIZE, CACHE_CHUNK_SIZE, PAGE_SIZE, REPLACER, READ_AHEAD_SIZE, \
+    BG_WRITER, BG_WRITER_INTERVAL, BG_WRITER_BATCH, BUFFER_PARTITIONS, COLD_TIER_SIZE, LATCH_STRIPES
 from .lru import LRU
+from .twoq import TwoQueue
+from .clock import Clock
+from .bg_writer import BgWriter
+from .io_stats import IOStats
+from .partition import PartitionedReplacer
+from .page_table import PageTable
+from .cold_tier import ColdTier
+from .frame_latch import FrameLatches
+
+
+# 一次pwritev最多的缓冲区数
+try:
+    IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    IOV_MAX = 1024
+
+
+# 可选的页替换策略
+REPLACERS = {
+    'lru': LRU,
+    '2q': TwoQueue,
+    'clock': Clock,
+}
 
 
 class BufManager:
-    def __init__(self):
-        self.pages = np.zeros((CACHE_SIZE, PAGE_SIZE), dtype=np.uint8)
-        self.fdpd_to_idx = {}
-        self.idx_to_fdpd = {}
-        self.lru = LRU(CACHE_SIZE)
+    '''
+    缓存池, 可以被多个线程同时使用
+    - latch: 保护页表, 替换策略, 脏页位和统计等状态
+      读盘(缺页, 预读, 预热)都先在latch下分配pin住的缓存页并记在loading中, 放开latch读盘, 读完才放进页表;
+      写盘不是这样: 换出脏页时的同步写回和flush仍在持有latch时pwrite, 只有后台写线程复制后放开latch写盘
+    - stripes: 按(fd, pd)分条的锁, 缺页时持有直到读完, 同一页只有一个线程读盘, 不同的页可以同时读
+      预读不持有stripe, 缺页或写入时遇到loading中的页要等它读完
+    - frame_latches: 每个缓存页一个读写latch, 读盘, 复制和fetch的调用者读写缓存页内容时持有
+      fetch按调用者的用途共享或独占地latch住这一页, 一直持有到unpin
+    持有frame latch的线程总是pin住了这一页, 替换策略不会换出被pin的页, 所以也不会换出被latch住的页
+    加锁顺序为 stripe -> latch -> frame latch, 但只有刚分配的缓存页才在持有latch时拿frame latch(一定拿得到);
+    已在页表中的页可能被fetch长时间latch住, 要放开stripe和latch之后再等
+    flush写盘时不拿frame latch, 关闭文件和退出时不应还有fetch的页没有unpin
+    '''
+    def __init__(self, replacer=REPLACER, cache_size=CACHE_SIZE, bg_writer=BG_WRITER, partitions=BUFFER_PARTITIONS,
+                 cold_tier_size=COLD_TIER_SIZE, page_size=PAGE_SIZE):
+        if replacer not in REPLACERS:
+            raise Exception(f'unknown replacer {replacer}, expected one of {list(REPLACERS)}')
+        self.cache_size = cache_size
+        self.page_size = page_size # 这个缓存池中每页的字节数, 为2的幂
+        self.page_size_bits = page_size.bit_length() - 1
+        # 缓存页按块懒分配, 第一次用到某块中的页时才分配该块; 每块的字节数和页大小无关
+        self.chunk_size = max(1, CACHE_CHUNK_SIZE * PAGE_SIZE // page_size)
+        self.chunks = [None] * ((cache_size + self.chunk_size - 1) // self.chunk_size)
+        self.dirty = np.zeros(cache_size, dtype=np.bool_) # 每个缓存页是否被修改过
+        self.page_table = PageTable(cache_size) # (fd, pd) <-> 缓存页号
+        if partitions:
+            self.replacer = PartitionedReplacer(REPLACERS[replacer], cache_size, partitions)
+            self.partitions = self.replacer.partitions # 分区名 -> Partition
+        else:
+            self.replacer = REPLACERS[replacer](cache_size)
+            self.partitions = None
+        self.cold_tier = ColdTier(cold_tier_size, page_size) if cold_tier_size > 0 else None # 换出的干净页压缩后留在这里
+        self.seq_next = {} # fd -> 顺序读时下一个预期缺页的页号, 用于检测顺序读
+        self.page_num = {} # fd -> 文件的页数, 包括还只在cache中的新页
+
+        # 保护页表, 替换策略和脏页位; 后台写线程在写盘时, 缺页, 预读和预热在读盘时不持有它
+        self.latch = threading.RLock()
+        self.stripes = [threading.Lock() for _ in range(LATCH_STRIPES)]
+        self.frame_latches = FrameLatches(cache_size)
+        self.writing = {} # (fd, pd) -> 后台写线程正在写盘的页的副本
+        self.loading = {} # (fd, pd) -> 正在读盘的缓存页, 读完后才放进页表
+        self.writing_done = threading.Condition(self.latch) # 写盘或读盘完成时通知
+
+        self.stats = {} # fd -> IOStats
+        self.dirty_evict_count = 0 # 换出时需要同步写回的页数
+        self.bg_flush_count = 0 # 后台写线程写回的页数
+
+        self.bg_writer = None
+        if bg_writer:
+            self.bg_writer = BgWriter(self, BG_WRITER_INTERVAL, BG_WRITER_BATCH)
+            self.bg_writer.start()
+
+    def _page(self, idx):
+        '''返回缓存页idx的视图'''
+        chunk = self.chunks[idx // self.chunk_size]
+        if chunk is None:
+            chunk = np.zeros((self.chunk_size, self.page_size), dtype=np.uint8)
+            self.chunks[idx // self.chunk_size] = chunk
+        return chunk[idx % self.chunk_size]
+
+    def allocated_pages(self):
+        '''已分配内存的缓存页数'''
+        return sum(self.chunk_size for chunk in self.chunks if chunk is not None)
 
     def close(self, fd):
         '''
         关闭一个文件, 更新cache
         fd: file descsriptor
+        return: 实际写回存储的页数
+        '''
+        with self.latch:
+            while any(_fd == fd for _fd, _ in self.loading):
+                self.writing_done.wait()
+            written = self.flush(fd)
+            self.seq_next.pop(fd, None)
+            self.page_num.pop(fd, None)
+            if self.partitions is not None:
+                self.replacer.remove_fd(fd)
+            if self.cold_tier is not None:
+                self.cold_tier.drop_file(fd)
+            for idx in list(self.page_table.pages_of(fd).values()):
+                self.replacer.free(idx)
+                self.page_table.remove(idx)
+            return written
+
+    def set_partition(self, fd, name):
+        '''把文件分到缓存分区name, 文件的页只会换出同一分区中的页'''
+        if self.partitions is None:
+            raise Exception(f'buffer partition {name} is not configured')
+        with self.latch:
+            self.replacer.set_partition(fd, name)
+
+    def _unused(self, fd):
+        '''文件所在缓存分区中还没有用过的缓存页数'''
+        replacer = self.replacer if self.partitions is None else self.replacer.partition_of(fd).replacer
+        return len(replacer.unused)
+
+    def _capacity(self, fd):
+        '''文件可用的缓存页数'''
+        if self.partitions is None:
+            return self.cache_size
+        return self.replacer.partition_of(fd).size
+
+    def shutdown(self):
+        '''停止后台写线程'''
+        if self.bg_writer is not None:
+            self.bg_writer.stop()
+            self.bg_writer = None
+
+    def flush(self, fd):
         '''
-        if fd in self.fdpd_to_idx:
-            d = self.fdpd_to_idx[fd]
-            for pd, idx in d.items():
-                self.lru.free(idx)
-                self._write(fd, pd, idx)
-                self.idx_to_fdpd.pop(idx)
-            self.fdpd_to_idx.pop(fd)
+        把一个文件的脏页写回存储, 页仍留在cache中
+        脏页按页号排序, 相邻的页合并成一次pwritev
+        return: 实际写回存储的页数
+        '''
+        with self.latch:
+            self._wait_writing(fd)
+            dirty_pages = sorted((pd, idx) for pd, idx in self.page_table.pages_of(fd).items() if self.dirty[idx])
+            start = 0
+            for i in range(1, len(dirty_pages) + 1):
+                if i == len(dirty_pages) or dirty_pages[i][0] != dirty_pages[i - 1][0] + 1 or i - start == IOV_MAX:
+                    self._writev(fd, dirty_pages[start][0], [idx for _, idx in dirty_pages[start:i]])
+                    start = i
+            return len(dirty_pages)
+
+    def _stats(self, fd):
+        stats = self.stats.get(fd)
+        if stats is None:
+            stats = self.stats[fd] = IOStats()
+        return stats
+
+    def pop_stats(self, fd):
+        '''取出并清空一个文件的统计, 文件关闭后fd可能被复用'''
+        with self.latch:
+            return self.stats.pop(fd, None)
+
+    def reset_stats(self):
+        with self.latch:
+            self.stats = {}
+            self.dirty_evict_count = 0
+            self.bg_flush_count = 0
+
+    def dirty_pages(self):
+        return int(self.dirty.sum())
+
+    def _page_num(self, fd):
+        '''文件的页数: 存储中的页数和cache中最大页号+1的较大者'''
+        if fd not in self.page_num:
+            n = (os.fstat(fd).st_size + self.page_size - 1) >> self.page_size_bits
+            self.page_num[fd] = max([n] + [pd + 1 for pd in self.page_table.pages_of(fd)])
+        return self.page_num[fd]
+
+    def _wait_writing(self, fd, pd=None):
+        '''
+        等后台写线程写完文件fd(pd不为None时只看这一页)正在写的页
+        避免旧版本的页在新版本之后落盘
+        '''
+        while any(_fd == fd and (pd is None or _pd == pd) for _fd, _pd in self.writing):
+            self.writing_done.wait()
+
+    def clean_victims(self, n):
+        '''
+        后台写线程调用: 把替换策略接下来要换出的n页中的脏页提前写回
+        持有latch时只复制页, 写盘时不持有, 不阻塞前台的读写
+        return: 写回的页数
+        '''
+        jobs = []
+        with self.latch:
+            for idx in self.replacer.victims(n):
+                if not self.dirty[idx]:
+                    continue
+                fd, pd = self.page_table.key_of(idx)
+                if (fd, pd) in self.writing:
+                    continue
+                data = self._page(idx).copy()
+                self.writing[(fd, pd)] = data
+                self.dirty[idx] = False
+                jobs.append((fd, pd, data))
+        io_time = {} # fd -> 写盘时间
+        try:
+            for fd, pd, data in sorted(jobs, key=lambda job: job[:2]):
+                start = time.perf_counter()
+                os.pwrite(fd, data, pd << self.page_size_bits)
+                io_time[fd] = io_time.get(fd, 0) + time.perf_counter() - start
+        finally:
+            with self.latch:
+                for fd, pd, _ in jobs:
+                    self.writing.pop((fd, pd))
+                    stats = self._stats(fd)
+                    stats.dirty_writebacks += 1
+                    stats.bytes_written += self.page_size
+                for fd, t in io_time.items():
+                    self._stats(fd).io_time += t
+                self.bg_flush_count += len(jobs)
+                self.writing_done.notify_all()
+        return len(jobs)
 
     def _write(self, fd, pd, idx):
         '''
         写到存储中 不直接调用
         '''
-        # if pd == 0:
-        #     print(fd, self.pages[idx])
-        os.lseek(fd, pd << PAGE_SIZE_BITS, os.SEEK_SET)
-        os.write(fd, self.pages[idx].tobytes())
-        
-    def _read(self, fd, pd):
-        os.lseek(fd, pd << PAGE_SIZE_BITS, 0) # 设置偏移量
-        return os.read(fd, PAGE_SIZE) # 读一页数据, 返回
+        start = time.perf_counter()
+        os.pwrite(fd, self._page(idx), pd << self.page_size_bits) # 直接从缓存页的内存写出, 不经过bytes
+        stats = self._stats(fd)
+        stats.io_time += time.perf_counter() - start
+        stats.dirty_writebacks += 1
+        stats.bytes_written += self.page_size
+        self.dirty[idx] = False
 
-    def write(self, fd, pd, data):
+    def _writev(self, fd, pd, idxs):
         '''
-        写文件, 写到cache中
+        把缓存页idxs写到从pd开始的连续页上, 一次系统调用
         '''
-        if fd not in self.fdpd_to_idx:
-            self.fdpd_to_idx[fd] = {}
-        if pd not in self.fdpd_to_idx[fd]:
-            idx, need_write_back = self.lru.assign()
-            if need_write_back:
-                # print(f'in write need write back, fd:{fd}, pd:{pd}, idx:{idx}, _fd and _pd:{self.idx_to_fdpd[idx]}')
-                _fd, _pd = self.idx_to_fdpd[idx]
+        if len(idxs) == 1:
+            return self._write(fd, pd, idxs[0])
+        start = time.perf_counter()
+        os.pwritev(fd, [self._page(idx) for idx in idxs], pd << self.page_size_bits)
+        stats = self._stats(fd)
+        stats.io_time += time.perf_counter() - start
+        stats.dirty_writebacks += len(idxs)
+        stats.bytes_written += len(idxs) * self.page_size
+        self.dirty[idxs] = False
+
+    def _fill_writing(self, fd, pd, page):
+        '''后台写线程还没写完的页, 以它的副本为准'''
+        if self.writing:
+            data = self.writing.get((fd, pd))
+            if data is not None:
+                page[:] = data
+
+    def _wait_redirtied(self):
+        '''
+        持有latch时调用: 等后台写线程写完它正在写而又被改脏的页
+        这样的页被换出时要同步写回, 不能让旧副本后落盘; 等待时会放开latch,
+        所以在分配缓存页之前等, 同一次持有latch期间的_assign都不必再等
+        '''
+        while any(self.dirty[idx] for idx in (self.page_table.pages_of(fd).get(pd) for fd, pd in self.writing)
+                  if idx is not None):
+            self.writing_done.wait()
+
+    def _assign(self, fd, pd, publish=True):
+        '''
+        为(fd, pd)分配一个缓存页, 必要时换出一页
+        只有脏页才需要写回, 写回后的页和干净页一样放进压缩的第二级缓存
+        publish: 是否马上放进页表, 放开latch读盘的页读完才放进去
+        '''
+        idx, need_evict = self.replacer.assign((fd, pd))
+        if need_evict:
+            _fd, _pd = self.page_table.key_of(idx)
+            self._stats(_fd).evictions += 1
+            if self.dirty[idx]:
                 self._write(_fd, _pd, idx)
-                self.fdpd_to_idx[_fd].pop(_pd)
-                if not self.fdpd_to_idx[_fd]:
-                    self.fdpd_to_idx.pop(_fd)
+                self.dirty_evict_count += 1
+            if self.cold_tier is not None:
+                self.cold_tier.put(_fd, _pd, self._page(idx))
+            self.page_table.remove(idx)
 
-            self.fdpd_to_idx[fd][pd] = idx
-        idx = self.fdpd_to_idx[fd][pd]
-        self.lru.access(idx)
-        self.pages[idx] = data
-        self.idx_to_fdpd[idx] = (fd, pd)
+        if self.cold_tier is not None:
+            self.cold_tier.discard(fd, pd) # 页回到主缓存, 之后以主缓存中的为准
+        if publish:
+            self.page_table.put(fd, pd, idx)
+        return idx
+
+    def _stripe(self, fd, pd):
+        return self.stripes[hash((fd, pd)) % len(self.stripes)]
+
+    def write(self, fd, pd, data):
+        '''
+        写文件, 写到cache中, 标记为脏页
+        '''
+        with self._stripe(fd, pd): # 其他线程正在读入这一页时, 等它读完
+            with self.latch:
+                self._wait_loading(fd, pd) # 预读不持有stripe, 要另外等
+                idx = self.page_table.pages_of(fd).get(pd)
+                latched = idx is None
+                if latched: # 新分配的缓存页放进页表之前先latch住, 其他线程等写完才能读到
+                    idx = self._assign(fd, pd)
+                    self.frame_latches.acquire(idx, exclusive=True)
+                self.replacer.access(idx)
+                self.replacer.pin(idx)
+                if pd >= self._page_num(fd):
+                    self.page_num[fd] = pd + 1
+        try:
+            if not latched: # 其他线程可能fetch了这一页, 等它unpin
+                self.frame_latches.acquire(idx, exclusive=True)
+            try:
+                self._page(idx)[:] = data
+            finally:
+                self.frame_latches.release(idx)
+        finally:
+            with self.latch:
+                self.dirty[idx] = True
+                self.replacer.unpin(idx)
+
+    def new_page(self, fd, data):
+        '''
+        在文件末尾追加一页, 只写到cache中作为脏页, 换出或flush时才写到存储
+        return: 新页的页号
+        '''
+        with self.latch: # 先占住页号; 写入时要先拿stripe, 不能持有latch
+            pd = self._page_num(fd)
+            self.page_num[fd] = pd + 1
+        self.write(fd, pd, data)
+        return pd
+
+    def _pin_cached(self, fd, pd):
+        '''持有latch时调用: 页在cache中时pin住并返回缓存页号, 否则返回None'''
+        idx = self.page_table.pages_of(fd).get(pd)
+        if idx is not None:
+            self._stats(fd).hits += 1
+            self.replacer.access(idx)
+            self.replacer.pin(idx)
+        return idx
+
+    def _wait_loading(self, fd, pd):
+        '''
+        持有latch时调用: 等其他线程(预读)把(fd, pd)读完放进页表, 返回时同时满足_wait_redirtied
+        调用者持有这一页的stripe, 返回后到放开latch之前不会再有线程开始读这一页
+        '''
+        while True:
+            self._wait_redirtied()
+            if (fd, pd) not in self.loading:
+                return
+            self.writing_done.wait()
+
+    def _load(self, fd, pd):
+        '''
+        返回(fd, pd)所在的缓存页号, 返回时这一页已被pin住
+        - 命中时只持有latch
+        - 缺页时持有这一页的stripe: 顺序读时先放开latch预读一个窗口, 再查压缩的第二级缓存,
+          否则分配一个pin住的缓存页, 放开latch读盘, 读完才放进页表
+        '''
+        with self.latch:
+            idx = self._pin_cached(fd, pd)
+        if idx is not None:
+            return idx
+        with self._stripe(fd, pd):
+            with self.latch:
+                self._wait_loading(fd, pd)
+                idx = self._pin_cached(fd, pd) # 等stripe时可能已被其他线程读入
+                if idx is not None:
+                    return idx
+                self._stats(fd).misses += 1
+                read_ahead = self.seq_next.get(fd) == pd
+            if read_ahead: # 顺序读, 预读一个窗口, 读盘时不持有latch
+                self.prefetch(fd, pd, READ_AHEAD_SIZE)
+            with self.latch:
+                self._wait_loading(fd, pd) # 放开latch期间其他线程的预读可能读入了这一页
+                page = None # 需要读盘时为分配到的缓存页
+                idx = self.page_table.pages_of(fd).get(pd)
+                if idx is not None: # 预读进来的页, 可能已被其他线程修改, 不清脏页位
+                    self.replacer.access(idx)
+                    self.replacer.pin(idx)
+                    return idx
+                cold = self.cold_tier.pop(fd, pd) if self.cold_tier is not None else None
+                if cold is not None:
+                    idx = self._assign(fd, pd)
+                    self._page(idx)[:] = np.frombuffer(cold, dtype=np.uint8)
+                    self._stats(fd).cold_hits += 1
+                elif (fd, pd) in self.writing: # 后台写线程还没写完的页, 以它的副本为准
+                    idx = self._assign(fd, pd)
+                    self._page(idx)[:] = self.writing[(fd, pd)]
+                else: # 2Q中预读窗口的第一页可能被同一窗口换出, 这时单独读
+                    idx = self._assign(fd, pd, publish=False)
+                    self.loading[(fd, pd)] = idx
+                    self.seq_next[fd] = pd + 1
+                    page = self._page(idx) # 在latch下分配缓存页所在的块
+                self.dirty[idx] = False
+                self.replacer.access(idx)
+                self.replacer.pin(idx)
+                if page is None:
+                    return idx
+
+            try:
+                self.frame_latches.acquire(idx, exclusive=True)
+                try:
+                    start = time.perf_counter()
+                    nbytes = os.preadv(fd, [page], pd << self.page_size_bits) # 带偏移量的读, 不改变文件指针
+                    io_time = time.perf_counter() - start
+                    if nbytes < self.page_size:
+                        page[nbytes:] = 0
+                finally:
+                    self.frame_latches.release(idx)
+            except BaseException:
+                with self.latch:
+                    self.loading.pop((fd, pd))
+                    self.replacer.unpin(idx)
+                    self.replacer.free(idx)
+                    self.writing_done.notify_all()
+                raise
+            with self.latch:
+                self.loading.pop((fd, pd))
+                self.page_table.put(fd, pd, idx)
+                stats = self._stats(fd)
+                stats.io_time += io_time
+                stats.bytes_read += nbytes
+                self.writing_done.notify_all()
+            return idx
 
     def read(self, fd, pd):
         '''
-        读
-        - 读cache
-        - 不在cache中的话就读存储, 放到cache
-        '''
-        try: # 读cache
-            # print(f'fd:{fd}, pd:{pd}, fdpdtoidx:{self.fdpd_to_idx}')
-            idx = self.fdpd_to_idx[fd][pd]
-            data = self.pages[idx]
-            # print(f'read from cache idx:{idx}')
-        except: # 读存储 放回cache
-            idx, need_write_back = self.lru.assign()
-            # print(f'assign cache idx:{idx}')
-            # print(f'pd:{pd}, idx:{idx}')
-            # if need_write_back is True:
-            #     print(f'pd:{pd}, idx:{idx}')
-            # assert need_write_back is False
-            if need_write_back:
-                _fd, _pd = self.idx_to_fdpd[idx]
-                self._write(_fd, _pd, idx)
-                self.fdpd_to_idx[_fd].pop(_pd)
-                if not self.fdpd_to_idx[_fd]:
-                    self.fdpd_to_idx.pop(_fd)
-
-            if fd not in self.fdpd_to_idx:
-                self.fdpd_to_idx[fd] = {}
-            self.fdpd_to_idx[fd][pd] = idx
-
-            data = self._read(fd, pd)
-            # print(f'data:{data}')
-            # if pd == 1:
-            #     print(f'fd: {fd}, pd:{pd}, read data:{data}')
-            data = np.frombuffer(data, np.uint8, PAGE_SIZE).copy()
-            # print(f'after frombuffer data:{data}')
-            self.pages[idx] = data
-
-        self.idx_to_fdpd[idx] = (fd, pd)
-        self.lru.access(idx)
-        return data
\ No newline at end of file
+        读, 返回页的副本
+        不返回缓存页本身: 其他线程随时可能换出或修改没有pin住的缓存页
+        '''
+        idx = self._load(fd, pd)
+        try:
+            self.frame_latches.acquire(idx)
+            try:
+                return self._page(idx).copy()
+            finally:
+                self.frame_latches.release(idx)
+        finally:
+            with self.latch:
+                self.replacer.unpin(idx)
+
+    def fetch(self, fd, pd, exclusive=False):
+        '''
+        读一页并pin住, 返回缓存页的视图
+        unpin之前这个缓存页不会被换出或复用, 一直latch住: exclusive为True时独占, 调用者可以直接修改,
+        否则和其他读者共享, 调用者只能读
+        '''
+        idx = self._load(fd, pd)
+        try:
+            self.frame_latches.acquire(idx, exclusive)
+        except BaseException:
+            with self.latch:
+                self.replacer.unpin(idx)
+            raise
+        return self._page(idx)
+
+    def unpin(self, fd, pd, dirty=False):
+        '''
+        释放fetch的latch和pin
+        dirty: 调用者是否修改了这一页
+        '''
+        with self.latch:
+            idx = self.page_table.get(fd, pd)
+            if dirty:
+                self.dirty[idx] = True
+            self.frame_latches.release(idx)
+            self.replacer.unpin(idx)
+
+    def prefetch(self, fd, pd, n):
+        '''
+        预读从pd开始的n页(不超过文件末尾和文件所在缓存分区的1/4)
+        不在cache中的连续页合并成一次preadv直接读进缓存页, 调用时不能持有latch
+        return: 实际读入的页数
+        '''
+        with self.latch:
+            self._wait_redirtied()
+            n = min(n, max(1, self._capacity(fd) // 4), self._page_num(fd) - pd)
+            if n <= 0:
+                return 0
+            runs = self._reserve_missing(fd, np.arange(pd, pd + n))
+            self.seq_next[fd] = pd + n
+        return self._read_runs(fd, runs)
+
+    def prefetch_list(self, fd, pds):
+        '''
+        预读文件中不一定连续的多页, 如B+树节点的所有子节点
+        页号排序去重后, 相邻的缺页合并成一次preadv
+        return: 实际读入的页数
+        '''
+        with self.latch:
+            self._wait_redirtied()
+            pds = np.unique(np.asarray(pds, dtype=np.int64))
+            pds = pds[(pds >= 0) & (pds < self._page_num(fd))][:max(1, self._capacity(fd) // 4)]
+            runs = self._reserve_missing(fd, pds)
+        return self._read_runs(fd, runs)
+
+    def warm(self, fd, pds):
+        '''
+        预热: 把pds中不在cache中的页读进还没有用过的缓存页, 不换出任何页
+        由后台线程调用, 前台pin住的页和正在读盘(在loading中)的页都不能被后台线程换出, 只用空闲的缓存页就不会碰到它们
+        return: 实际读入的页数
+        '''
+        with self.latch:
+            self._wait_redirtied()
+            pds = np.unique(np.asarray(pds, dtype=np.int64))
+            pds = pds[(pds >= 0) & (pds < self._page_num(fd))]
+            missing = pds[self.page_table.lookup_many(fd, pds) < 0][:self._unused(fd)]
+            runs = self._reserve_missing(fd, missing)
+        return self._read_runs(fd, runs)
+
+    def resident_pages(self):
+        '''
+        cache中的页 [(fd, pd)], 按替换策略最不会换出的在前
+        用于退出时记下热页, 重启后预热
+        '''
+        with self.latch:
+            keys = (self.page_table.key_of(idx) for idx in self.replacer.by_recency())
+            return [(fd, pd) for fd, pd in keys if fd >= 0] # 不包括正在读盘的页
+
+    def _reserve_missing(self, fd, pds):
+        '''
+        持有latch时调用: pds是升序的页号数组, 为其中不在cache中的页分配pin住的缓存页, 记在loading中
+        这些缓存页读完之前不放进页表, 其他线程缺这些页时等它们读完
+        return: [(起始页号, 缓存页号列表, 缓存页列表, {页号: 后台写线程正在写的副本})], 每段是一次preadv
+        '''
+        missing = pds[self.page_table.lookup_many(fd, pds) < 0]
+        if self.loading: # 其他线程正在读盘的页由它放进页表
+            missing = missing[[(fd, pd) not in self.loading for pd in missing.tolist()]]
+        # 多个线程同时预读时, 正在读盘的页合计也不超过缓存分区的1/4, 否则可能所有缓存页都被pin住
+        missing = missing[:max(0, self._capacity(fd) // 4 - len(self.loading))]
+        runs = []
+        assign, access, pin, loading, writing = self._assign, self.replacer.access, self.replacer.pin, self.loading, self.writing
+        for run in np.split(missing, np.flatnonzero(np.diff(missing) != 1) + 1):
+            for start in range(0, len(run), IOV_MAX):
+                pd = int(run[start])
+                idxs, pages, pending = [], [], {}
+                for p in range(pd, pd + min(IOV_MAX, len(run) - start)):
+                    idx = assign(fd, p, publish=False)
+                    access(idx)
+                    pin(idx) # 读完之前不能被同一批预读换出(2Q会先换出a1in中的页)
+                    loading[(fd, p)] = idx
+                    idxs.append(idx)
+                    pages.append(self._page(idx)) # 在latch下分配缓存页所在的块
+                    if writing and (fd, p) in writing: # 存储中还是旧版本, 读完后以副本为准
+                        pending[p] = writing[(fd, p)]
+                self.dirty[idxs] = False
+                runs.append((pd, idxs, pages, pending))
+        return runs
+
+    def _read_runs(self, fd, runs):
+        '''
+        不持有latch时调用: 把_reserve_missing分配的每段缓存页用一次preadv读入, 读完一段放进页表一段
+        缓存页还不在页表中, 其他线程拿不到, 读盘时不必持有frame latch
+        return: 读入的页数
+        '''
+        fetched = 0
+        done = 0 # 已经放进页表的段数
+        try:
+            for pd, idxs, pages, pending in runs:
+                start = time.perf_counter()
+                nbytes = os.preadv(fd, pages, pd << self.page_size_bits)
+                io_time = time.perf_counter() - start
+                if nbytes < len(pages) * self.page_size: # 读到了文件末尾之后
+                    for i, page in enumerate(pages):
+                        if nbytes < (i + 1) * self.page_size:
+                            page[max(0, nbytes - i * self.page_size):] = 0
+                with self.latch:
+                    for p, data in pending.items():
+                        pages[p - pd][:] = data
+                    put, unpin = self.page_table.put, self.replacer.unpin
+                    for i, idx in enumerate(idxs):
+                        del self.loading[(fd, pd + i)]
+                        put(fd, pd + i, idx)
+                        unpin(idx)
+                    stats = self._stats(fd)
+                    stats.io_time += io_time
+                    stats.bytes_read += nbytes
+                    self.writing_done.notify_all()
+                done += 1
+                fetched += len(idxs)
+        finally:
+            if done < len(runs): # 读盘出错, 还没读的缓存页放回去
+                with self.latch:
+                    for pd, idxs, _, _ in runs[done:]:
+                        for i, idx in enumerate(idxs):
+                            self.loading.pop((fd, pd + i))
+                            self.replacer.unpin(idx)
+                            self.replacer.free(idx)
+                    self.writing_done.notify_all()
+        return fetched
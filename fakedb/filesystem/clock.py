@@ -0,0 +1,96 @@
+from array import array
+
+import numpy as np
+
+
+class Clock:
+    '''
+    CLOCK(second chance)替换策略
+    - 引用位和pin计数各是一块连续内存, 同时有NumPy视图
+    - access只是一次数组写入
+    - 换出时先逐页看指针附近几页, 找不到再用NumPy按块扫描
+    '''
+    FAST_STEP = 8 # 逐页检查的页数
+    SWEEP_STEP = 256 # 每次向量化扫描的页数
+
+    def __init__(self, size):
+        self.size = size
+        self.ref = bytearray(size)
+        self.pin_count = array('i', bytes(4 * size))
+        # 与上面两个数组共享内存
+        self._ref = np.frombuffer(self.ref, dtype=np.uint8)
+        self._pin_count = np.frombuffer(self.pin_count, dtype=np.int32)
+        self.unused = list(range(size - 1, -1, -1)) # 栈, 从0开始分配
+        self.hand = 0
+
+    def _sweep(self, lo, hi):
+        '''
+        在[lo, hi)中寻找引用位为0且未被pin的页
+        经过的页清空引用位
+        '''
+        candidates = (self._ref[lo:hi] == 0) & (self._pin_count[lo:hi] == 0)
+        if not candidates.any():
+            self._ref[lo:hi] = 0
+            return None
+        idx = lo + int(candidates.argmax())
+        self._ref[lo:idx] = 0
+        return idx
+
+    def _evict(self):
+        ref, pin_count, size = self.ref, self.pin_count, self.size
+        hand = self.hand
+        for _ in range(Clock.FAST_STEP):
+            if not ref[hand] and not pin_count[hand]:
+                self.hand = hand + 1 if hand + 1 < size else 0
+                return hand
+            ref[hand] = 0
+            hand = hand + 1 if hand + 1 < size else 0
+
+        # 转一圈清空所有引用位, 第二圈必能找到未被pin的页
+        steps = 2 * ((size + Clock.SWEEP_STEP - 1) // Clock.SWEEP_STEP) + 1
+        for _ in range(steps):
+            hi = min(hand + Clock.SWEEP_STEP, size)
+            idx = self._sweep(hand, hi)
+            if idx is not None:
+                self.hand = (idx + 1) % size
+                return idx
+            hand = hi % size
+        raise Exception('all pages in buffer are pinned')
+
+    def assign(self, key=None):
+        # return new_idx, need_write_back
+        if self.unused:
+            return self.unused.pop(), False
+        return self._evict(), True
+
+    def free(self, idx):
+        self.ref[idx] = 0
+        self.pin_count[idx] = 0
+        self.unused.append(idx)
+
+    def access(self, idx):
+        self.ref[idx] = 1
+
+    def by_recency(self):
+        '''在用的页, 引用位为1的在前, 引用位相同时越晚被指针经过的越靠前'''
+        used = np.ones(self.size, dtype=np.bool_)
+        used[self.unused] = False
+        order = np.roll(np.arange(self.size), -self.hand)[::-1]
+        order = order[used[order]]
+        return [int(idx) for idx in order[np.argsort(self._ref[order] == 0, kind='stable')]]
+
+    def victims(self, n):
+        '''指针之后引用位为0且未被pin的最多n页, 不移动指针'''
+        n -= len(self.unused)
+        if n <= 0:
+            return []
+        order = np.roll(np.arange(self.size), -self.hand)
+        candidates = order[(self._ref[order] == 0) & (self._pin_count[order] == 0)]
+        unused = set(self.unused)
+        return [int(idx) for idx in candidates[:n + len(unused)] if idx not in unused][:n]
+
+    def pin(self, idx):
+        self.pin_count[idx] += 1
+
+    def unpin(self, idx):
+        self.pin_count[idx] -= 1
@@ -0,0 +1,59 @@
+import zlib
+from collections import OrderedDict
+from ..config import PAGE_SIZE, COLD_TIER_LEVEL
+
+
+class ColdTier:
+    '''
+    缓存的第二级: 从BufManager换出的干净页用zlib压缩后留在内存中, 压缩后的总字节数不超过budget
+    - 主缓存缺页时先查这里, 命中则解压回缓存页, 不必读存储
+    - 这里的页都和存储中一致, 超出budget时按放入顺序直接丢弃, 不需要写回
+    - 压缩后没有变小的页不放入
+    '''
+    def __init__(self, budget, page_size=PAGE_SIZE, level=COLD_TIER_LEVEL):
+        self.budget = budget
+        self.page_size = page_size
+        self.level = level
+        self.pages = OrderedDict() # (fd, pd) -> 压缩后的页, 最早放入的在前
+        self.size = 0 # 压缩后的总字节数
+        self.rejected = 0 # 压缩后没有变小而不放入的页数
+
+    def __len__(self):
+        return len(self.pages)
+
+    def put(self, fd, pd, page):
+        self.discard(fd, pd)
+        data = zlib.compress(page, self.level)
+        if len(data) >= self.page_size or len(data) > self.budget:
+            self.rejected += 1
+            return
+        self.pages[(fd, pd)] = data
+        self.size += len(data)
+        while self.size > self.budget:
+            _, old = self.pages.popitem(last=False)
+            self.size -= len(old)
+
+    def pop(self, fd, pd):
+        '''
+        取出一页, 页回到主缓存后这里不再保留
+        return: 解压后的页, 不在这里时返回None
+        '''
+        data = self.pages.pop((fd, pd), None)
+        if data is None:
+            return None
+        self.size -= len(data)
+        return zlib.decompress(data)
+
+    def discard(self, fd, pd):
+        data = self.pages.pop((fd, pd), None)
+        if data is not None:
+            self.size -= len(data)
+
+    def drop_file(self, fd):
+        '''文件关闭后fd可能被复用, 丢弃它的所有页'''
+        for key in [key for key in self.pages if key[0] == fd]:
+            self.size -= len(self.pages.pop(key))
+
+    def ratio(self):
+        '''压缩比: 原始页的字节数 / 压缩后的字节数'''
+        return len(self.pages) * self.page_size / self.size if self.size else 0.0
@@ -1,24 +1,66 @@
 import os
+import threading
+from collections import defaultdict
+from fnmatch import fnmatch
+
+import numpy as np
 
 from .buf_manager import BufManager
-from ..config import PAGE_SIZE, PAGE_SIZE_BITS
+from .mapped_file import MappedFile
+from .io_stats import IOStats
+from .warmer import Warmer
+from ..config import PAGE_SIZE, MAX_PAGE_SIZE, PAGE_SIZES, REPLACER, CACHE_SIZE, FILE_BACKEND, MMAP_DATABASES, \
+    BG_WRITER, BUFFER_PARTITIONS, BUFFER_PARTITION_FILES, COLD_TIER_SIZE, ROOT_DIR, WARM_BATCH
 
 
 
 class FileManager:
+    '''
+    文件和缓存池的入口, 可以被多个线程同时使用
+    - 打开关闭文件和创建缓存池持有latch, 读写页只经过对应缓存池自己的锁
+    - 同一个文件不能在被其他线程读写时关闭
+    '''
     try:
         FILE_OPEN_MODE = os.O_RDWR | os.O_BINARY
     except AttributeError as exception:
         FILE_OPEN_MODE = os.O_RDWR
         
-    def __init__(self):
+    def __init__(self, replacer=REPLACER, cache_size=CACHE_SIZE, backend=FILE_BACKEND, mmap_databases=MMAP_DATABASES,
+                 bg_writer=BG_WRITER, partitions=BUFFER_PARTITIONS, partition_files=BUFFER_PARTITION_FILES,
+                 cold_tier_size=COLD_TIER_SIZE, page_sizes=PAGE_SIZES):
+        if backend not in ('buffer', 'mmap'):
+            raise Exception(f'unknown file backend {backend}')
+
+        self.latch = threading.RLock() # 保护下面的映射和缓存池的创建
 
         # 维护打开的文件名和fd的映射
         self.fd2name = {} 
         self.name2fd = {}
 
-        # buffer manager
-        self.buf_manager = BufManager()
+        # buffer manager, 每种页大小一个缓存池, 默认页大小的缓存池一开始就创建
+        self.replacer = replacer
+        self.cache_size = cache_size
+        self.bg_writer = bg_writer
+        self.partitions = dict(partitions)
+        self.cold_tier_size = cold_tier_size
+        self.buf_manager = BufManager(replacer, cache_size, bg_writer, partitions, cold_tier_size)
+        self.buf_managers = {PAGE_SIZE: self.buf_manager} # 页大小 -> BufManager
+        self.file_buf = {} # fd -> 文件所用的BufManager
+        self.partition_files = list(partition_files) # [(通配符, 分区名)]
+
+        # 单独设定页大小的数据库, 数据库名 -> 页大小; fd -> 打开的文件的页大小
+        self.page_sizes = dict(page_sizes)
+        self.file_page_size = {}
+
+        # 使用mmap的文件, fd -> MappedFile
+        self.backend = backend
+        self.mmap_databases = set(mmap_databases)
+        self.mapped = {}
+
+        # 已关闭文件的缓存统计, 文件名 -> IOStats
+        self.closed_stats = {}
+
+        self.warmer = None # 预热线程, 第一次预热时创建
         
     def exists(self, filename):
         return os.path.exists(filename)
@@ -31,33 +73,157 @@ class FileManager:
         '''删除文件'''
         os.remove(filename)
 
-    def open_file(self, filename):
+    def read_head(self, filename, nbytes=PAGE_SIZE):
+        '''不经过缓存直接读文件开头的nbytes字节, 用于打开文件前从文件头中取出页大小'''
+        with open(filename, 'rb') as f:
+            return f.read(nbytes)
+
+    def open_file(self, filename, page_size=PAGE_SIZE):
         '''打开文件
+        page_size: 文件的页大小, 由文件头记录
         返回file descriptor(int)
         '''
-        if filename in self.name2fd:
-            return self.name2fd[filename]
-            # raise Exception(f"file {filename} has been opened")
-        fd = os.open(filename, FileManager.FILE_OPEN_MODE) # FIXME: clarify mode
-        self.fd2name[fd] = filename
-        self.name2fd[filename] = fd
-        return fd
+        with self.latch:
+            if filename in self.name2fd:
+                fd = self.name2fd[filename]
+                if self.file_page_size[fd] != page_size:
+                    raise Exception(f'file {filename} has been opened with page size {self.file_page_size[fd]}')
+                return fd
+                # raise Exception(f"file {filename} has been opened")
+            self.check_page_size(page_size)
+            fd = os.open(filename, FileManager.FILE_OPEN_MODE) # FIXME: clarify mode
+            self.fd2name[fd] = filename
+            self.name2fd[filename] = fd
+            self.file_page_size[fd] = page_size
+            if self.use_mmap(filename):
+                self.mapped[fd] = MappedFile(fd, page_size)
+            else:
+                buf_manager = self.file_buf[fd] = self._buf_manager_of(page_size)
+                partition = self.partition_of(filename)
+                if partition is not None:
+                    buf_manager.set_partition(fd, partition)
+            return fd
 
-    def close_file(self, description):
-        '''关闭文件'''
+    def _buf_manager_of(self, page_size):
+        '''页大小为page_size的缓存池, 第一次用到时创建, 字节数和默认页大小的缓存池相同'''
+        with self.latch:
+            buf_manager = self.buf_managers.get(page_size)
+            if buf_manager is None:
+                scale = page_size // PAGE_SIZE
+                partitions = {name: max(1, size // scale) for name, size in self.partitions.items()}
+                buf_manager = BufManager(self.replacer, max(1, self.cache_size // scale), self.bg_writer, partitions,
+                                         self.cold_tier_size, page_size)
+                self.buf_managers[page_size] = buf_manager
+            return buf_manager
+
+    @staticmethod
+    def check_page_size(page_size):
+        if page_size & (page_size - 1) or not PAGE_SIZE <= page_size <= MAX_PAGE_SIZE:
+            raise Exception(f'invalid page size {page_size}, expected a power of 2 between {PAGE_SIZE} and {MAX_PAGE_SIZE}')
+
+    def page_size(self, fd):
+        '''打开的文件的页大小'''
+        return self.file_page_size[fd]
+
+    def page_size_for(self, filename):
+        '''新建文件时使用的页大小: 文件所在的数据库单独设定的, 或默认的PAGE_SIZE'''
+        db = os.path.basename(os.path.dirname(filename))
+        page_size = self.page_sizes.get(db, PAGE_SIZE)
+        self.check_page_size(page_size)
+        return page_size
+
+    def partition_of(self, filename):
+        '''文件所在的缓存分区, None表示default分区'''
+        path = os.path.relpath(filename, ROOT_DIR)
+        for pattern, partition in self.partition_files:
+            if fnmatch(path, pattern):
+                return partition
+        return None
+
+    def use_mmap(self, filename):
+        '''文件是否走mmap: 全局设定, 或文件所在的数据库单独设定'''
+        if self.backend == 'mmap':
+            return True
+        db = os.path.basename(os.path.dirname(filename))
+        return db in self.mmap_databases
+
+    def _get_fd(self, description):
         if isinstance(description, str) and description in self.name2fd: # filename
-            fd = self.name2fd[description]
+            return self.name2fd[description]
         elif description in self.fd2name: # fd
-            fd = description
-        else:
-            fd = None
-
-        # print(f'fd2name:{self.fd2name}')
-        if fd is not None:
-            self.buf_manager.close(fd) # 清空cache中该文件对应的页
-            os.close(fd)
-            self.name2fd.pop(self.fd2name.pop(fd));
-    
+            return description
+        return None
+
+    def close_file(self, description):
+        '''关闭文件
+        返回写回存储的脏页数
+        '''
+        with self.latch:
+            fd = self._get_fd(description)
+
+            # print(f'fd2name:{self.fd2name}')
+            written = 0
+            if fd is not None:
+                if self.warmer is not None:
+                    self.warmer.cancel(fd)
+                if fd in self.mapped:
+                    self.mapped.pop(fd).close()
+                else:
+                    buf_manager = self.file_buf.pop(fd)
+                    written = buf_manager.close(fd) # 清空cache中该文件对应的页
+                    stats = buf_manager.pop_stats(fd)
+                    if stats is not None:
+                        self.closed_stats.setdefault(self.fd2name[fd], IOStats()).add(stats)
+                self.file_page_size.pop(fd)
+                os.close(fd)
+                self.name2fd.pop(self.fd2name.pop(fd));
+            return written
+
+    def buffer_stats(self):
+        '''每个文件的缓存统计, 包括已关闭的文件
+        返回 文件名 -> IOStats, 按文件名排序
+        '''
+        res = {name: IOStats().add(stats) for name, stats in self.closed_stats.items()}
+        for buf_manager in self.buf_managers.values():
+            for fd, stats in list(buf_manager.stats.items()):
+                res.setdefault(self.fd2name[fd], IOStats()).add(stats)
+        return dict(sorted(res.items()))
+
+    def reset_buffer_stats(self):
+        '''清空缓存统计'''
+        self.closed_stats = {}
+        for buf_manager in self.buf_managers.values():
+            buf_manager.reset_stats()
+
+    def resident_pages(self):
+        '''
+        各缓存池中的页 [(文件名, 页号)], 每个缓存池内最不会被换出的在前, 不包括mmap的文件
+        '''
+        res = []
+        for buf_manager in self.buf_managers.values():
+            res += [(self.fd2name[fd], pd) for fd, pd in buf_manager.resident_pages()]
+        return res
+
+    def warm_up(self, pages):
+        '''
+        在后台把pages中的页读回缓存, 用于重启后预热
+        pages: [(fd, pd)], 最热的在前; 每个缓存池只取最热的cache_size页, 再按文件名和页号的顺序读入
+        '''
+        taken = defaultdict(int) # BufManager -> 取了的页数
+        chosen = defaultdict(list) # fd -> [pd]
+        for fd, pd in pages:
+            buf_manager = self.file_buf.get(fd) # mmap的文件不预热
+            if buf_manager is not None and taken[buf_manager] < buf_manager.cache_size:
+                taken[buf_manager] += 1
+                chosen[fd].append(pd)
+        if not chosen:
+            return
+        if self.warmer is None:
+            self.warmer = Warmer(WARM_BATCH)
+            self.warmer.start()
+        for fd in sorted(chosen, key=self.fd2name.get):
+            self.warmer.add(self.file_buf[fd], fd, np.unique(np.asarray(chosen[fd], dtype=np.int64)))
+
     def read_page(self, fd, pd):
         '''读取一页数据
         fd: file id, 文件描述符
@@ -65,7 +231,41 @@ class FileManager:
 
         return: 读出的数据
         '''
-        return self.buf_manager.read(fd, pd)
+        if fd in self.mapped:
+            return self.mapped[fd].read(pd)
+        return self.file_buf[fd].read(fd, pd)
+
+    def fetch_page(self, fd, pd, exclusive=False):
+        '''读取一页数据并pin住
+        返回缓存页本身, 用完后必须调用unpin_page; 要修改时exclusive为True, 独占这一页直到unpin
+        使用mmap的文件直接返回映射内存, 不加latch
+        '''
+        if fd in self.mapped:
+            return self.mapped[fd].read(pd)
+        return self.file_buf[fd].fetch(fd, pd, exclusive)
+
+    def unpin_page(self, fd, pd, dirty=False):
+        '''释放fetch_page得到的页
+        dirty: 是否修改了这一页
+        '''
+        if fd not in self.mapped: # 映射内存的修改直接生效
+            self.file_buf[fd].unpin(fd, pd, dirty)
+
+    def prefetch_pages(self, fd, pd, n):
+        '''提示将要顺序读取从pd开始的n页, 提前读入
+        返回实际读入的页数
+        '''
+        if fd in self.mapped:
+            return self.mapped[fd].prefetch(pd, n)
+        return self.file_buf[fd].prefetch(fd, pd, n)
+
+    def prefetch_page_list(self, fd, pds):
+        '''提示将要读取pds中的页(不一定连续), 提前读入
+        返回实际读入的页数
+        '''
+        if fd in self.mapped:
+            return sum(self.mapped[fd].prefetch(int(pd), 1) for pd in pds)
+        return self.file_buf[fd].prefetch_list(fd, pds)
 
     def write_page(self, fd, pd, data):
         '''写回一页数据
@@ -74,21 +274,29 @@ class FileManager:
         data: 要写入的数据
         return: 无返回值
         '''
-        self.buf_manager.write(fd, pd, data)
+        if fd in self.mapped:
+            self.mapped[fd].write(pd, data)
+        else:
+            self.file_buf[fd].write(fd, pd, data)
 
     def new_page(self, fd, data):
         '''
         创建新页，写入数据
         返回新页的页号
         '''
-        pos = os.lseek(fd, 0, os.SEEK_END)
-        os.write(fd, data.tobytes())
-        return pos >> PAGE_SIZE_BITS
+        if fd in self.mapped:
+            return self.mapped[fd].new_page(data)
+        return self.file_buf[fd].new_page(fd, data)
 
     def shutdown(self):
         '''
         退出
         '''
+        if self.warmer is not None:
+            self.warmer.stop()
+            self.warmer = None
+        for buf_manager in self.buf_managers.values():
+            buf_manager.shutdown()
         fds = list(self.fd2name.keys())
         # print('file manager shutdown: ', self.fd2name)
         for fd in fds:
@@ -0,0 +1,36 @@
+import threading
+from array import array
+
+
+class FrameLatches:
+    '''
+    每个缓存页一个读写latch: 多个读者共享, 写者独占, 不可重入
+    - 读写缓存页内容的线程总是pin住了这一页, fetch得到的页从fetch一直latch到unpin
+    - 所有缓存页共用一个条件变量, 读者数和写者标记放在数组中, 不为每页创建锁对象
+    - 内部的锁只在修改计数时短暂持有, 持有时不再拿别的锁
+    等待时不能持有BufManager的latch或stripe: 持有frame latch的线程unpin和缺页时都要用到它们
+    '''
+    def __init__(self, size):
+        self.cond = threading.Condition(threading.Lock())
+        self.readers = array('i', [0]) * size
+        self.writer = bytearray(size)
+
+    def acquire(self, idx, exclusive=False):
+        with self.cond:
+            if exclusive:
+                while self.writer[idx] or self.readers[idx]:
+                    self.cond.wait()
+                self.writer[idx] = 1
+            else:
+                while self.writer[idx]:
+                    self.cond.wait()
+                self.readers[idx] += 1
+
+    def release(self, idx):
+        '''释放共享或独占的latch, 独占时只有一个持有者, 由写者标记区分'''
+        with self.cond:
+            if self.writer[idx]:
+                self.writer[idx] = 0
+            else:
+                self.readers[idx] -= 1
+            self.cond.notify_all()
@@ -0,0 +1,33 @@
+class IOStats:
+    '''
+    一个文件(或所有文件合计)的缓存和I/O统计
+    - hits/misses: 读页时命中/未命中cache的次数
+    - cold_hits: 未命中的读中由压缩的第二级缓存提供的次数
+    - evictions: 被换出的页数
+    - dirty_writebacks: 写回存储的脏页数
+    - bytes_read/bytes_written: 读写存储的字节数
+    - io_time: 花在读写存储上的时间(秒)
+    '''
+    FIELDS = ('hits', 'misses', 'cold_hits', 'evictions', 'dirty_writebacks', 'bytes_read', 'bytes_written', 'io_time')
+
+    def __init__(self):
+        for field in IOStats.FIELDS:
+            setattr(self, field, 0)
+
+    def add(self, other):
+        for field in IOStats.FIELDS:
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+        return self
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_row(self, name):
+        return [name, self.hits, self.misses, f'{self.hit_rate():.2%}', self.cold_hits, self.evictions,
+                self.dirty_writebacks, self.bytes_read, self.bytes_written, f'{self.io_time:.3f}']
+
+    @staticmethod
+    def header():
+        return ['file', 'hits', 'misses', 'hit_rate', 'cold_hits', 'evictions', 'dirty_writebacks',
+                'bytes_read', 'bytes_written', 'io_time(s)']
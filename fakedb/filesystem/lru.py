@@ -1,15 +1,28 @@
 from collections import OrderedDict
+from itertools import islice
 
 
 class LRU:
+    '''
+    LRU替换策略
+    和其他替换策略一样本身不加锁, 由BufManager的latch保护
+    '''
     def __init__(self, size):
         self.cache = OrderedDict()
         self.unused = set(list(range(size)))
+        self.pin_count = {} # 被pin住的页 -> pin的次数, 这些页不会被换出
 
-    def assign(self):
+    def _first_unpinned(self):
+        for idx in self.cache:
+            if idx not in self.pin_count:
+                return idx
+        raise Exception('all pages in buffer are pinned')
+
+    def assign(self, key=None):
         # return new_idx, need_write_back
         if len(self.unused) == 0:
-            idx = self.cache.popitem(last=False)[0]
+            idx = self._first_unpinned()
+            self.cache.pop(idx)
             self.unused.add(idx)
             return idx, True
         else:
@@ -20,6 +33,7 @@ class LRU:
     def free(self, idx):
         # assert idx not in self.unused
         self.cache.pop(idx)
+        self.pin_count.pop(idx, None)
         self.unused.add(idx)
 
     def access(self, idx):
@@ -30,4 +44,22 @@ class LRU:
         else:
             self.cache[idx] = None
             self.unused.remove(idx)
+
+    def by_recency(self):
+        '''在用的页, 最近访问的在前'''
+        return list(reversed(self.cache))
+
+    def victims(self, n):
+        '''接下来最先被换出的最多n页(空闲页用完之后)'''
+        unpinned = (idx for idx in self.cache if idx not in self.pin_count)
+        return list(islice(unpinned, max(0, n - len(self.unused))))
+
+    def pin(self, idx):
+        self.pin_count[idx] = self.pin_count.get(idx, 0) + 1
+
+    def unpin(self, idx):
+        if self.pin_count[idx] == 1:
+            self.pin_count.pop(idx)
+        else:
+            self.pin_count[idx] -= 1
         
\ No newline at end of file
@@ -0,0 +1,81 @@
+import os
+import mmap
+import threading
+import numpy as np
+from ..config import PAGE_SIZE, MMAP_GROW_SIZE
+
+
+class MappedFile:
+    '''
+    用mmap映射的文件
+    - 读写页直接操作映射内存, 由内核页缓存代替用户态缓存
+    - 映射按MMAP_GROW_SIZE页为单位扩展, 文件本身总是正好page_num页, 追加页时才扩展一页
+      这样异常退出后文件大小仍是实际的页数, 下次打开时页数不会算错
+    - 映射超出文件末尾的部分不能访问(SIGBUS), 读文件末尾之后的页返回全0的新页
+    - 扩展和追加页持有latch; 旧的映射不会被关闭, 其他线程拿着的视图仍然有效
+    '''
+    def __init__(self, fd, page_size=PAGE_SIZE):
+        self.fd = fd
+        self.page_size = page_size
+        self.page_size_bits = page_size.bit_length() - 1
+        self.page_num = (os.fstat(fd).st_size + page_size - 1) >> self.page_size_bits # 实际使用的页数
+        self.mm = None
+        self.pages = None # (页数, page_size)的NumPy视图
+        self.latch = threading.RLock()
+        self._map(max(self.page_num, MMAP_GROW_SIZE))
+
+    def _map(self, capacity):
+        '''
+        重新映射capacity页
+        mmap要求文件不小于映射的长度, 映射时暂时扩展文件, 映射完马上截断回page_num页
+        '''
+        if self.mm is not None:
+            self.mm.flush()
+        os.ftruncate(self.fd, capacity << self.page_size_bits)
+        try:
+            # 旧的映射可能还有外部视图引用, 不显式close, 由引用计数回收
+            self.mm = mmap.mmap(self.fd, capacity << self.page_size_bits)
+        finally:
+            os.ftruncate(self.fd, self.page_num << self.page_size_bits)
+        self.pages = np.frombuffer(self.mm, dtype=np.uint8).reshape(capacity, self.page_size)
+
+    def _extend(self, page_num):
+        '''持有latch时调用: 把文件扩展到page_num页, 先扩展文件再更新page_num, 读者看到的页总在文件内'''
+        if page_num > len(self.pages):
+            capacity = len(self.pages)
+            self._map(max(page_num, capacity * 2, capacity + MMAP_GROW_SIZE))
+        os.ftruncate(self.fd, page_num << self.page_size_bits)
+        self.page_num = page_num
+
+    def read(self, pd):
+        '''返回映射内存的视图, 超出文件末尾的页全为0'''
+        if pd >= self.page_num:
+            return np.zeros(self.page_size, dtype=np.uint8)
+        return self.pages[pd]
+
+    def write(self, pd, data):
+        if pd >= self.page_num:
+            with self.latch:
+                if pd >= self.page_num:
+                    self._extend(pd + 1)
+        self.pages[pd] = data
+
+    def new_page(self, data):
+        with self.latch:
+            pd = self.page_num
+            self._extend(pd + 1)
+        self.pages[pd] = data
+        return pd
+
+    def prefetch(self, pd, n):
+        '''让内核预读[pd, pd + n)中已有的页'''
+        n = min(n, self.page_num - pd)
+        if n > 0 and hasattr(mmap, 'MADV_WILLNEED'):
+            self.mm.madvise(mmap.MADV_WILLNEED, pd << self.page_size_bits, n << self.page_size_bits)
+        return max(n, 0)
+
+    def close(self):
+        '''写回, 文件已经是实际大小'''
+        self.mm.flush()
+        self.pages = None
+        self.mm = None
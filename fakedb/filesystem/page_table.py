@@ -0,0 +1,66 @@
+from array import array
+import numpy as np
+
+
+class PageTable:
+    '''
+    页表: (fd, pd) <-> 缓存页号
+    - 正向: 每个文件一个dict, pd -> 缓存页号
+    - 反向: 缓存页号 -> fd, pd, 存在两个定长数组中, 换入换出时不再分配元组, 也不再维护第二个dict
+    - lookup_many一次查一个文件的一批页, 供扫描和索引路径判断哪些页需要读盘
+    正向没有改成打包(fd, pd)为int64的开放寻址表: CPython中逐个探测数组要解释执行整个循环,
+    单页查找和换入换出都比dict慢, 批量探测也要几千页以上才追得上逐个查dict
+    '''
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.fd_pages = {} # fd -> {pd: 缓存页号}
+        self.idx_fd = array('i', [-1]) * capacity # 缓存页号 -> fd, 空闲的缓存页为-1
+        self.idx_pd = array('i', [-1]) * capacity # 缓存页号 -> pd
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def get(self, fd, pd):
+        '''缓存页号, 不在缓存中时抛出KeyError'''
+        return self.fd_pages[fd][pd]
+
+    def key_of(self, idx):
+        '''缓存页idx对应的(fd, pd)'''
+        return self.idx_fd[idx], self.idx_pd[idx]
+
+    def pages_of(self, fd):
+        '''文件在缓存中的页, pd -> 缓存页号'''
+        return self.fd_pages.get(fd, {})
+
+    def put(self, fd, pd, idx):
+        pages = self.fd_pages.get(fd)
+        if pages is None:
+            pages = self.fd_pages[fd] = {}
+        pages[pd] = idx
+        self.idx_fd[idx] = fd
+        self.idx_pd[idx] = pd
+        self.size += 1
+
+    def remove(self, idx):
+        '''
+        把缓存页idx移出页表
+        return: 它原来对应的(fd, pd)
+        '''
+        fd, pd = self.idx_fd[idx], self.idx_pd[idx]
+        pages = self.fd_pages[fd]
+        del pages[pd]
+        if not pages:
+            del self.fd_pages[fd]
+        self.idx_fd[idx] = -1
+        self.size -= 1
+        return fd, pd
+
+    def lookup_many(self, fd, pds):
+        '''
+        批量查找文件fd的多个页
+        pds: 页号数组
+        return: 与pds等长的int32数组, 不在缓存中的页为-1
+        '''
+        get = self.fd_pages.get(fd, {}).get
+        return np.array([get(pd, -1) for pd in np.asarray(pds).tolist()], dtype=np.int32)
@@ -0,0 +1,85 @@
+class Partition:
+    '''缓存的一个分区: 缓存页[offset, offset + size), 有自己的替换策略'''
+    def __init__(self, name, offset, size, replacer):
+        self.name = name
+        self.offset = offset
+        self.size = size
+        self.replacer = replacer
+
+    def used(self):
+        '''已分配的缓存页数'''
+        return self.size - len(self.replacer.unused)
+
+
+class PartitionedReplacer:
+    '''
+    把缓存页分成几个命名分区, 每个分区有自己的页数预算和替换策略
+    - 文件通过set_partition分到某个分区, 没有分到的文件用default分区
+    - 一个文件缺页时只会换出同一分区中的页, 批量导入一张表不会挤掉其他分区的热页
+    对外的接口和单个替换策略相同, 缓存页号是全局的
+    '''
+    def __init__(self, replacer_class, cache_size, partitions):
+        '''
+        partitions: 分区名 -> 页数, 剩下的页属于default分区
+        '''
+        if sum(partitions.values()) >= cache_size:
+            raise Exception(f'buffer partitions {partitions} leave no page for default partition')
+        self.partitions = {}
+        offset = 0
+        for name, size in list(partitions.items()) + [('default', cache_size - sum(partitions.values()))]:
+            if size <= 0:
+                raise Exception(f'buffer partition {name} must have at least one page')
+            self.partitions[name] = Partition(name, offset, size, replacer_class(size))
+            offset += size
+        self.default = self.partitions['default']
+        self.owner = [] # 缓存页 -> 所属分区
+        for partition in self.partitions.values():
+            self.owner += [partition] * partition.size
+        self.fd_partition = {} # fd -> 分区
+
+    def set_partition(self, fd, name):
+        if name not in self.partitions:
+            raise Exception(f'unknown buffer partition {name}, expected one of {list(self.partitions)}')
+        self.fd_partition[fd] = self.partitions[name]
+
+    def remove_fd(self, fd):
+        self.fd_partition.pop(fd, None)
+
+    def partition_of(self, fd):
+        return self.fd_partition.get(fd, self.default)
+
+    def assign(self, key):
+        # return new_idx, need_write_back
+        partition = self.partition_of(key[0])
+        idx, need_write_back = partition.replacer.assign(key)
+        return partition.offset + idx, need_write_back
+
+    def free(self, idx):
+        partition = self.owner[idx]
+        partition.replacer.free(idx - partition.offset)
+
+    def access(self, idx):
+        partition = self.owner[idx]
+        partition.replacer.access(idx - partition.offset)
+
+    def pin(self, idx):
+        partition = self.owner[idx]
+        partition.replacer.pin(idx - partition.offset)
+
+    def unpin(self, idx):
+        partition = self.owner[idx]
+        partition.replacer.unpin(idx - partition.offset)
+
+    def by_recency(self):
+        '''每个分区中在用的页, 分区内最近访问的在前'''
+        res = []
+        for partition in self.partitions.values():
+            res += [partition.offset + idx for idx in partition.replacer.by_recency()]
+        return res
+
+    def victims(self, n):
+        '''每个分区中接下来最先被换出的最多n页'''
+        res = []
+        for partition in self.partitions.values():
+            res += [partition.offset + idx for idx in partition.replacer.victims(n)]
+        return res
@@ -0,0 +1,95 @@
+from collections import OrderedDict
+from itertools import chain, islice
+
+
+class TwoQueue:
+    '''
+    2Q替换策略(Johnson & Shasha, 1994)
+    - a1in: 第一次进入缓存的页, FIFO
+    - a1out: 从a1in换出的页的key(不占缓存页), FIFO
+    - am: 在a1out中被再次访问的页, LRU
+    一次全表扫描只会在a1in中轮转, 不会把am中的热页(索引页, 表头页)挤出去
+    '''
+    def __init__(self, size, kin=0.25, kout=0.5):
+        self.a1in = OrderedDict()
+        self.a1out = OrderedDict()
+        self.am = OrderedDict()
+        self.unused = set(list(range(size)))
+        self.keys = {} # idx -> key
+        self.pin_count = {} # 被pin住的页 -> pin的次数, 这些页不会被换出
+        self.kin = max(1, int(size * kin))
+        self.kout = max(1, int(size * kout))
+
+    def _evict(self):
+        if self.a1in and (len(self.a1in) > self.kin or not self.am):
+            queues = (self.a1in, self.am)
+        else:
+            queues = (self.am, self.a1in)
+        # 跳过被pin住的页, 一个队列中的页都被pin住时从另一个队列换出
+        for queue in queues:
+            idx = next((idx for idx in queue if idx not in self.pin_count), None)
+            if idx is not None:
+                break
+        else:
+            raise Exception('all pages in buffer are pinned')
+        queue.pop(idx)
+        if queue is self.a1in:
+            self.a1out[self.keys[idx]] = None
+            if len(self.a1out) > self.kout:
+                self.a1out.popitem(last=False)
+        self.keys.pop(idx)
+        return idx
+
+    def by_recency(self):
+        '''在用的页, am中的页在前, 每个队列中最近进入的在前'''
+        return list(chain(reversed(self.am), reversed(self.a1in)))
+
+    def victims(self, n):
+        '''接下来最先被换出的最多n页(近似: 先a1in后am)'''
+        unpinned = (idx for idx in chain(self.a1in, self.am) if idx not in self.pin_count)
+        return list(islice(unpinned, max(0, n - len(self.unused))))
+
+    def assign(self, key=None):
+        # return new_idx, need_write_back
+        if len(self.unused) == 0:
+            idx = self._evict()
+            self.unused.add(idx)
+            need_write_back = True
+        else:
+            idx = next(iter(self.unused))
+            need_write_back = False
+        self.keys[idx] = key
+        return idx, need_write_back
+
+    def free(self, idx):
+        if idx in self.am:
+            self.am.pop(idx)
+        else:
+            self.a1in.pop(idx)
+        self.keys.pop(idx)
+        self.pin_count.pop(idx, None)
+        self.unused.add(idx)
+
+    def access(self, idx):
+        if idx in self.am:
+            self.am.move_to_end(idx, last=True)
+        elif idx in self.a1in:
+            # a1in中的重复访问视为相关访问, 不提升
+            pass
+        else:
+            self.unused.remove(idx)
+            key = self.keys[idx]
+            if key in self.a1out:
+                self.a1out.pop(key)
+                self.am[idx] = None
+            else:
+                self.a1in[idx] = None
+
+    def pin(self, idx):
+        self.pin_count[idx] = self.pin_count.get(idx, 0) + 1
+
+    def unpin(self, idx):
+        if self.pin_count[idx] == 1:
+            self.pin_count.pop(idx)
+        else:
+            self.pin_count[idx] -= 1
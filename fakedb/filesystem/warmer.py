@@ -0,0 +1,47 @@
+import threading
+import time
+from collections import deque
+
+
+class Warmer(threading.Thread):
+    '''
+    后台预热线程, 重启后把上次退出时在缓存中的页读回来
+    - 任务按加入的顺序执行, 每个任务是一个文件的升序页号, 每次读batch页
+    - 只读进还没有用过的缓存页(BufManager.warm), 不会换出前台正在用的页
+    - 关闭文件前要调用cancel, 返回后不会再读这个fd
+    '''
+    def __init__(self, batch):
+        super().__init__(name='fakedb-warmer', daemon=True)
+        self.batch = batch
+        self.jobs = deque() # (buf_manager, fd, 升序的页号数组)
+        self.cond = threading.Condition() # 保护jobs, 读一批页时也持有
+        self.stopped = False
+
+    def add(self, buf_manager, fd, pds):
+        with self.cond:
+            self.jobs.append((buf_manager, fd, pds))
+            self.cond.notify()
+
+    def cancel(self, fd):
+        '''丢弃fd的任务, 正在读这个fd的一批页时等它读完'''
+        with self.cond:
+            self.jobs = deque(job for job in self.jobs if job[1] != fd)
+
+    def run(self):
+        while True:
+            with self.cond:
+                while not self.jobs and not self.stopped:
+                    self.cond.wait()
+                if self.stopped:
+                    return
+                buf_manager, fd, pds = self.jobs.popleft()
+                if len(pds) > self.batch:
+                    self.jobs.appendleft((buf_manager, fd, pds[self.batch:]))
+                buf_manager.warm(fd, pds[:self.batch])
+            time.sleep(0) # 让出GIL, 前台的读写不必等整个预热结束
+
+    def stop(self):
+        with self.cond:
+            self.stopped = True
+            self.cond.notify()
+        self.join()
@@ -8,15 +8,14 @@ import numpy as np
 from .index_handler import IndexHandler
 from .node import TreeNode
 from ..recordsystem.rid import RID
-from ..config import PAGE_SIZE, NULL_VALUE
+from ..config import NULL_VALUE
 
 
 class FileIndex:
     def __init__(self, handler: IndexHandler, root_id):
         self.root_id = root_id # 根节点的页号
         self.handler = handler
-        data = self.handler.read_page(root_id)
-        data.dtype = np.int64
+        data = self.handler.read_page(root_id).view(np.int64)
         nodeType = data[0]
         parent_id = data[1]
         assert nodeType == 0
@@ -24,22 +23,26 @@ class FileIndex:
         self.rootNode = self.get_node(root_id)    
     
     def get_node(self, page_id):
-        data = self.handler.read_page(page_id)
-        data.dtype = np.int64
-        parent_id = data[1]
-        if data[0] == 1:
-            # leaf node
-            prev_id = data[2]
-            next_id = data[3]
-            length = data[4]
-            key_values = [[data[3*i+5], RID(data[3*i+6],data[3*i+7])] for i in range(length)]
-            return TreeNode(nodeType='leaf', page_id=page_id, parent_id=parent_id, prev_id=prev_id, next_id=next_id, key_values=key_values, handler=self.handler)
+        # 递归读子节点时这一页必须留在缓存中, 所以pin住
+        data = self.handler.fetch_page(page_id).view(np.int64)
+        try:
+            parent_id = data[1]
+            if data[0] == 1:
+                # leaf node
+                prev_id = data[2]
+                next_id = data[3]
+                length = data[4]
+                key_values = [[data[3*i+5], RID(data[3*i+6],data[3*i+7])] for i in range(length)]
+                return TreeNode(nodeType='leaf', page_id=page_id, parent_id=parent_id, prev_id=prev_id, next_id=next_id, key_values=key_values, handler=self.handler)
 
-        else:
-            # inter node
-            length = data[2]
-            key_values = [[data[2*i+3], self.get_node(data[2*i+4])] for i in range(length)]
-            return TreeNode(nodeType='inter', page_id=page_id, parent_id=parent_id, prev_id=None, next_id=None, key_values=key_values, handler=self.handler)
+            else:
+                # inter node
+                length = data[2]
+                self.handler.prefetch_pages(data[4:4+2*length:2]) # 子节点页批量读入, 不再逐页缺页
+                key_values = [[data[2*i+3], self.get_node(data[2*i+4])] for i in range(length)]
+                return TreeNode(nodeType='inter', page_id=page_id, parent_id=parent_id, prev_id=None, next_id=None, key_values=key_values, handler=self.handler)
+        finally:
+            self.handler.unpin_page(page_id)
     
     def writeback(self):
         q = [self.rootNode]
@@ -58,7 +61,7 @@ class FileIndex:
         self.rootNode.insert(key, val)
 
         # check split
-        if self.rootNode.current_page_size() > PAGE_SIZE:
+        if self.rootNode.current_page_size() > self.handler.page_size:
             new_root_id = self.handler.new_page()
             newroot = TreeNode(nodeType='inter', page_id=new_root_id, parent_id=new_root_id, prev_id=None, next_id=None, key_values=[], handler=self.handler)
             self.rootNode.parent_id = new_root_id
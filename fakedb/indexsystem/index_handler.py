@@ -1,30 +1,84 @@
 import numpy as np
 
 from ..filesystem import FileManager
-from ..config import PAGE_SIZE
+from ..config import PAGE_SIZE, INDEX_HEADER_MAGIC
 
 
 class IndexHandler:
     '''
     负责索引和文件系统的交互
+    第0页是文件头: [INDEX_HEADER_MAGIC, 空闲页链表头, 页大小]; 每个空闲页的第一个int64是下一个空闲页的页号, 0表示没有
+    页大小为0的文件头是还没有记录页大小的旧文件, 和没有文件头的旧文件一样用默认的PAGE_SIZE
     '''
     def __init__(self, filename, file_manager: FileManager):
         '''
         filename: 数据库名 + 表名 + 列明
         '''
         self.file_manager = file_manager
-        if not self.file_manager.exists(filename):
+        created = not self.file_manager.exists(filename)
+        if created:
             self.file_manager.create_file(filename)
-        self.fd = self.file_manager.open_file(filename)
+            self.page_size = self.file_manager.page_size_for(filename)
+        else:
+            self.page_size = IndexHandler.peek_page_size(self.file_manager, filename)
+        self.fd = self.file_manager.open_file(filename, self.page_size)
+
+        self.has_header = True
+        if created:
+            self.free_page_id = 0
+            self.file_manager.new_page(self.fd, self.header_array())
+        else:
+            header = self.read_page(0).view(np.int64)
+            self.has_header = bool(header[0] == INDEX_HEADER_MAGIC)
+            self.free_page_id = int(header[1]) if self.has_header else 0
+
+    @staticmethod
+    def peek_page_size(file_manager, filename):
+        '''打开文件前先从存储中的文件头取出页大小, 页大小建立后不再改变, 不必经过缓存'''
+        head = np.frombuffer(file_manager.read_head(filename, 24).ljust(24, b'\0'), np.int64)
+        return int(head[2]) if head[0] == INDEX_HEADER_MAGIC and head[2] else PAGE_SIZE
+
+    def header_array(self):
+        a = np.zeros(self.page_size // 8, np.int64)
+        a[0:3] = [INDEX_HEADER_MAGIC, self.free_page_id, self.page_size]
+        return a.view(np.uint8)
     
     def read_page(self, page_id):
         return self.file_manager.read_page(self.fd, page_id)
     
     def write_page(self, page_id, data):
         return self.file_manager.write_page(self.fd, page_id, data)
+
+    def fetch_page(self, page_id):
+        '''读一页并pin住, 用完后调用unpin_page'''
+        return self.file_manager.fetch_page(self.fd, page_id)
+
+    def unpin_page(self, page_id, dirty=False):
+        self.file_manager.unpin_page(self.fd, page_id, dirty)
+
+    def prefetch_pages(self, page_ids):
+        '''一次读入多个节点页, 如一个内部节点的所有子节点'''
+        return self.file_manager.prefetch_page_list(self.fd, page_ids)
     
     def new_page(self):
-        return self.file_manager.new_page(self.fd, np.zeros(PAGE_SIZE, dtype=np.uint8))
+        '''优先复用空闲页, 没有空闲页时才扩展文件'''
+        if self.free_page_id == 0:
+            return self.file_manager.new_page(self.fd, np.zeros(self.page_size, dtype=np.uint8))
+        page_id = self.free_page_id
+        self.free_page_id = int(self.read_page(page_id).view(np.int64)[0])
+        self.write_page(page_id, np.zeros(self.page_size, dtype=np.uint8))
+        self.write_page(0, self.header_array())
+        return page_id
+
+    def free_page(self, page_id):
+        '''把不再使用的页放回空闲页链表'''
+        if not self.has_header:
+            return
+        a = np.zeros(self.page_size // 8, np.int64)
+        a[0] = self.free_page_id
+        self.write_page(page_id, a.view(np.uint8))
+        self.free_page_id = page_id
+        self.write_page(0, self.header_array())
     
     def close(self):
         self.file_manager.close_file(self.fd)
\ No newline at end of file
@@ -37,12 +37,20 @@ class IndexManager:
             self.file2index[filename] = index
             return index
 
+    def page_size_of(self, filename):
+        '''索引文件头中记录的页大小'''
+        return IndexHandler.peek_page_size(self.file_manager, filename)
+
     def close_index(self, filename):
         if filename not in self.file2index:
             return None
         else:
             index = self.file2index.pop(filename)
             index.writeback()
+
+    def discard_index(self, filename):
+        '''不再使用将要删除的索引文件, 不写回'''
+        self.file2index.pop(filename, None)
             
         
     def shutdown(self):
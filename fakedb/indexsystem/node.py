@@ -1,5 +1,4 @@
 import numpy as np
-from ..config import PAGE_SIZE
 from .index_handler import IndexHandler
 
 class TreeNode:
@@ -95,7 +94,7 @@ class TreeNode:
                     self.key_values[pos][0] = key
                 
                 # check split
-                if node.current_page_size() > PAGE_SIZE:
+                if node.current_page_size() > self.handler.page_size:
                     right_key_values, left_max_key = node.split()
                     old_key = self.key_values[pos][0]
                     self.key_values[pos][0] = left_max_key
@@ -155,6 +154,7 @@ class TreeNode:
             # FIXME: 叶子节点的next_id, prev_id需要处理吗?
             if len(node.key_values) == 0:
                 self.key_values.pop(pos)
+                self.handler.free_page(node.page_id)
 
 
             if new_max_key is not None:
@@ -215,7 +215,7 @@ class TreeNode:
 
     def toArray(self):
         if self.isleaf():
-            a = np.zeros(PAGE_SIZE//8, np.int64)
+            a = np.zeros(self.handler.page_size//8, np.int64)
             a[0:5] = [1, self.parent_id, self.prev_id,
                       self.next_id, len(self.key_values)]
             for i, (key, rid) in enumerate(self.key_values):
@@ -225,7 +225,7 @@ class TreeNode:
             return a
 
         else:
-            a = np.zeros(PAGE_SIZE//8, np.int64)
+            a = np.zeros(self.handler.page_size//8, np.int64)
             a[0:3] = [0, self.parent_id, len(self.key_values)]
             for i, (key, node) in enumerate(self.key_values):
                 a[2*i+3:2*i+5] = [key, node.page_id]
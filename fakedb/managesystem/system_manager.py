@@ -1,4 +1,5 @@
 import os
+import json
 import numpy as np
 import shutil
 import traceback
@@ -13,15 +14,15 @@ from antlr4 import InputStream, CommonTokenStream
 from antlr4.error.ErrorListener import ErrorListener
 
 
-from ..filesystem import FileManager
-from ..recordsystem import RID, RecordManager, Record, get_all_records
+from ..filesystem import FileManager, IOStats
+from ..recordsystem import RID, RecordManager, Record, scan_records
 from ..indexsystem import FileIndex, IndexManager
 from ..metasystem import MetaManager, TableMeta
 from ..parser import SQLLexer, SQLParser
 
-from ..config import ROOT_DIR, TABLE_SUFFIX, INDEX_SUFFIX, NULL_VALUE
+from ..config import ROOT_DIR, TABLE_SUFFIX, INDEX_SUFFIX, NULL_VALUE, WARM_RESTART
 
-from .utils import get_db_dir, get_table_path, get_index_path, get_db_tables, get_table_related_files, \
+from .utils import get_db_dir, get_table_path, get_index_path, get_db_tables, get_table_related_files, get_warm_pages_path, \
     compare_two_cols, compare_col_value, in_values, like_check, null_check
 from .condition import ConditionKind, Condition
 from .selector import SelectorKind, Selector
@@ -47,6 +48,7 @@ class SystemManager:
     '''
     SystemManager
     '''
+
     def __init__(self, visitor):
                
         self.file_manager = FileManager()
@@ -56,6 +58,8 @@ class SystemManager:
         
         self.init_db()
         self.current_db = None # 当前正在使用的db
+        self.table_handles = {} # 表文件路径 -> TableHandle, 建表删表时失效
+        self.warmed = set() # 已经预热过的db
         
         self.visitor = visitor
         self.visitor.manager = self
@@ -77,7 +81,6 @@ class SystemManager:
         接受一条sql query语句
         返回执行结果
     ''' 
-
         input_stream = InputStream(query)
         lexer = SQLLexer(input_stream)
         tokens = CommonTokenStream(lexer)
@@ -116,11 +119,20 @@ class SystemManager:
         # TODO: close file
         if name not in self.active_db:
             raise Exception(f"Can't drop non-existing database {name}")
-        self.index_manager.close_index(name)
         self.meta_manager.drop_db(name)
-        
+
         db_dir = get_db_dir(name)
-                
+        # 先关闭该数据库下打开的索引和文件, 避免之后同名文件复用旧的fd
+        for filename in list(self.index_manager.file2index):
+            if filename.startswith(f'{db_dir}/'):
+                self.index_manager.close_index(filename)
+        for filename in list(self.table_handles):
+            if filename.startswith(f'{db_dir}/'):
+                self.table_handles.pop(filename)
+        for filename in list(self.file_manager.name2fd):
+            if filename.startswith(f'{db_dir}/'):
+                self.file_manager.close_file(filename)
+
         # FIXME： 确认一下是否会存在问题
         # 直接删除数据库目录
         shutil.rmtree(db_dir)
@@ -136,8 +148,50 @@ class SystemManager:
             raise Exception(f"Can't use non-existing database {name}")
         self.current_db = name
         self.meta_manager.use_db(name) # 维护meta_manager中的current_db
+        if WARM_RESTART and name not in self.warmed:
+            self.warmed.add(name)
+            self.warm_up(name)
         return f'current db change to : {self.current_db}'
         
+    def warm_up(self, name):
+        '''
+        在后台把数据库上次退出时在缓存中的页读回来
+        记录的文件打开后一直保持打开, 之后的查询直接使用
+        '''
+        try:
+            with open(get_warm_pages_path(name)) as f:
+                warm = json.load(f)
+        except (OSError, ValueError): # 没有记录或记录损坏时不预热
+            return
+        fds = []
+        for file in warm['files']:
+            filename = f'{get_db_dir(name)}/{file}'
+            if not os.path.exists(filename): # 上次退出后被删除的文件
+                fds.append(None)
+            elif file.endswith(TABLE_SUFFIX):
+                fds.append(self.file_manager.open_file(filename, self.record_manager.page_size_of(filename)))
+            elif file.endswith(INDEX_SUFFIX):
+                fds.append(self.file_manager.open_file(filename, self.index_manager.page_size_of(filename)))
+            else:
+                fds.append(None)
+        self.file_manager.warm_up([(fds[i], pd) for i, pd in warm['pages'] if fds[i] is not None])
+
+    def save_warm_pages(self):
+        '''
+        退出前把每个数据库在缓存中的页记下来, 最不会被换出的在前
+        格式: {"files": [数据库目录下的文件名], "pages": [[文件序号, 页号]]}
+        '''
+        files = defaultdict(dict) # db -> {文件名: 序号}
+        pages = defaultdict(list) # db -> [[文件序号, 页号]]
+        for filename, pd in self.file_manager.resident_pages():
+            db_dir, file = os.path.split(filename)
+            db = os.path.basename(db_dir)
+            if db in self.active_db and db_dir == get_db_dir(db):
+                pages[db].append([files[db].setdefault(file, len(files[db])), pd])
+        for db in pages:
+            with open(get_warm_pages_path(db), 'w') as f:
+                json.dump({'files': list(files[db]), 'pages': pages[db]}, f)
+
     def show_tables(self):
         '''展示数据库中的所有表'''
         if self.current_db is None:
@@ -150,6 +204,7 @@ class SystemManager:
             raise Exception(f"Please using database first to create table")
         self.meta_manager.create_table(tablemeta)
         print(f'creat table: {tablemeta.name}, siz = {tablemeta.get_record_size()}')
+        self.table_handles.pop(get_table_path(self.current_db, tablemeta.name), None)
         self.record_manager.create_file(get_table_path(self.current_db, tablemeta.name), tablemeta.get_record_size())
         # self.file_manager.create_file(get_table_path(self.current_db, tablemeta.name))
         return f'db = {self.current_db}, create table = {tablemeta}'
@@ -159,12 +214,22 @@ class SystemManager:
         if self.current_db is None:
             raise Exception(f"Please use database first to drop table")
         self.meta_manager.drop_table(name)
+        self.table_handles.pop(get_table_path(self.current_db, name), None)
         for file in get_table_related_files(self.current_db, name): # 删除表相关的文件
             print(file)
+            self.index_manager.discard_index(file) # 否则退出时会写回已关闭的文件
             self.file_manager.close_file(file)
             self.file_manager.remove_file(file)
         return f'drop table: {name} from db: {self.current_db}'
 
+    def get_table_handle(self, table):
+        '''当前数据库中一张表的TableHandle, 第一次用到时打开并缓存'''
+        table_path = get_table_path(self.current_db, table)
+        handle = self.table_handles.get(table_path)
+        if handle is None:
+            handle = self.table_handles[table_path] = self.record_manager.open_file(table_path)
+        return handle
+
     def describe_table(self, name):
         '''展示一张表'''
         table_meta = self.meta_manager.get_table(name)
@@ -386,15 +451,18 @@ class SystemManager:
         :return: 满足条件的records和它们的values
         """
         table_meta = self.meta_manager.get_table(table_name)
-        table_path = get_table_path(self.current_db, table_name)
-        self.record_manager.open_file(table_path)
+        handle = self.get_table_handle(table_name)
         index_filter_rids = self.filter_records_by_index(table_name, table_meta, conditions)
         # print(f'index filter rids:{index_filter_rids}')
         if index_filter_rids is None:
-            all_records = get_all_records(self.record_manager)
+            rids, data = scan_records(handle)
         else:
-            all_records = list(map(self.record_manager.get_record, index_filter_rids))
-        # print(f'all_records num:{len(all_records)}')
+            rids = list(index_filter_rids)
+            data = np.zeros((len(rids), handle.header.record_len), dtype=np.uint8)
+            for i, rid in enumerate(rids):
+                data[i] = handle.get_record(rid).data
+        # 所有记录一起解码, 只为满足条件的记录创建Record
+        all_values = table_meta.load_records(data)
         records = []
         values = []
         # print(f'all_records:{all_records}')
@@ -405,8 +473,7 @@ class SystemManager:
             if func is not None:
                 condition_funcs.append(func)
 
-        for i, record in enumerate(all_records):
-            record_values = table_meta.load_record(record.data)
+        for i, record_values in enumerate(all_values):
             flag = True
             # if i < 10:
             #     print(f'record_values:{record_values}, rid:{record.rid}')
@@ -415,7 +482,7 @@ class SystemManager:
                     flag = False
                     break
             if flag:
-                records.append(record)
+                records.append(Record(rids[i], data[i]))
                 values.append(record_values)
 
         # print(f'records num:{len(records)}')
@@ -646,9 +713,7 @@ class SystemManager:
                 
         self.check_constraints(table_meta, value_list, old_record=None)
         
-        table_path = get_table_path(self.current_db, table)
-        self.record_manager.open_file(table_path)
-        rid = self.record_manager.insert_record(data)
+        rid = self.get_table_handle(table).insert_record(data)
         
         self._insert_index(table_meta, value_list, rid)
         
@@ -659,13 +724,12 @@ class SystemManager:
         if self.current_db is None:
             raise Exception(f"Please use database first to delete record")
         table_meta = self.meta_manager.get_table(table)
-        table_path = get_table_path(self.current_db, table)
         records, values = self.search_records_using_indexes(table, conditions)
-        self.record_manager.open_file(table_path)
+        handle = self.get_table_handle(table)
         for record, value in zip(records, values):
             rid = record.rid
             self.check_constraints(table_meta, value, record, delete=True)
-            self.record_manager.delete_record(rid)
+            handle.delete_record(rid)
             self._delete_index(table_meta, value, rid)
             
         return 'delete'
@@ -678,7 +742,7 @@ class SystemManager:
         # print('update_info = ', update_info)
         table_meta = self.meta_manager.get_table(table)
         records, record_values = self.search_records_using_indexes(table, conditions) # 根据condition找到的record和原始value
-        self.record_manager.open_file(get_table_path(self.current_db, table))
+        handle = self.get_table_handle(table)
         
         # print('records = ', records)
         # print('record_values = ', record_values)
@@ -689,11 +753,10 @@ class SystemManager:
                 new_value_list[index] = new_value # 维护更新后的record
             
             self.check_constraints(table_meta, new_value_list, record)
-            self.record_manager.open_file(get_table_path(self.current_db, table))
             
             # 更新record
             data = table_meta.build_record(new_value_list)
-            self.record_manager.update_record(record.rid, data)
+            handle.update_record(record.rid, data)
                         
             # 维护index 先删除再添加
             self._delete_index(table_meta, ori_value_list, record.rid)
@@ -820,11 +883,9 @@ class SystemManager:
         
         # 初始化
         col_idx = table_meta.get_col_idx(col)
-        self.record_manager.open_file(get_table_path(self.current_db, table))
-        records = get_all_records(self.record_manager)
-        for record in records:
-            value = table_meta.load_record(record.data)
-            index.insert(value[col_idx], record.rid)
+        rids, data = scan_records(self.get_table_handle(table))
+        for rid, value in zip(rids, table_meta.load_columns(data)[col_idx]):
+            index.insert(value, rid)
         table_meta.indexes[col] = index.root_id
         return f"add index on {table}.{col}" 
     
@@ -838,6 +899,7 @@ class SystemManager:
         table_meta.drop_index(col)
         
         index_path = get_index_path(self.current_db, table, col)
+        self.index_manager.discard_index(index_path)
         self.file_manager.close_file(index_path)
         self.file_manager.remove_file(index_path)
         return f'drop index: {table}.{col}'
@@ -845,6 +907,33 @@ class SystemManager:
     def show_indexes(self):
         '''打印数据库中的所有索引'''
         return self.meta_manager.get_indexes_description()
+
+    def show_buffer_status(self):
+        '''打印每个缓存池的使用情况和每个文件的缓存统计'''
+        file_stats = self.file_manager.buffer_stats()
+        total = IOStats()
+        for stats in file_stats.values():
+            total.add(stats)
+        rows = [IOStats.header()] + [stats.to_row(name) for name, stats in file_stats.items()] + [total.to_row('total')]
+        widths = [max(len(str(row[i])) for row in rows) for i in range(len(rows[0]))]
+        res = []
+        for page_size, buf_manager in sorted(self.file_manager.buf_managers.items()):
+            res.append(f'cache ({page_size // 1024}KB pages): {len(buf_manager.page_table)}/{buf_manager.cache_size} pages, '
+                       f'{buf_manager.dirty_pages()} dirty, {buf_manager.dirty_evict_count} evicted dirty, '
+                       f'{buf_manager.bg_flush_count} written by background writer')
+            if buf_manager.partitions is not None:
+                res += [f'partition {p.name}: {p.used()}/{p.size} pages' for p in buf_manager.partitions.values()]
+            cold_tier = buf_manager.cold_tier
+            if cold_tier is not None:
+                res.append(f'cold tier: {len(cold_tier)} pages in {cold_tier.size}/{cold_tier.budget} bytes, '
+                           f'compression ratio {cold_tier.ratio():.2f}, {cold_tier.rejected} incompressible pages skipped')
+        res += ['  '.join(str(v).rjust(w) for v, w in zip(row, widths)) for row in rows]
+        return '\n'.join(res)
+
+    def reset_buffer_status(self):
+        '''清空缓存统计'''
+        self.file_manager.reset_buffer_stats()
+        return 'reset buffer status'
     
     def add_primary_key(self, table, primary_key_list):
         '''添加主键'''
@@ -855,22 +944,15 @@ class SystemManager:
         if any(table_meta.primary):
             raise Exception("alread exists primary key, create primary key failed")
         # TODO: 插入前检查主键约束是否成立
-        self.record_manager.open_file(get_table_path(self.current_db, table))
-        records = get_all_records(self.record_manager)
+        _, data = scan_records(self.get_table_handle(table))
         for key in primary_key_list:
             if key not in table_meta.col_idx:
                 raise Exception(f'{key} not in {table}')
-        all_values = []
-
-        for record in records:
-            temp = []
-            for key in primary_key_list:
-                col_idx = table_meta.get_col_idx(key)
-                value = table_meta.load_record(record.data)
-                if value[col_idx] is None:
-                    raise Exception(f'cannot add primary constraint on col {key} which has None value')
-                temp.append(value[col_idx])
-            all_values.append(tuple(temp))
+        columns = table_meta.load_columns(data)
+        for key in primary_key_list:
+            if None in columns[table_meta.get_col_idx(key)]:
+                raise Exception(f'cannot add primary constraint on col {key} which has None value')
+        all_values = list(zip(*(columns[table_meta.get_col_idx(key)] for key in primary_key_list)))
         if len(all_values) != len(set(all_values)):
             raise Exception(f'cannot add primary constraint on col {key} which has duplicated values')
 
@@ -933,12 +1015,8 @@ class SystemManager:
         if col not in table_meta.col_idx:
             raise Exception(f'table {table} does not have col {col}')
         col_idx = table_meta.get_col_idx(col)
-        self.record_manager.open_file(get_table_path(self.current_db, table))
-        records = get_all_records(self.record_manager)
-        all_values = []
-        for record in records:
-            value = table_meta.load_record(record.data)
-            all_values.append(value[col_idx])
+        _, data = scan_records(self.get_table_handle(table))
+        all_values = table_meta.load_columns(data)[col_idx]
         if len(all_values) != len(set(all_values)):
             raise Exception(f'cannot add unique constraint on col {col} which has duplicated values')
         if col in table_meta.uniques:
@@ -948,6 +1026,11 @@ class SystemManager:
 
     def shutdown(self):
         '''退出'''
+        if WARM_RESTART: # 文件关闭时缓存中的页会被清空, 先记下来
+            self.save_warm_pages()
+        for handle in self.table_handles.values(): # 写回各表在内存中修改的文件头
+            handle.close()
+        self.table_handles = {}
         self.meta_manager.shutdown()
         self.index_manager.shutdown()
         self.record_manager.shutdown()
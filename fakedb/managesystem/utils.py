@@ -1,7 +1,7 @@
 import os
 import re
 
-from ..config import TABLE_SUFFIX, INDEX_SUFFIX
+from ..config import TABLE_SUFFIX, INDEX_SUFFIX, WARM_PAGES_FILE
 from ..config import ROOT_DIR
 
 
@@ -93,6 +93,11 @@ def get_db_dir(name):
     return f"{ROOT_DIR}/{name}"
 
 
+def get_warm_pages_path(name):
+    '''返回数据库退出时记录缓存中的页的文件'''
+    return f"{ROOT_DIR}/{name}/{WARM_PAGES_FILE}"
+
+
 def get_table_path(db, table):
     '''返回数据库中一张表的路径'''
     return f"{ROOT_DIR}/{db}/{table}{TABLE_SUFFIX}"
@@ -56,6 +56,14 @@ class SystemVisitor(SQLVisitor):
     def visitShow_indexes(self, ctx:SQLParser.Show_indexesContext):
         return self.manager.show_indexes()
 
+    # Visit a parse tree produced by SQLParser#show_buffer_status.
+    def visitShow_buffer_status(self, ctx:SQLParser.Show_buffer_statusContext):
+        return self.manager.show_buffer_status()
+
+    # Visit a parse tree produced by SQLParser#reset_buffer_status.
+    def visitReset_buffer_status(self, ctx:SQLParser.Reset_buffer_statusContext):
+        return self.manager.reset_buffer_status()
+
     # Visit a parse tree produced by SQLParser#load_data.
     def visitLoad_data(self, ctx:SQLParser.Load_dataContext):
         '''io statement'''
@@ -24,6 +24,86 @@ class ColumnMeta:
              str(self.default), ""])
 
 
+class RecordCodec:
+    '''
+    一个表的记录编解码, 由表结构生成一次, 之后每条记录不再重新计算长度和判断类型
+    - 记录布局: 空值位图, 之后每列依次存放, INT为'q', FLOAT为'd', VARCHAR为补0到siz字节的UTF-8
+    - struct: 整条记录的struct.Struct, 空值位图作为第一个字段
+    - dtype: 同一布局的NumPy结构化类型, 用于一次解码多条记录, 字段null为空值位图, 第i列为字段c{i}
+    '''
+    def __init__(self, columnmetas):
+        self.bitmap_len = ceil(len(columnmetas) / 8)
+        nbits = self.bitmap_len * 8
+        self.null_masks = [1 << (nbits - 1 - i) for i in range(len(columnmetas))] # 第i列的空值位, 按大端整数取位图
+        self.kinds = [columnmeta.kind for columnmeta in columnmetas]
+        self.sizes = [columnmeta.get_siz() for columnmeta in columnmetas]
+        self.defaults = [] # 空值处填入的值
+        fmt = [f'{self.bitmap_len}s']
+        names, formats, offsets = ['null'], [('u1', (self.bitmap_len,))], [0]
+        pos = self.bitmap_len
+        for i, columnmeta in enumerate(columnmetas):
+            if columnmeta.kind == 'VARCHAR':
+                fmt.append(f'{columnmeta.siz}s')
+                formats.append(f'S{columnmeta.siz}')
+                self.defaults.append(b'')
+            elif columnmeta.kind == 'INT':
+                fmt.append('q')
+                formats.append('=i8')
+                self.defaults.append(0)
+            elif columnmeta.kind == 'FLOAT':
+                fmt.append('d')
+                formats.append('=f8')
+                self.defaults.append(0.0)
+            else:
+                raise Exception(f'Wrong kind {columnmeta.kind}!')
+            names.append(f'c{i}')
+            offsets.append(pos)
+            pos += columnmeta.get_siz()
+        self.struct = struct.Struct('=' + ''.join(fmt)) # 本机字节序, 不对齐
+        self.dtype = np.dtype({'names': names, 'formats': formats, 'offsets': offsets, 'itemsize': pos})
+        self.size = pos
+
+    def encode(self, values):
+        nulls = 0
+        fields = [None]
+        for kind, siz, mask, default, value in zip(self.kinds, self.sizes, self.null_masks, self.defaults, values):
+            if value is None:
+                nulls |= mask
+                value = default
+            elif kind == 'VARCHAR':
+                if not isinstance(value, str):
+                    raise Exception(f'{value} is not VARCHAR')
+                strbytes = value.encode()
+                if len(strbytes) > siz:
+                    raise Exception(
+                        f'VARCHAR {value} has length {len(strbytes)}, which is larger than maximum size {siz}')
+                value = strbytes
+            elif kind == 'INT':
+                if not isinstance(value, int):
+                    raise Exception(f'{value} is not INT')
+            elif isinstance(value, str): # FLOAT
+                raise Exception(f'{value} is not float')
+            fields.append(value)
+        fields.extend(self.defaults[len(fields) - 1:]) # 没有给出值的列填0, 不设空值位
+        fields[0] = nulls.to_bytes(self.bitmap_len, 'big')
+        res = np.zeros(self.size, dtype=np.uint8)
+        self.struct.pack_into(res, 0, *fields)
+        return res
+
+    def decode(self, data):
+        fields = self.struct.unpack(data)
+        nulls = int.from_bytes(fields[0], 'big')
+        values = []
+        for kind, mask, value in zip(self.kinds, self.null_masks, fields[1:]):
+            if nulls & mask:
+                values.append(None)
+            elif kind == 'VARCHAR':
+                values.append(value.rstrip(b'\x00').decode('utf-8'))
+            else:
+                values.append(value)
+        return values
+
+
 class TableMeta:
     def __init__(self, name, columnmetas):
         self.name = name
@@ -42,17 +122,30 @@ class TableMeta:
     def __str__(self):
         return self.name
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_codec', None) # struct.Struct不能pickle, 载入后重新生成
+        return state
+
+    def codec(self):
+        '''记录的编解码, 第一次用到时生成, 增删列后重新生成'''
+        if getattr(self, '_codec', None) is None: # 旧的meta文件中没有这一项
+            self._codec = RecordCodec(list(self.column_dict.values()))
+        return self._codec
+
 
     def add_column(self, columnmeta):
         if columnmeta.name in self.column_dict:
             raise Exception(f'column {columnmeta.name} cannot be added because it exists!')
 
         self.column_dict[columnmeta.name] = columnmeta
+        self._codec = None
 
     def drop_column(self, name):
         if name not in self.column_dict:
             raise Exception(f'column {name} cannot be dropped because it does not exist!')
         self.column_dict.pop(name)
+        self._codec = None
 
     def has_column(self, name):
         return name in self.column_dict
@@ -126,72 +219,41 @@ class TableMeta:
         ) + ';' + ' '.join(sorted([item for item in self.uniques])) + ';' + ' '.join(sorted([idx for idx in self.indexes])) + ';'
 
     def build_record(self, values):
-        record_siz = self.get_record_size()
-        # print('record siz = ', record_siz)
-        res = np.zeros(record_siz, dtype=np.uint8)
-
-        bitmap_len = self.get_record_null_bitmap_len()
-        bitmap_data = np.unpackbits(np.array([0] * bitmap_len, dtype=np.uint8))
-        pos = bitmap_len
-
-        for i, (columnmeta, value) in enumerate(zip(self.column_dict.values(), values)):
-            siz = columnmeta.get_siz()
-            if value is None:
-                bitmap_data[i] = 1
-            else:
-                if columnmeta.kind == 'VARCHAR':
-                    if not isinstance(value, str):
-                        raise Exception(f'{value} is not VARCHAR')
-                    strbytes = tuple(value.encode())
-                    if len(strbytes) > siz:
-                        raise Exception(
-                            f'VARCHAR {value} has length {len(strbytes)}, which is larger than maximum size {siz}')
-                    res[pos: pos + len(strbytes)] = strbytes
-                else:
-                    if columnmeta.kind == 'INT':
-                        if not isinstance(value, int):
-                            raise Exception(f'{value} is not INT')
-                        intbytes = tuple(struct.pack('q', value))
-                        res[pos: pos + siz] = intbytes
-                    elif columnmeta.kind == 'FLOAT':
-                        if isinstance(value, str):
-                            raise Exception(f'{value} is not float')
-                        floatbytes = tuple(struct.pack('d', value))
-                        res[pos: pos + siz] = floatbytes
-                    else:
-                        raise Exception(f'Wrong kind {columnmeta.kind}!')
-
-            pos += siz
-
-        res[:bitmap_len] = np.packbits(bitmap_data)
-        return res
-
-    def load_record(self, data):
-        bitmap_len = self.get_record_null_bitmap_len()
-        bitmap_data = np.unpackbits(data[:bitmap_len])
-
-        values = []
-        pos = bitmap_len
+        return self.codec().encode(values)
+
+    def record_dtype(self):
+        '''记录布局对应的NumPy结构化类型, 字段null为空值位图, 第i列为字段c{i}'''
+        return self.codec().dtype
+
+    def load_records(self, data):
+        '''
+        一次解码多条记录, 结果和逐条调用load_record相同
+        data: (记录数, 记录长度)的uint8数组
+        return: 每条记录的值列表
+        '''
+        return [list(row) for row in zip(*self.load_columns(data))]
+
+    def load_columns(self, data):
+        '''
+        按列解码多条记录, 每列一次转换, 不逐条解析
+        data: (记录数, 记录长度)的uint8数组
+        return: 每列一个值列表, 空值为None
+        '''
+        records = np.ascontiguousarray(data).view(self.record_dtype()).reshape(-1)
+        nulls = np.unpackbits(records['null'], axis=1)
+        columns = []
         for i, columnmeta in enumerate(self.column_dict.values()):
-            siz = columnmeta.get_siz()
-            if bitmap_data[i] == 1:
-                values.append(None)
-            else:
-                kind = columnmeta.kind
-                if kind == 'VARCHAR':
-                    value = data[pos: pos + siz].tobytes().rstrip(b'\x00').decode('utf-8')
-                else:
-                    if kind == 'INT':
-                        value = struct.unpack('q', data[pos: pos + siz])[0]
-                    elif kind == 'FLOAT':
-                        value = struct.unpack('d', data[pos: pos + siz])[0]
-                    else:
-                        raise Exception(f'Wrong kind {columnmeta.kind}!')
-                values.append(value)
+            column = records[f'c{i}']
+            if columnmeta.kind == 'VARCHAR': # S类型已经去掉了末尾补位的0
+                column = np.char.decode(column, 'utf-8')
+            values = column.tolist()
+            for j in np.flatnonzero(nulls[:, i]).tolist():
+                values[j] = None
+            columns.append(values)
+        return columns
 
-            pos += siz
-
-        return values
+    def load_record(self, data):
+        return self.codec().decode(data)
 
 
 class DbMeta:
@@ -1,228 +1,202 @@
-# Generated from SQL.g4 by ANTLR 4.7.2
+# Generated from SQL.g4 by ANTLR 4.13.2
 from antlr4 import *
 from io import StringIO
-from typing.io import TextIO
 import sys
-
+if sys.version_info[1] > 5:
+    from typing import TextIO
+else:
+    from typing.io import TextIO
 
 
 def serializedATN():
-    with StringIO() as buf:
-        buf.write("\3\u608b\ua72a\u8133\ub9ed\u417c\u3be7\u7786\u5964\2G")
-        buf.write("\u0204\b\1\4\2\t\2\4\3\t\3\4\4\t\4\4\5\t\5\4\6\t\6\4\7")
-        buf.write("\t\7\4\b\t\b\4\t\t\t\4\n\t\n\4\13\t\13\4\f\t\f\4\r\t\r")
-        buf.write("\4\16\t\16\4\17\t\17\4\20\t\20\4\21\t\21\4\22\t\22\4\23")
-        buf.write("\t\23\4\24\t\24\4\25\t\25\4\26\t\26\4\27\t\27\4\30\t\30")
-        buf.write("\4\31\t\31\4\32\t\32\4\33\t\33\4\34\t\34\4\35\t\35\4\36")
-        buf.write("\t\36\4\37\t\37\4 \t \4!\t!\4\"\t\"\4#\t#\4$\t$\4%\t%")
-        buf.write("\4&\t&\4\'\t\'\4(\t(\4)\t)\4*\t*\4+\t+\4,\t,\4-\t-\4.")
-        buf.write("\t.\4/\t/\4\60\t\60\4\61\t\61\4\62\t\62\4\63\t\63\4\64")
-        buf.write("\t\64\4\65\t\65\4\66\t\66\4\67\t\67\48\t8\49\t9\4:\t:")
-        buf.write("\4;\t;\4<\t<\4=\t=\4>\t>\4?\t?\4@\t@\4A\tA\4B\tB\4C\t")
-        buf.write("C\4D\tD\4E\tE\4F\tF\3\2\3\2\3\3\3\3\3\3\3\3\3\3\3\3\3")
-        buf.write("\3\3\4\3\4\3\4\3\4\3\4\3\4\3\4\3\4\3\4\3\5\3\5\3\5\3\5")
-        buf.write("\3\5\3\6\3\6\3\6\3\6\3\6\3\7\3\7\3\7\3\7\3\7\3\7\3\7\3")
-        buf.write("\7\3\7\3\7\3\b\3\b\3\b\3\b\3\t\3\t\3\t\3\t\3\t\3\t\3\t")
-        buf.write("\3\n\3\n\3\n\3\n\3\n\3\n\3\n\3\n\3\13\3\13\3\13\3\13\3")
-        buf.write("\13\3\f\3\f\3\f\3\f\3\f\3\r\3\r\3\r\3\r\3\r\3\16\3\16")
-        buf.write("\3\16\3\17\3\17\3\17\3\17\3\17\3\17\3\20\3\20\3\20\3\20")
-        buf.write("\3\20\3\21\3\21\3\22\3\22\3\23\3\23\3\23\3\23\3\23\3\24")
-        buf.write("\3\24\3\24\3\24\3\24\3\24\3\24\3\25\3\25\3\25\3\25\3\25")
-        buf.write("\3\26\3\26\3\26\3\26\3\26\3\26\3\26\3\27\3\27\3\27\3\27")
-        buf.write("\3\27\3\27\3\27\3\30\3\30\3\30\3\30\3\30\3\30\3\31\3\31")
-        buf.write("\3\31\3\31\3\31\3\31\3\31\3\32\3\32\3\32\3\32\3\33\3\33")
-        buf.write("\3\33\3\33\3\33\3\33\3\33\3\34\3\34\3\34\3\34\3\34\3\34")
-        buf.write("\3\35\3\35\3\35\3\36\3\36\3\36\3\36\3\36\3\36\3\37\3\37")
-        buf.write("\3\37\3\37\3\37\3\37\3\37\3 \3 \3 \3 \3 \3 \3!\3!\3!\3")
-        buf.write("!\3\"\3\"\3\"\3\"\3\"\3\"\3#\3#\3#\3#\3#\3#\3#\3#\3$\3")
-        buf.write("$\3$\3$\3%\3%\3%\3%\3%\3%\3%\3%\3&\3&\3&\3&\3&\3&\3&\3")
-        buf.write("&\3&\3&\3&\3\'\3\'\3\'\3\'\3\'\3\'\3\'\3\'\3\'\3\'\3\'")
-        buf.write("\3(\3(\3(\3(\3(\3(\3(\3)\3)\3*\3*\3*\3*\3+\3+\3+\3+\3")
-        buf.write("+\3+\3+\3+\3,\3,\3,\3,\3-\3-\3-\3-\3-\3-\3-\3-\3.\3.\3")
-        buf.write(".\3.\3.\3.\3/\3/\3/\3/\3\60\3\60\3\60\3\61\3\61\3\61\3")
-        buf.write("\62\3\62\3\62\3\62\3\62\3\63\3\63\3\64\3\64\3\65\3\65")
-        buf.write("\3\66\3\66\3\67\3\67\3\67\38\38\39\39\39\3:\3:\3:\3;\3")
-        buf.write(";\3;\3;\3;\3;\3<\3<\3<\3<\3=\3=\3=\3=\3>\3>\3>\3>\3?\3")
-        buf.write("?\3?\3?\3@\3@\3@\3@\3@\3A\3A\7A\u01d5\nA\fA\16A\u01d8")
-        buf.write("\13A\3B\6B\u01db\nB\rB\16B\u01dc\3C\3C\7C\u01e1\nC\fC")
-        buf.write("\16C\u01e4\13C\3C\3C\3D\5D\u01e9\nD\3D\6D\u01ec\nD\rD")
-        buf.write("\16D\u01ed\3D\3D\7D\u01f2\nD\fD\16D\u01f5\13D\3E\6E\u01f8")
-        buf.write("\nE\rE\16E\u01f9\3E\3E\3F\3F\3F\6F\u0201\nF\rF\16F\u0202")
-        buf.write("\2\2G\3\3\5\4\7\5\t\6\13\7\r\b\17\t\21\n\23\13\25\f\27")
-        buf.write("\r\31\16\33\17\35\20\37\21!\22#\23%\24\'\25)\26+\27-\30")
-        buf.write("/\31\61\32\63\33\65\34\67\359\36;\37= ?!A\"C#E$G%I&K\'")
-        buf.write("M(O)Q*S+U,W-Y.[/]\60_\61a\62c\63e\64g\65i\66k\67m8o9q")
-        buf.write(":s;u<w=y>{?}@\177A\u0081B\u0083C\u0085D\u0087E\u0089F")
-        buf.write("\u008bG\3\2\b\5\2C\\aac|\6\2\62;C\\aac|\3\2\62;\3\2))")
-        buf.write("\5\2\13\f\17\17\"\"\3\2==\2\u020b\2\3\3\2\2\2\2\5\3\2")
-        buf.write("\2\2\2\7\3\2\2\2\2\t\3\2\2\2\2\13\3\2\2\2\2\r\3\2\2\2")
-        buf.write("\2\17\3\2\2\2\2\21\3\2\2\2\2\23\3\2\2\2\2\25\3\2\2\2\2")
-        buf.write("\27\3\2\2\2\2\31\3\2\2\2\2\33\3\2\2\2\2\35\3\2\2\2\2\37")
-        buf.write("\3\2\2\2\2!\3\2\2\2\2#\3\2\2\2\2%\3\2\2\2\2\'\3\2\2\2")
-        buf.write("\2)\3\2\2\2\2+\3\2\2\2\2-\3\2\2\2\2/\3\2\2\2\2\61\3\2")
-        buf.write("\2\2\2\63\3\2\2\2\2\65\3\2\2\2\2\67\3\2\2\2\29\3\2\2\2")
-        buf.write("\2;\3\2\2\2\2=\3\2\2\2\2?\3\2\2\2\2A\3\2\2\2\2C\3\2\2")
-        buf.write("\2\2E\3\2\2\2\2G\3\2\2\2\2I\3\2\2\2\2K\3\2\2\2\2M\3\2")
-        buf.write("\2\2\2O\3\2\2\2\2Q\3\2\2\2\2S\3\2\2\2\2U\3\2\2\2\2W\3")
-        buf.write("\2\2\2\2Y\3\2\2\2\2[\3\2\2\2\2]\3\2\2\2\2_\3\2\2\2\2a")
-        buf.write("\3\2\2\2\2c\3\2\2\2\2e\3\2\2\2\2g\3\2\2\2\2i\3\2\2\2\2")
-        buf.write("k\3\2\2\2\2m\3\2\2\2\2o\3\2\2\2\2q\3\2\2\2\2s\3\2\2\2")
-        buf.write("\2u\3\2\2\2\2w\3\2\2\2\2y\3\2\2\2\2{\3\2\2\2\2}\3\2\2")
-        buf.write("\2\2\177\3\2\2\2\2\u0081\3\2\2\2\2\u0083\3\2\2\2\2\u0085")
-        buf.write("\3\2\2\2\2\u0087\3\2\2\2\2\u0089\3\2\2\2\2\u008b\3\2\2")
-        buf.write("\2\3\u008d\3\2\2\2\5\u008f\3\2\2\2\7\u0096\3\2\2\2\t\u009f")
-        buf.write("\3\2\2\2\13\u00a4\3\2\2\2\r\u00a9\3\2\2\2\17\u00b3\3\2")
-        buf.write("\2\2\21\u00b7\3\2\2\2\23\u00be\3\2\2\2\25\u00c6\3\2\2")
-        buf.write("\2\27\u00cb\3\2\2\2\31\u00d0\3\2\2\2\33\u00d5\3\2\2\2")
-        buf.write("\35\u00d8\3\2\2\2\37\u00de\3\2\2\2!\u00e3\3\2\2\2#\u00e5")
-        buf.write("\3\2\2\2%\u00e7\3\2\2\2\'\u00ec\3\2\2\2)\u00f3\3\2\2\2")
-        buf.write("+\u00f8\3\2\2\2-\u00ff\3\2\2\2/\u0106\3\2\2\2\61\u010c")
-        buf.write("\3\2\2\2\63\u0113\3\2\2\2\65\u0117\3\2\2\2\67\u011e\3")
-        buf.write("\2\2\29\u0124\3\2\2\2;\u0127\3\2\2\2=\u012d\3\2\2\2?\u0134")
-        buf.write("\3\2\2\2A\u013a\3\2\2\2C\u013e\3\2\2\2E\u0144\3\2\2\2")
-        buf.write("G\u014c\3\2\2\2I\u0150\3\2\2\2K\u0158\3\2\2\2M\u0163\3")
-        buf.write("\2\2\2O\u016e\3\2\2\2Q\u0175\3\2\2\2S\u0177\3\2\2\2U\u017b")
-        buf.write("\3\2\2\2W\u0183\3\2\2\2Y\u0187\3\2\2\2[\u018f\3\2\2\2")
-        buf.write("]\u0195\3\2\2\2_\u0199\3\2\2\2a\u019c\3\2\2\2c\u019f\3")
-        buf.write("\2\2\2e\u01a4\3\2\2\2g\u01a6\3\2\2\2i\u01a8\3\2\2\2k\u01aa")
-        buf.write("\3\2\2\2m\u01ac\3\2\2\2o\u01af\3\2\2\2q\u01b1\3\2\2\2")
-        buf.write("s\u01b4\3\2\2\2u\u01b7\3\2\2\2w\u01bd\3\2\2\2y\u01c1\3")
-        buf.write("\2\2\2{\u01c5\3\2\2\2}\u01c9\3\2\2\2\177\u01cd\3\2\2\2")
-        buf.write("\u0081\u01d2\3\2\2\2\u0083\u01da\3\2\2\2\u0085\u01de\3")
-        buf.write("\2\2\2\u0087\u01e8\3\2\2\2\u0089\u01f7\3\2\2\2\u008b\u01fd")
-        buf.write("\3\2\2\2\u008d\u008e\7=\2\2\u008e\4\3\2\2\2\u008f\u0090")
-        buf.write("\7E\2\2\u0090\u0091\7T\2\2\u0091\u0092\7G\2\2\u0092\u0093")
-        buf.write("\7C\2\2\u0093\u0094\7V\2\2\u0094\u0095\7G\2\2\u0095\6")
-        buf.write("\3\2\2\2\u0096\u0097\7F\2\2\u0097\u0098\7C\2\2\u0098\u0099")
-        buf.write("\7V\2\2\u0099\u009a\7C\2\2\u009a\u009b\7D\2\2\u009b\u009c")
-        buf.write("\7C\2\2\u009c\u009d\7U\2\2\u009d\u009e\7G\2\2\u009e\b")
-        buf.write("\3\2\2\2\u009f\u00a0\7F\2\2\u00a0\u00a1\7T\2\2\u00a1\u00a2")
-        buf.write("\7Q\2\2\u00a2\u00a3\7R\2\2\u00a3\n\3\2\2\2\u00a4\u00a5")
-        buf.write("\7U\2\2\u00a5\u00a6\7J\2\2\u00a6\u00a7\7Q\2\2\u00a7\u00a8")
-        buf.write("\7Y\2\2\u00a8\f\3\2\2\2\u00a9\u00aa\7F\2\2\u00aa\u00ab")
-        buf.write("\7C\2\2\u00ab\u00ac\7V\2\2\u00ac\u00ad\7C\2\2\u00ad\u00ae")
-        buf.write("\7D\2\2\u00ae\u00af\7C\2\2\u00af\u00b0\7U\2\2\u00b0\u00b1")
-        buf.write("\7G\2\2\u00b1\u00b2\7U\2\2\u00b2\16\3\2\2\2\u00b3\u00b4")
-        buf.write("\7W\2\2\u00b4\u00b5\7U\2\2\u00b5\u00b6\7G\2\2\u00b6\20")
-        buf.write("\3\2\2\2\u00b7\u00b8\7V\2\2\u00b8\u00b9\7C\2\2\u00b9\u00ba")
-        buf.write("\7D\2\2\u00ba\u00bb\7N\2\2\u00bb\u00bc\7G\2\2\u00bc\u00bd")
-        buf.write("\7U\2\2\u00bd\22\3\2\2\2\u00be\u00bf\7K\2\2\u00bf\u00c0")
-        buf.write("\7P\2\2\u00c0\u00c1\7F\2\2\u00c1\u00c2\7G\2\2\u00c2\u00c3")
-        buf.write("\7Z\2\2\u00c3\u00c4\7G\2\2\u00c4\u00c5\7U\2\2\u00c5\24")
-        buf.write("\3\2\2\2\u00c6\u00c7\7N\2\2\u00c7\u00c8\7Q\2\2\u00c8\u00c9")
-        buf.write("\7C\2\2\u00c9\u00ca\7F\2\2\u00ca\26\3\2\2\2\u00cb\u00cc")
-        buf.write("\7H\2\2\u00cc\u00cd\7T\2\2\u00cd\u00ce\7Q\2\2\u00ce\u00cf")
-        buf.write("\7O\2\2\u00cf\30\3\2\2\2\u00d0\u00d1\7H\2\2\u00d1\u00d2")
-        buf.write("\7K\2\2\u00d2\u00d3\7N\2\2\u00d3\u00d4\7G\2\2\u00d4\32")
-        buf.write("\3\2\2\2\u00d5\u00d6\7V\2\2\u00d6\u00d7\7Q\2\2\u00d7\34")
-        buf.write("\3\2\2\2\u00d8\u00d9\7V\2\2\u00d9\u00da\7C\2\2\u00da\u00db")
-        buf.write("\7D\2\2\u00db\u00dc\7N\2\2\u00dc\u00dd\7G\2\2\u00dd\36")
-        buf.write("\3\2\2\2\u00de\u00df\7F\2\2\u00df\u00e0\7W\2\2\u00e0\u00e1")
-        buf.write("\7O\2\2\u00e1\u00e2\7R\2\2\u00e2 \3\2\2\2\u00e3\u00e4")
-        buf.write("\7*\2\2\u00e4\"\3\2\2\2\u00e5\u00e6\7+\2\2\u00e6$\3\2")
-        buf.write("\2\2\u00e7\u00e8\7F\2\2\u00e8\u00e9\7G\2\2\u00e9\u00ea")
-        buf.write("\7U\2\2\u00ea\u00eb\7E\2\2\u00eb&\3\2\2\2\u00ec\u00ed")
-        buf.write("\7K\2\2\u00ed\u00ee\7P\2\2\u00ee\u00ef\7U\2\2\u00ef\u00f0")
-        buf.write("\7G\2\2\u00f0\u00f1\7T\2\2\u00f1\u00f2\7V\2\2\u00f2(\3")
-        buf.write("\2\2\2\u00f3\u00f4\7K\2\2\u00f4\u00f5\7P\2\2\u00f5\u00f6")
-        buf.write("\7V\2\2\u00f6\u00f7\7Q\2\2\u00f7*\3\2\2\2\u00f8\u00f9")
-        buf.write("\7X\2\2\u00f9\u00fa\7C\2\2\u00fa\u00fb\7N\2\2\u00fb\u00fc")
-        buf.write("\7W\2\2\u00fc\u00fd\7G\2\2\u00fd\u00fe\7U\2\2\u00fe,\3")
-        buf.write("\2\2\2\u00ff\u0100\7F\2\2\u0100\u0101\7G\2\2\u0101\u0102")
-        buf.write("\7N\2\2\u0102\u0103\7G\2\2\u0103\u0104\7V\2\2\u0104\u0105")
-        buf.write("\7G\2\2\u0105.\3\2\2\2\u0106\u0107\7Y\2\2\u0107\u0108")
-        buf.write("\7J\2\2\u0108\u0109\7G\2\2\u0109\u010a\7T\2\2\u010a\u010b")
-        buf.write("\7G\2\2\u010b\60\3\2\2\2\u010c\u010d\7W\2\2\u010d\u010e")
-        buf.write("\7R\2\2\u010e\u010f\7F\2\2\u010f\u0110\7C\2\2\u0110\u0111")
-        buf.write("\7V\2\2\u0111\u0112\7G\2\2\u0112\62\3\2\2\2\u0113\u0114")
-        buf.write("\7U\2\2\u0114\u0115\7G\2\2\u0115\u0116\7V\2\2\u0116\64")
-        buf.write("\3\2\2\2\u0117\u0118\7U\2\2\u0118\u0119\7G\2\2\u0119\u011a")
-        buf.write("\7N\2\2\u011a\u011b\7G\2\2\u011b\u011c\7E\2\2\u011c\u011d")
-        buf.write("\7V\2\2\u011d\66\3\2\2\2\u011e\u011f\7I\2\2\u011f\u0120")
-        buf.write("\7T\2\2\u0120\u0121\7Q\2\2\u0121\u0122\7W\2\2\u0122\u0123")
-        buf.write("\7R\2\2\u01238\3\2\2\2\u0124\u0125\7D\2\2\u0125\u0126")
-        buf.write("\7[\2\2\u0126:\3\2\2\2\u0127\u0128\7N\2\2\u0128\u0129")
-        buf.write("\7K\2\2\u0129\u012a\7O\2\2\u012a\u012b\7K\2\2\u012b\u012c")
-        buf.write("\7V\2\2\u012c<\3\2\2\2\u012d\u012e\7Q\2\2\u012e\u012f")
-        buf.write("\7H\2\2\u012f\u0130\7H\2\2\u0130\u0131\7U\2\2\u0131\u0132")
-        buf.write("\7G\2\2\u0132\u0133\7V\2\2\u0133>\3\2\2\2\u0134\u0135")
-        buf.write("\7C\2\2\u0135\u0136\7N\2\2\u0136\u0137\7V\2\2\u0137\u0138")
-        buf.write("\7G\2\2\u0138\u0139\7T\2\2\u0139@\3\2\2\2\u013a\u013b")
-        buf.write("\7C\2\2\u013b\u013c\7F\2\2\u013c\u013d\7F\2\2\u013dB\3")
-        buf.write("\2\2\2\u013e\u013f\7K\2\2\u013f\u0140\7P\2\2\u0140\u0141")
-        buf.write("\7F\2\2\u0141\u0142\7G\2\2\u0142\u0143\7Z\2\2\u0143D\3")
-        buf.write("\2\2\2\u0144\u0145\7R\2\2\u0145\u0146\7T\2\2\u0146\u0147")
-        buf.write("\7K\2\2\u0147\u0148\7O\2\2\u0148\u0149\7C\2\2\u0149\u014a")
-        buf.write("\7T\2\2\u014a\u014b\7[\2\2\u014bF\3\2\2\2\u014c\u014d")
-        buf.write("\7M\2\2\u014d\u014e\7G\2\2\u014e\u014f\7[\2\2\u014fH\3")
-        buf.write("\2\2\2\u0150\u0151\7H\2\2\u0151\u0152\7Q\2\2\u0152\u0153")
-        buf.write("\7T\2\2\u0153\u0154\7G\2\2\u0154\u0155\7K\2\2\u0155\u0156")
-        buf.write("\7I\2\2\u0156\u0157\7P\2\2\u0157J\3\2\2\2\u0158\u0159")
-        buf.write("\7E\2\2\u0159\u015a\7Q\2\2\u015a\u015b\7P\2\2\u015b\u015c")
-        buf.write("\7U\2\2\u015c\u015d\7V\2\2\u015d\u015e\7T\2\2\u015e\u015f")
-        buf.write("\7C\2\2\u015f\u0160\7K\2\2\u0160\u0161\7P\2\2\u0161\u0162")
-        buf.write("\7V\2\2\u0162L\3\2\2\2\u0163\u0164\7T\2\2\u0164\u0165")
-        buf.write("\7G\2\2\u0165\u0166\7H\2\2\u0166\u0167\7G\2\2\u0167\u0168")
-        buf.write("\7T\2\2\u0168\u0169\7G\2\2\u0169\u016a\7P\2\2\u016a\u016b")
-        buf.write("\7E\2\2\u016b\u016c\7G\2\2\u016c\u016d\7U\2\2\u016dN\3")
-        buf.write("\2\2\2\u016e\u016f\7W\2\2\u016f\u0170\7P\2\2\u0170\u0171")
-        buf.write("\7K\2\2\u0171\u0172\7S\2\2\u0172\u0173\7W\2\2\u0173\u0174")
-        buf.write("\7G\2\2\u0174P\3\2\2\2\u0175\u0176\7.\2\2\u0176R\3\2\2")
-        buf.write("\2\u0177\u0178\7P\2\2\u0178\u0179\7Q\2\2\u0179\u017a\7")
-        buf.write("V\2\2\u017aT\3\2\2\2\u017b\u017c\7F\2\2\u017c\u017d\7")
-        buf.write("G\2\2\u017d\u017e\7H\2\2\u017e\u017f\7C\2\2\u017f\u0180")
-        buf.write("\7W\2\2\u0180\u0181\7N\2\2\u0181\u0182\7V\2\2\u0182V\3")
-        buf.write("\2\2\2\u0183\u0184\7K\2\2\u0184\u0185\7P\2\2\u0185\u0186")
-        buf.write("\7V\2\2\u0186X\3\2\2\2\u0187\u0188\7X\2\2\u0188\u0189")
-        buf.write("\7C\2\2\u0189\u018a\7T\2\2\u018a\u018b\7E\2\2\u018b\u018c")
-        buf.write("\7J\2\2\u018c\u018d\7C\2\2\u018d\u018e\7T\2\2\u018eZ\3")
-        buf.write("\2\2\2\u018f\u0190\7H\2\2\u0190\u0191\7N\2\2\u0191\u0192")
-        buf.write("\7Q\2\2\u0192\u0193\7C\2\2\u0193\u0194\7V\2\2\u0194\\")
-        buf.write("\3\2\2\2\u0195\u0196\7C\2\2\u0196\u0197\7P\2\2\u0197\u0198")
-        buf.write("\7F\2\2\u0198^\3\2\2\2\u0199\u019a\7K\2\2\u019a\u019b")
-        buf.write("\7U\2\2\u019b`\3\2\2\2\u019c\u019d\7K\2\2\u019d\u019e")
-        buf.write("\7P\2\2\u019eb\3\2\2\2\u019f\u01a0\7N\2\2\u01a0\u01a1")
-        buf.write("\7K\2\2\u01a1\u01a2\7M\2\2\u01a2\u01a3\7G\2\2\u01a3d\3")
-        buf.write("\2\2\2\u01a4\u01a5\7\60\2\2\u01a5f\3\2\2\2\u01a6\u01a7")
-        buf.write("\7,\2\2\u01a7h\3\2\2\2\u01a8\u01a9\7?\2\2\u01a9j\3\2\2")
-        buf.write("\2\u01aa\u01ab\7>\2\2\u01abl\3\2\2\2\u01ac\u01ad\7>\2")
-        buf.write("\2\u01ad\u01ae\7?\2\2\u01aen\3\2\2\2\u01af\u01b0\7@\2")
-        buf.write("\2\u01b0p\3\2\2\2\u01b1\u01b2\7@\2\2\u01b2\u01b3\7?\2")
-        buf.write("\2\u01b3r\3\2\2\2\u01b4\u01b5\7>\2\2\u01b5\u01b6\7@\2")
-        buf.write("\2\u01b6t\3\2\2\2\u01b7\u01b8\7E\2\2\u01b8\u01b9\7Q\2")
-        buf.write("\2\u01b9\u01ba\7W\2\2\u01ba\u01bb\7P\2\2\u01bb\u01bc\7")
-        buf.write("V\2\2\u01bcv\3\2\2\2\u01bd\u01be\7C\2\2\u01be\u01bf\7")
-        buf.write("X\2\2\u01bf\u01c0\7I\2\2\u01c0x\3\2\2\2\u01c1\u01c2\7")
-        buf.write("O\2\2\u01c2\u01c3\7C\2\2\u01c3\u01c4\7Z\2\2\u01c4z\3\2")
-        buf.write("\2\2\u01c5\u01c6\7O\2\2\u01c6\u01c7\7K\2\2\u01c7\u01c8")
-        buf.write("\7P\2\2\u01c8|\3\2\2\2\u01c9\u01ca\7U\2\2\u01ca\u01cb")
-        buf.write("\7W\2\2\u01cb\u01cc\7O\2\2\u01cc~\3\2\2\2\u01cd\u01ce")
-        buf.write("\7P\2\2\u01ce\u01cf\7W\2\2\u01cf\u01d0\7N\2\2\u01d0\u01d1")
-        buf.write("\7N\2\2\u01d1\u0080\3\2\2\2\u01d2\u01d6\t\2\2\2\u01d3")
-        buf.write("\u01d5\t\3\2\2\u01d4\u01d3\3\2\2\2\u01d5\u01d8\3\2\2\2")
-        buf.write("\u01d6\u01d4\3\2\2\2\u01d6\u01d7\3\2\2\2\u01d7\u0082\3")
-        buf.write("\2\2\2\u01d8\u01d6\3\2\2\2\u01d9\u01db\t\4\2\2\u01da\u01d9")
-        buf.write("\3\2\2\2\u01db\u01dc\3\2\2\2\u01dc\u01da\3\2\2\2\u01dc")
-        buf.write("\u01dd\3\2\2\2\u01dd\u0084\3\2\2\2\u01de\u01e2\7)\2\2")
-        buf.write("\u01df\u01e1\n\5\2\2\u01e0\u01df\3\2\2\2\u01e1\u01e4\3")
-        buf.write("\2\2\2\u01e2\u01e0\3\2\2\2\u01e2\u01e3\3\2\2\2\u01e3\u01e5")
-        buf.write("\3\2\2\2\u01e4\u01e2\3\2\2\2\u01e5\u01e6\7)\2\2\u01e6")
-        buf.write("\u0086\3\2\2\2\u01e7\u01e9\7/\2\2\u01e8\u01e7\3\2\2\2")
-        buf.write("\u01e8\u01e9\3\2\2\2\u01e9\u01eb\3\2\2\2\u01ea\u01ec\t")
-        buf.write("\4\2\2\u01eb\u01ea\3\2\2\2\u01ec\u01ed\3\2\2\2\u01ed\u01eb")
-        buf.write("\3\2\2\2\u01ed\u01ee\3\2\2\2\u01ee\u01ef\3\2\2\2\u01ef")
-        buf.write("\u01f3\7\60\2\2\u01f0\u01f2\t\4\2\2\u01f1\u01f0\3\2\2")
-        buf.write("\2\u01f2\u01f5\3\2\2\2\u01f3\u01f1\3\2\2\2\u01f3\u01f4")
-        buf.write("\3\2\2\2\u01f4\u0088\3\2\2\2\u01f5\u01f3\3\2\2\2\u01f6")
-        buf.write("\u01f8\t\6\2\2\u01f7\u01f6\3\2\2\2\u01f8\u01f9\3\2\2\2")
-        buf.write("\u01f9\u01f7\3\2\2\2\u01f9\u01fa\3\2\2\2\u01fa\u01fb\3")
-        buf.write("\2\2\2\u01fb\u01fc\bE\2\2\u01fc\u008a\3\2\2\2\u01fd\u01fe")
-        buf.write("\7/\2\2\u01fe\u0200\7/\2\2\u01ff\u0201\n\7\2\2\u0200\u01ff")
-        buf.write("\3\2\2\2\u0201\u0202\3\2\2\2\u0202\u0200\3\2\2\2\u0202")
-        buf.write("\u0203\3\2\2\2\u0203\u008c\3\2\2\2\13\2\u01d6\u01dc\u01e2")
-        buf.write("\u01e8\u01ed\u01f3\u01f9\u0202\3\b\2\2")
-        return buf.getvalue()
-
+    return [
+        4,0,72,540,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
+        2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,
+        13,7,13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,
+        19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,
+        26,7,26,2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,
+        32,2,33,7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,
+        39,7,39,2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,
+        45,2,46,7,46,2,47,7,47,2,48,7,48,2,49,7,49,2,50,7,50,2,51,7,51,2,
+        52,7,52,2,53,7,53,2,54,7,54,2,55,7,55,2,56,7,56,2,57,7,57,2,58,7,
+        58,2,59,7,59,2,60,7,60,2,61,7,61,2,62,7,62,2,63,7,63,2,64,7,64,2,
+        65,7,65,2,66,7,66,2,67,7,67,2,68,7,68,2,69,7,69,2,70,7,70,2,71,7,
+        71,1,0,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,2,1,2,1,2,1,2,1,
+        2,1,2,1,2,1,3,1,3,1,3,1,3,1,3,1,4,1,4,1,4,1,4,1,4,1,5,1,5,1,5,1,
+        5,1,5,1,5,1,5,1,5,1,5,1,5,1,6,1,6,1,6,1,6,1,7,1,7,1,7,1,7,1,7,1,
+        7,1,7,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,9,1,9,1,9,1,9,1,9,1,9,1,
+        9,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,11,1,11,1,11,1,11,1,11,1,
+        11,1,12,1,12,1,12,1,12,1,12,1,13,1,13,1,13,1,13,1,13,1,14,1,14,1,
+        14,1,14,1,14,1,15,1,15,1,15,1,16,1,16,1,16,1,16,1,16,1,16,1,17,1,
+        17,1,17,1,17,1,17,1,18,1,18,1,19,1,19,1,20,1,20,1,20,1,20,1,20,1,
+        21,1,21,1,21,1,21,1,21,1,21,1,21,1,22,1,22,1,22,1,22,1,22,1,23,1,
+        23,1,23,1,23,1,23,1,23,1,23,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,
+        25,1,25,1,25,1,25,1,25,1,25,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,
+        27,1,27,1,27,1,27,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,29,1,29,1,
+        29,1,29,1,29,1,29,1,30,1,30,1,30,1,31,1,31,1,31,1,31,1,31,1,31,1,
+        32,1,32,1,32,1,32,1,32,1,32,1,32,1,33,1,33,1,33,1,33,1,33,1,33,1,
+        34,1,34,1,34,1,34,1,35,1,35,1,35,1,35,1,35,1,35,1,36,1,36,1,36,1,
+        36,1,36,1,36,1,36,1,36,1,37,1,37,1,37,1,37,1,38,1,38,1,38,1,38,1,
+        38,1,38,1,38,1,38,1,39,1,39,1,39,1,39,1,39,1,39,1,39,1,39,1,39,1,
+        39,1,39,1,40,1,40,1,40,1,40,1,40,1,40,1,40,1,40,1,40,1,40,1,40,1,
+        41,1,41,1,41,1,41,1,41,1,41,1,41,1,42,1,42,1,43,1,43,1,43,1,43,1,
+        44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,45,1,45,1,45,1,45,1,46,1,
+        46,1,46,1,46,1,46,1,46,1,46,1,46,1,47,1,47,1,47,1,47,1,47,1,47,1,
+        48,1,48,1,48,1,48,1,49,1,49,1,49,1,50,1,50,1,50,1,51,1,51,1,51,1,
+        51,1,51,1,52,1,52,1,53,1,53,1,54,1,54,1,55,1,55,1,56,1,56,1,56,1,
+        57,1,57,1,58,1,58,1,58,1,59,1,59,1,59,1,60,1,60,1,60,1,60,1,60,1,
+        60,1,61,1,61,1,61,1,61,1,62,1,62,1,62,1,62,1,63,1,63,1,63,1,63,1,
+        64,1,64,1,64,1,64,1,65,1,65,1,65,1,65,1,65,1,66,1,66,5,66,493,8,
+        66,10,66,12,66,496,9,66,1,67,4,67,499,8,67,11,67,12,67,500,1,68,
+        1,68,5,68,505,8,68,10,68,12,68,508,9,68,1,68,1,68,1,69,3,69,513,
+        8,69,1,69,4,69,516,8,69,11,69,12,69,517,1,69,1,69,5,69,522,8,69,
+        10,69,12,69,525,9,69,1,70,4,70,528,8,70,11,70,12,70,529,1,70,1,70,
+        1,71,1,71,1,71,4,71,537,8,71,11,71,12,71,538,0,0,72,1,1,3,2,5,3,
+        7,4,9,5,11,6,13,7,15,8,17,9,19,10,21,11,23,12,25,13,27,14,29,15,
+        31,16,33,17,35,18,37,19,39,20,41,21,43,22,45,23,47,24,49,25,51,26,
+        53,27,55,28,57,29,59,30,61,31,63,32,65,33,67,34,69,35,71,36,73,37,
+        75,38,77,39,79,40,81,41,83,42,85,43,87,44,89,45,91,46,93,47,95,48,
+        97,49,99,50,101,51,103,52,105,53,107,54,109,55,111,56,113,57,115,
+        58,117,59,119,60,121,61,123,62,125,63,127,64,129,65,131,66,133,67,
+        135,68,137,69,139,70,141,71,143,72,1,0,6,3,0,65,90,95,95,97,122,
+        4,0,48,57,65,90,95,95,97,122,1,0,48,57,1,0,39,39,3,0,9,10,13,13,
+        32,32,1,0,59,59,547,0,1,1,0,0,0,0,3,1,0,0,0,0,5,1,0,0,0,0,7,1,0,
+        0,0,0,9,1,0,0,0,0,11,1,0,0,0,0,13,1,0,0,0,0,15,1,0,0,0,0,17,1,0,
+        0,0,0,19,1,0,0,0,0,21,1,0,0,0,0,23,1,0,0,0,0,25,1,0,0,0,0,27,1,0,
+        0,0,0,29,1,0,0,0,0,31,1,0,0,0,0,33,1,0,0,0,0,35,1,0,0,0,0,37,1,0,
+        0,0,0,39,1,0,0,0,0,41,1,0,0,0,0,43,1,0,0,0,0,45,1,0,0,0,0,47,1,0,
+        0,0,0,49,1,0,0,0,0,51,1,0,0,0,0,53,1,0,0,0,0,55,1,0,0,0,0,57,1,0,
+        0,0,0,59,1,0,0,0,0,61,1,0,0,0,0,63,1,0,0,0,0,65,1,0,0,0,0,67,1,0,
+        0,0,0,69,1,0,0,0,0,71,1,0,0,0,0,73,1,0,0,0,0,75,1,0,0,0,0,77,1,0,
+        0,0,0,79,1,0,0,0,0,81,1,0,0,0,0,83,1,0,0,0,0,85,1,0,0,0,0,87,1,0,
+        0,0,0,89,1,0,0,0,0,91,1,0,0,0,0,93,1,0,0,0,0,95,1,0,0,0,0,97,1,0,
+        0,0,0,99,1,0,0,0,0,101,1,0,0,0,0,103,1,0,0,0,0,105,1,0,0,0,0,107,
+        1,0,0,0,0,109,1,0,0,0,0,111,1,0,0,0,0,113,1,0,0,0,0,115,1,0,0,0,
+        0,117,1,0,0,0,0,119,1,0,0,0,0,121,1,0,0,0,0,123,1,0,0,0,0,125,1,
+        0,0,0,0,127,1,0,0,0,0,129,1,0,0,0,0,131,1,0,0,0,0,133,1,0,0,0,0,
+        135,1,0,0,0,0,137,1,0,0,0,0,139,1,0,0,0,0,141,1,0,0,0,0,143,1,0,
+        0,0,1,145,1,0,0,0,3,147,1,0,0,0,5,154,1,0,0,0,7,163,1,0,0,0,9,168,
+        1,0,0,0,11,173,1,0,0,0,13,183,1,0,0,0,15,187,1,0,0,0,17,194,1,0,
+        0,0,19,202,1,0,0,0,21,209,1,0,0,0,23,216,1,0,0,0,25,222,1,0,0,0,
+        27,227,1,0,0,0,29,232,1,0,0,0,31,237,1,0,0,0,33,240,1,0,0,0,35,246,
+        1,0,0,0,37,251,1,0,0,0,39,253,1,0,0,0,41,255,1,0,0,0,43,260,1,0,
+        0,0,45,267,1,0,0,0,47,272,1,0,0,0,49,279,1,0,0,0,51,286,1,0,0,0,
+        53,292,1,0,0,0,55,299,1,0,0,0,57,303,1,0,0,0,59,310,1,0,0,0,61,316,
+        1,0,0,0,63,319,1,0,0,0,65,325,1,0,0,0,67,332,1,0,0,0,69,338,1,0,
+        0,0,71,342,1,0,0,0,73,348,1,0,0,0,75,356,1,0,0,0,77,360,1,0,0,0,
+        79,368,1,0,0,0,81,379,1,0,0,0,83,390,1,0,0,0,85,397,1,0,0,0,87,399,
+        1,0,0,0,89,403,1,0,0,0,91,411,1,0,0,0,93,415,1,0,0,0,95,423,1,0,
+        0,0,97,429,1,0,0,0,99,433,1,0,0,0,101,436,1,0,0,0,103,439,1,0,0,
+        0,105,444,1,0,0,0,107,446,1,0,0,0,109,448,1,0,0,0,111,450,1,0,0,
+        0,113,452,1,0,0,0,115,455,1,0,0,0,117,457,1,0,0,0,119,460,1,0,0,
+        0,121,463,1,0,0,0,123,469,1,0,0,0,125,473,1,0,0,0,127,477,1,0,0,
+        0,129,481,1,0,0,0,131,485,1,0,0,0,133,490,1,0,0,0,135,498,1,0,0,
+        0,137,502,1,0,0,0,139,512,1,0,0,0,141,527,1,0,0,0,143,533,1,0,0,
+        0,145,146,5,59,0,0,146,2,1,0,0,0,147,148,5,67,0,0,148,149,5,82,0,
+        0,149,150,5,69,0,0,150,151,5,65,0,0,151,152,5,84,0,0,152,153,5,69,
+        0,0,153,4,1,0,0,0,154,155,5,68,0,0,155,156,5,65,0,0,156,157,5,84,
+        0,0,157,158,5,65,0,0,158,159,5,66,0,0,159,160,5,65,0,0,160,161,5,
+        83,0,0,161,162,5,69,0,0,162,6,1,0,0,0,163,164,5,68,0,0,164,165,5,
+        82,0,0,165,166,5,79,0,0,166,167,5,80,0,0,167,8,1,0,0,0,168,169,5,
+        83,0,0,169,170,5,72,0,0,170,171,5,79,0,0,171,172,5,87,0,0,172,10,
+        1,0,0,0,173,174,5,68,0,0,174,175,5,65,0,0,175,176,5,84,0,0,176,177,
+        5,65,0,0,177,178,5,66,0,0,178,179,5,65,0,0,179,180,5,83,0,0,180,
+        181,5,69,0,0,181,182,5,83,0,0,182,12,1,0,0,0,183,184,5,85,0,0,184,
+        185,5,83,0,0,185,186,5,69,0,0,186,14,1,0,0,0,187,188,5,84,0,0,188,
+        189,5,65,0,0,189,190,5,66,0,0,190,191,5,76,0,0,191,192,5,69,0,0,
+        192,193,5,83,0,0,193,16,1,0,0,0,194,195,5,73,0,0,195,196,5,78,0,
+        0,196,197,5,68,0,0,197,198,5,69,0,0,198,199,5,88,0,0,199,200,5,69,
+        0,0,200,201,5,83,0,0,201,18,1,0,0,0,202,203,5,66,0,0,203,204,5,85,
+        0,0,204,205,5,70,0,0,205,206,5,70,0,0,206,207,5,69,0,0,207,208,5,
+        82,0,0,208,20,1,0,0,0,209,210,5,83,0,0,210,211,5,84,0,0,211,212,
+        5,65,0,0,212,213,5,84,0,0,213,214,5,85,0,0,214,215,5,83,0,0,215,
+        22,1,0,0,0,216,217,5,82,0,0,217,218,5,69,0,0,218,219,5,83,0,0,219,
+        220,5,69,0,0,220,221,5,84,0,0,221,24,1,0,0,0,222,223,5,76,0,0,223,
+        224,5,79,0,0,224,225,5,65,0,0,225,226,5,68,0,0,226,26,1,0,0,0,227,
+        228,5,70,0,0,228,229,5,82,0,0,229,230,5,79,0,0,230,231,5,77,0,0,
+        231,28,1,0,0,0,232,233,5,70,0,0,233,234,5,73,0,0,234,235,5,76,0,
+        0,235,236,5,69,0,0,236,30,1,0,0,0,237,238,5,84,0,0,238,239,5,79,
+        0,0,239,32,1,0,0,0,240,241,5,84,0,0,241,242,5,65,0,0,242,243,5,66,
+        0,0,243,244,5,76,0,0,244,245,5,69,0,0,245,34,1,0,0,0,246,247,5,68,
+        0,0,247,248,5,85,0,0,248,249,5,77,0,0,249,250,5,80,0,0,250,36,1,
+        0,0,0,251,252,5,40,0,0,252,38,1,0,0,0,253,254,5,41,0,0,254,40,1,
+        0,0,0,255,256,5,68,0,0,256,257,5,69,0,0,257,258,5,83,0,0,258,259,
+        5,67,0,0,259,42,1,0,0,0,260,261,5,73,0,0,261,262,5,78,0,0,262,263,
+        5,83,0,0,263,264,5,69,0,0,264,265,5,82,0,0,265,266,5,84,0,0,266,
+        44,1,0,0,0,267,268,5,73,0,0,268,269,5,78,0,0,269,270,5,84,0,0,270,
+        271,5,79,0,0,271,46,1,0,0,0,272,273,5,86,0,0,273,274,5,65,0,0,274,
+        275,5,76,0,0,275,276,5,85,0,0,276,277,5,69,0,0,277,278,5,83,0,0,
+        278,48,1,0,0,0,279,280,5,68,0,0,280,281,5,69,0,0,281,282,5,76,0,
+        0,282,283,5,69,0,0,283,284,5,84,0,0,284,285,5,69,0,0,285,50,1,0,
+        0,0,286,287,5,87,0,0,287,288,5,72,0,0,288,289,5,69,0,0,289,290,5,
+        82,0,0,290,291,5,69,0,0,291,52,1,0,0,0,292,293,5,85,0,0,293,294,
+        5,80,0,0,294,295,5,68,0,0,295,296,5,65,0,0,296,297,5,84,0,0,297,
+        298,5,69,0,0,298,54,1,0,0,0,299,300,5,83,0,0,300,301,5,69,0,0,301,
+        302,5,84,0,0,302,56,1,0,0,0,303,304,5,83,0,0,304,305,5,69,0,0,305,
+        306,5,76,0,0,306,307,5,69,0,0,307,308,5,67,0,0,308,309,5,84,0,0,
+        309,58,1,0,0,0,310,311,5,71,0,0,311,312,5,82,0,0,312,313,5,79,0,
+        0,313,314,5,85,0,0,314,315,5,80,0,0,315,60,1,0,0,0,316,317,5,66,
+        0,0,317,318,5,89,0,0,318,62,1,0,0,0,319,320,5,76,0,0,320,321,5,73,
+        0,0,321,322,5,77,0,0,322,323,5,73,0,0,323,324,5,84,0,0,324,64,1,
+        0,0,0,325,326,5,79,0,0,326,327,5,70,0,0,327,328,5,70,0,0,328,329,
+        5,83,0,0,329,330,5,69,0,0,330,331,5,84,0,0,331,66,1,0,0,0,332,333,
+        5,65,0,0,333,334,5,76,0,0,334,335,5,84,0,0,335,336,5,69,0,0,336,
+        337,5,82,0,0,337,68,1,0,0,0,338,339,5,65,0,0,339,340,5,68,0,0,340,
+        341,5,68,0,0,341,70,1,0,0,0,342,343,5,73,0,0,343,344,5,78,0,0,344,
+        345,5,68,0,0,345,346,5,69,0,0,346,347,5,88,0,0,347,72,1,0,0,0,348,
+        349,5,80,0,0,349,350,5,82,0,0,350,351,5,73,0,0,351,352,5,77,0,0,
+        352,353,5,65,0,0,353,354,5,82,0,0,354,355,5,89,0,0,355,74,1,0,0,
+        0,356,357,5,75,0,0,357,358,5,69,0,0,358,359,5,89,0,0,359,76,1,0,
+        0,0,360,361,5,70,0,0,361,362,5,79,0,0,362,363,5,82,0,0,363,364,5,
+        69,0,0,364,365,5,73,0,0,365,366,5,71,0,0,366,367,5,78,0,0,367,78,
+        1,0,0,0,368,369,5,67,0,0,369,370,5,79,0,0,370,371,5,78,0,0,371,372,
+        5,83,0,0,372,373,5,84,0,0,373,374,5,82,0,0,374,375,5,65,0,0,375,
+        376,5,73,0,0,376,377,5,78,0,0,377,378,5,84,0,0,378,80,1,0,0,0,379,
+        380,5,82,0,0,380,381,5,69,0,0,381,382,5,70,0,0,382,383,5,69,0,0,
+        383,384,5,82,0,0,384,385,5,69,0,0,385,386,5,78,0,0,386,387,5,67,
+        0,0,387,388,5,69,0,0,388,389,5,83,0,0,389,82,1,0,0,0,390,391,5,85,
+        0,0,391,392,5,78,0,0,392,393,5,73,0,0,393,394,5,81,0,0,394,395,5,
+        85,0,0,395,396,5,69,0,0,396,84,1,0,0,0,397,398,5,44,0,0,398,86,1,
+        0,0,0,399,400,5,78,0,0,400,401,5,79,0,0,401,402,5,84,0,0,402,88,
+        1,0,0,0,403,404,5,68,0,0,404,405,5,69,0,0,405,406,5,70,0,0,406,407,
+        5,65,0,0,407,408,5,85,0,0,408,409,5,76,0,0,409,410,5,84,0,0,410,
+        90,1,0,0,0,411,412,5,73,0,0,412,413,5,78,0,0,413,414,5,84,0,0,414,
+        92,1,0,0,0,415,416,5,86,0,0,416,417,5,65,0,0,417,418,5,82,0,0,418,
+        419,5,67,0,0,419,420,5,72,0,0,420,421,5,65,0,0,421,422,5,82,0,0,
+        422,94,1,0,0,0,423,424,5,70,0,0,424,425,5,76,0,0,425,426,5,79,0,
+        0,426,427,5,65,0,0,427,428,5,84,0,0,428,96,1,0,0,0,429,430,5,65,
+        0,0,430,431,5,78,0,0,431,432,5,68,0,0,432,98,1,0,0,0,433,434,5,73,
+        0,0,434,435,5,83,0,0,435,100,1,0,0,0,436,437,5,73,0,0,437,438,5,
+        78,0,0,438,102,1,0,0,0,439,440,5,76,0,0,440,441,5,73,0,0,441,442,
+        5,75,0,0,442,443,5,69,0,0,443,104,1,0,0,0,444,445,5,46,0,0,445,106,
+        1,0,0,0,446,447,5,42,0,0,447,108,1,0,0,0,448,449,5,61,0,0,449,110,
+        1,0,0,0,450,451,5,60,0,0,451,112,1,0,0,0,452,453,5,60,0,0,453,454,
+        5,61,0,0,454,114,1,0,0,0,455,456,5,62,0,0,456,116,1,0,0,0,457,458,
+        5,62,0,0,458,459,5,61,0,0,459,118,1,0,0,0,460,461,5,60,0,0,461,462,
+        5,62,0,0,462,120,1,0,0,0,463,464,5,67,0,0,464,465,5,79,0,0,465,466,
+        5,85,0,0,466,467,5,78,0,0,467,468,5,84,0,0,468,122,1,0,0,0,469,470,
+        5,65,0,0,470,471,5,86,0,0,471,472,5,71,0,0,472,124,1,0,0,0,473,474,
+        5,77,0,0,474,475,5,65,0,0,475,476,5,88,0,0,476,126,1,0,0,0,477,478,
+        5,77,0,0,478,479,5,73,0,0,479,480,5,78,0,0,480,128,1,0,0,0,481,482,
+        5,83,0,0,482,483,5,85,0,0,483,484,5,77,0,0,484,130,1,0,0,0,485,486,
+        5,78,0,0,486,487,5,85,0,0,487,488,5,76,0,0,488,489,5,76,0,0,489,
+        132,1,0,0,0,490,494,7,0,0,0,491,493,7,1,0,0,492,491,1,0,0,0,493,
+        496,1,0,0,0,494,492,1,0,0,0,494,495,1,0,0,0,495,134,1,0,0,0,496,
+        494,1,0,0,0,497,499,7,2,0,0,498,497,1,0,0,0,499,500,1,0,0,0,500,
+        498,1,0,0,0,500,501,1,0,0,0,501,136,1,0,0,0,502,506,5,39,0,0,503,
+        505,8,3,0,0,504,503,1,0,0,0,505,508,1,0,0,0,506,504,1,0,0,0,506,
+        507,1,0,0,0,507,509,1,0,0,0,508,506,1,0,0,0,509,510,5,39,0,0,510,
+        138,1,0,0,0,511,513,5,45,0,0,512,511,1,0,0,0,512,513,1,0,0,0,513,
+        515,1,0,0,0,514,516,7,2,0,0,515,514,1,0,0,0,516,517,1,0,0,0,517,
+        515,1,0,0,0,517,518,1,0,0,0,518,519,1,0,0,0,519,523,5,46,0,0,520,
+        522,7,2,0,0,521,520,1,0,0,0,522,525,1,0,0,0,523,521,1,0,0,0,523,
+        524,1,0,0,0,524,140,1,0,0,0,525,523,1,0,0,0,526,528,7,4,0,0,527,
+        526,1,0,0,0,528,529,1,0,0,0,529,527,1,0,0,0,529,530,1,0,0,0,530,
+        531,1,0,0,0,531,532,6,70,0,0,532,142,1,0,0,0,533,534,5,45,0,0,534,
+        536,5,45,0,0,535,537,8,5,0,0,536,535,1,0,0,0,537,538,1,0,0,0,538,
+        536,1,0,0,0,538,539,1,0,0,0,539,144,1,0,0,0,9,0,494,500,506,512,
+        517,523,529,538,1,6,0,0
+    ]
 
 class SQLLexer(Lexer):
 
@@ -281,24 +255,27 @@ class SQLLexer(Lexer):
     T__48 = 49
     T__49 = 50
     T__50 = 51
-    EqualOrAssign = 52
-    Less = 53
-    LessEqual = 54
-    Greater = 55
-    GreaterEqual = 56
-    NotEqual = 57
-    Count = 58
-    Average = 59
-    Max = 60
-    Min = 61
-    Sum = 62
-    Null = 63
-    Identifier = 64
-    Integer = 65
-    String = 66
-    Float = 67
-    Whitespace = 68
-    Annotation = 69
+    T__51 = 52
+    T__52 = 53
+    T__53 = 54
+    EqualOrAssign = 55
+    Less = 56
+    LessEqual = 57
+    Greater = 58
+    GreaterEqual = 59
+    NotEqual = 60
+    Count = 61
+    Average = 62
+    Max = 63
+    Min = 64
+    Sum = 65
+    Null = 66
+    Identifier = 67
+    Integer = 68
+    String = 69
+    Float = 70
+    Whitespace = 71
+    Annotation = 72
 
     channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
 
@@ -306,15 +283,16 @@ class SQLLexer(Lexer):
 
     literalNames = [ "<INVALID>",
             "';'", "'CREATE'", "'DATABASE'", "'DROP'", "'SHOW'", "'DATABASES'", 
-            "'USE'", "'TABLES'", "'INDEXES'", "'LOAD'", "'FROM'", "'FILE'", 
-            "'TO'", "'TABLE'", "'DUMP'", "'('", "')'", "'DESC'", "'INSERT'", 
-            "'INTO'", "'VALUES'", "'DELETE'", "'WHERE'", "'UPDATE'", "'SET'", 
-            "'SELECT'", "'GROUP'", "'BY'", "'LIMIT'", "'OFFSET'", "'ALTER'", 
-            "'ADD'", "'INDEX'", "'PRIMARY'", "'KEY'", "'FOREIGN'", "'CONSTRAINT'", 
-            "'REFERENCES'", "'UNIQUE'", "','", "'NOT'", "'DEFAULT'", "'INT'", 
-            "'VARCHAR'", "'FLOAT'", "'AND'", "'IS'", "'IN'", "'LIKE'", "'.'", 
-            "'*'", "'='", "'<'", "'<='", "'>'", "'>='", "'<>'", "'COUNT'", 
-            "'AVG'", "'MAX'", "'MIN'", "'SUM'", "'NULL'" ]
+            "'USE'", "'TABLES'", "'INDEXES'", "'BUFFER'", "'STATUS'", "'RESET'", 
+            "'LOAD'", "'FROM'", "'FILE'", "'TO'", "'TABLE'", "'DUMP'", "'('", 
+            "')'", "'DESC'", "'INSERT'", "'INTO'", "'VALUES'", "'DELETE'", 
+            "'WHERE'", "'UPDATE'", "'SET'", "'SELECT'", "'GROUP'", "'BY'", 
+            "'LIMIT'", "'OFFSET'", "'ALTER'", "'ADD'", "'INDEX'", "'PRIMARY'", 
+            "'KEY'", "'FOREIGN'", "'CONSTRAINT'", "'REFERENCES'", "'UNIQUE'", 
+            "','", "'NOT'", "'DEFAULT'", "'INT'", "'VARCHAR'", "'FLOAT'", 
+            "'AND'", "'IS'", "'IN'", "'LIKE'", "'.'", "'*'", "'='", "'<'", 
+            "'<='", "'>'", "'>='", "'<>'", "'COUNT'", "'AVG'", "'MAX'", 
+            "'MIN'", "'SUM'", "'NULL'" ]
 
     symbolicNames = [ "<INVALID>",
             "EqualOrAssign", "Less", "LessEqual", "Greater", "GreaterEqual", 
@@ -329,16 +307,16 @@ class SQLLexer(Lexer):
                   "T__32", "T__33", "T__34", "T__35", "T__36", "T__37", 
                   "T__38", "T__39", "T__40", "T__41", "T__42", "T__43", 
                   "T__44", "T__45", "T__46", "T__47", "T__48", "T__49", 
-                  "T__50", "EqualOrAssign", "Less", "LessEqual", "Greater", 
-                  "GreaterEqual", "NotEqual", "Count", "Average", "Max", 
-                  "Min", "Sum", "Null", "Identifier", "Integer", "String", 
-                  "Float", "Whitespace", "Annotation" ]
+                  "T__50", "T__51", "T__52", "T__53", "EqualOrAssign", "Less", 
+                  "LessEqual", "Greater", "GreaterEqual", "NotEqual", "Count", 
+                  "Average", "Max", "Min", "Sum", "Null", "Identifier", 
+                  "Integer", "String", "Float", "Whitespace", "Annotation" ]
 
     grammarFileName = "SQL.g4"
 
     def __init__(self, input=None, output:TextIO = sys.stdout):
         super().__init__(input, output)
-        self.checkVersion("4.7.2")
+        self.checkVersion("4.13.2")
         self._interp = LexerATNSimulator(self, self.atn, self.decisionsToDFA, PredictionContextCache())
         self._actions = None
         self._predicates = None
@@ -1,197 +1,159 @@
-# Generated from SQL.g4 by ANTLR 4.7.2
+# Generated from SQL.g4 by ANTLR 4.13.2
 # encoding: utf-8
 from antlr4 import *
 from io import StringIO
-from typing.io import TextIO
 import sys
-
+if sys.version_info[1] > 5:
+	from typing import TextIO
+else:
+	from typing.io import TextIO
 
 def serializedATN():
-    with StringIO() as buf:
-        buf.write("\3\u608b\ua72a\u8133\ub9ed\u417c\u3be7\u7786\u5964\3G")
-        buf.write("\u0192\4\2\t\2\4\3\t\3\4\4\t\4\4\5\t\5\4\6\t\6\4\7\t\7")
-        buf.write("\4\b\t\b\4\t\t\t\4\n\t\n\4\13\t\13\4\f\t\f\4\r\t\r\4\16")
-        buf.write("\t\16\4\17\t\17\4\20\t\20\4\21\t\21\4\22\t\22\4\23\t\23")
-        buf.write("\4\24\t\24\4\25\t\25\4\26\t\26\4\27\t\27\4\30\t\30\3\2")
-        buf.write("\7\2\62\n\2\f\2\16\2\65\13\2\3\2\3\2\3\3\3\3\3\3\3\3\3")
-        buf.write("\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\3\5\3I\n")
-        buf.write("\3\3\4\3\4\3\4\3\4\3\4\3\4\3\4\3\4\3\4\3\4\3\4\3\4\3\4")
-        buf.write("\3\4\5\4Y\n\4\3\5\3\5\3\5\3\5\3\5\3\5\3\5\3\5\3\5\3\5")
-        buf.write("\3\5\3\5\3\5\3\5\5\5i\n\5\3\6\3\6\3\6\3\6\3\6\3\6\3\6")
-        buf.write("\3\6\3\6\3\6\3\6\3\6\3\6\3\6\3\6\3\6\3\6\3\6\3\6\3\6\3")
-        buf.write("\6\3\6\3\6\3\6\3\6\3\6\3\6\3\6\3\6\3\6\5\6\u0089\n\6\3")
-        buf.write("\7\3\7\3\7\3\7\3\7\3\7\5\7\u0091\n\7\3\7\3\7\3\7\5\7\u0096")
-        buf.write("\n\7\3\7\3\7\3\7\3\7\5\7\u009c\n\7\5\7\u009e\n\7\3\b\3")
-        buf.write("\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b")
-        buf.write("\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\5\b\u00b9\n\b")
-        buf.write("\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3")
-        buf.write("\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b")
-        buf.write("\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3\b\3")
-        buf.write("\b\3\b\3\b\3\b\3\b\5\b\u00e8\n\b\3\t\3\t\3\t\7\t\u00ed")
-        buf.write("\n\t\f\t\16\t\u00f0\13\t\3\n\3\n\3\n\3\n\5\n\u00f6\n\n")
-        buf.write("\3\n\3\n\5\n\u00fa\n\n\3\n\3\n\3\n\5\n\u00ff\n\n\3\n\3")
-        buf.write("\n\3\n\3\n\3\n\3\n\3\n\5\n\u0108\n\n\3\n\3\n\3\n\3\n\3")
-        buf.write("\n\3\n\3\n\3\n\3\n\5\n\u0113\n\n\3\13\3\13\3\13\3\13\3")
-        buf.write("\13\3\13\5\13\u011b\n\13\3\f\3\f\3\f\7\f\u0120\n\f\f\f")
-        buf.write("\16\f\u0123\13\f\3\r\3\r\3\r\3\r\7\r\u0129\n\r\f\r\16")
-        buf.write("\r\u012c\13\r\3\r\3\r\3\16\3\16\3\17\3\17\3\17\7\17\u0135")
-        buf.write("\n\17\f\17\16\17\u0138\13\17\3\20\3\20\3\20\3\20\3\20")
-        buf.write("\3\20\3\20\3\20\3\20\3\20\3\20\3\20\3\20\5\20\u0147\n")
-        buf.write("\20\3\20\3\20\3\20\3\20\3\20\3\20\3\20\3\20\3\20\3\20")
-        buf.write("\3\20\3\20\3\20\3\20\3\20\3\20\5\20\u0159\n\20\3\21\3")
-        buf.write("\21\3\21\3\21\3\22\3\22\5\22\u0161\n\22\3\23\3\23\3\23")
-        buf.write("\3\23\3\23\3\23\3\23\7\23\u016a\n\23\f\23\16\23\u016d")
-        buf.write("\13\23\3\24\3\24\3\24\3\24\7\24\u0173\n\24\f\24\16\24")
-        buf.write("\u0176\13\24\5\24\u0178\n\24\3\25\3\25\3\25\3\25\3\25")
-        buf.write("\3\25\3\25\3\25\3\25\3\25\5\25\u0184\n\25\3\26\3\26\3")
-        buf.write("\26\7\26\u0189\n\26\f\26\16\26\u018c\13\26\3\27\3\27\3")
-        buf.write("\30\3\30\3\30\2\2\31\2\4\6\b\n\f\16\20\22\24\26\30\32")
-        buf.write("\34\36 \"$&(*,.\2\5\4\2AACE\3\2\66;\3\2<@\2\u01b0\2\63")
-        buf.write("\3\2\2\2\4H\3\2\2\2\6X\3\2\2\2\bh\3\2\2\2\n\u0088\3\2")
-        buf.write("\2\2\f\u008a\3\2\2\2\16\u00e7\3\2\2\2\20\u00e9\3\2\2\2")
-        buf.write("\22\u0112\3\2\2\2\24\u011a\3\2\2\2\26\u011c\3\2\2\2\30")
-        buf.write("\u0124\3\2\2\2\32\u012f\3\2\2\2\34\u0131\3\2\2\2\36\u0158")
-        buf.write("\3\2\2\2 \u015a\3\2\2\2\"\u0160\3\2\2\2$\u0162\3\2\2\2")
-        buf.write("&\u0177\3\2\2\2(\u0183\3\2\2\2*\u0185\3\2\2\2,\u018d\3")
-        buf.write("\2\2\2.\u018f\3\2\2\2\60\62\5\4\3\2\61\60\3\2\2\2\62\65")
-        buf.write("\3\2\2\2\63\61\3\2\2\2\63\64\3\2\2\2\64\66\3\2\2\2\65")
-        buf.write("\63\3\2\2\2\66\67\7\2\2\3\67\3\3\2\2\289\5\6\4\29:\7\3")
-        buf.write("\2\2:I\3\2\2\2;<\5\b\5\2<=\7\3\2\2=I\3\2\2\2>?\5\n\6\2")
-        buf.write("?@\7\3\2\2@I\3\2\2\2AB\5\16\b\2BC\7\3\2\2CI\3\2\2\2DE")
-        buf.write("\7G\2\2EI\7\3\2\2FG\7A\2\2GI\7\3\2\2H8\3\2\2\2H;\3\2\2")
-        buf.write("\2H>\3\2\2\2HA\3\2\2\2HD\3\2\2\2HF\3\2\2\2I\5\3\2\2\2")
-        buf.write("JK\7\4\2\2KL\7\5\2\2LY\7B\2\2MN\7\6\2\2NO\7\5\2\2OY\7")
-        buf.write("B\2\2PQ\7\7\2\2QY\7\b\2\2RS\7\t\2\2SY\7B\2\2TU\7\7\2\2")
-        buf.write("UY\7\n\2\2VW\7\7\2\2WY\7\13\2\2XJ\3\2\2\2XM\3\2\2\2XP")
-        buf.write("\3\2\2\2XR\3\2\2\2XT\3\2\2\2XV\3\2\2\2Y\7\3\2\2\2Z[\7")
-        buf.write("\f\2\2[\\\7\r\2\2\\]\7\16\2\2]^\7D\2\2^_\7\17\2\2_`\7")
-        buf.write("\20\2\2`i\7B\2\2ab\7\21\2\2bc\7\17\2\2cd\7\16\2\2de\7")
-        buf.write("D\2\2ef\7\r\2\2fg\7\20\2\2gi\7B\2\2hZ\3\2\2\2ha\3\2\2")
-        buf.write("\2i\t\3\2\2\2jk\7\4\2\2kl\7\20\2\2lm\7B\2\2mn\7\22\2\2")
-        buf.write("no\5\20\t\2op\7\23\2\2p\u0089\3\2\2\2qr\7\6\2\2rs\7\20")
-        buf.write("\2\2s\u0089\7B\2\2tu\7\24\2\2u\u0089\7B\2\2vw\7\25\2\2")
-        buf.write("wx\7\26\2\2xy\7B\2\2yz\7\27\2\2z\u0089\5\26\f\2{|\7\30")
-        buf.write("\2\2|}\7\r\2\2}~\7B\2\2~\177\7\31\2\2\177\u0089\5\34\17")
-        buf.write("\2\u0080\u0081\7\32\2\2\u0081\u0082\7B\2\2\u0082\u0083")
-        buf.write("\7\33\2\2\u0083\u0084\5$\23\2\u0084\u0085\7\31\2\2\u0085")
-        buf.write("\u0086\5\34\17\2\u0086\u0089\3\2\2\2\u0087\u0089\5\f\7")
-        buf.write("\2\u0088j\3\2\2\2\u0088q\3\2\2\2\u0088t\3\2\2\2\u0088")
-        buf.write("v\3\2\2\2\u0088{\3\2\2\2\u0088\u0080\3\2\2\2\u0088\u0087")
-        buf.write("\3\2\2\2\u0089\13\3\2\2\2\u008a\u008b\7\34\2\2\u008b\u008c")
-        buf.write("\5&\24\2\u008c\u008d\7\r\2\2\u008d\u0090\5*\26\2\u008e")
-        buf.write("\u008f\7\31\2\2\u008f\u0091\5\34\17\2\u0090\u008e\3\2")
-        buf.write("\2\2\u0090\u0091\3\2\2\2\u0091\u0095\3\2\2\2\u0092\u0093")
-        buf.write("\7\35\2\2\u0093\u0094\7\36\2\2\u0094\u0096\5 \21\2\u0095")
-        buf.write("\u0092\3\2\2\2\u0095\u0096\3\2\2\2\u0096\u009d\3\2\2\2")
-        buf.write("\u0097\u0098\7\37\2\2\u0098\u009b\7C\2\2\u0099\u009a\7")
-        buf.write(" \2\2\u009a\u009c\7C\2\2\u009b\u0099\3\2\2\2\u009b\u009c")
-        buf.write("\3\2\2\2\u009c\u009e\3\2\2\2\u009d\u0097\3\2\2\2\u009d")
-        buf.write("\u009e\3\2\2\2\u009e\r\3\2\2\2\u009f\u00a0\7!\2\2\u00a0")
-        buf.write("\u00a1\7\20\2\2\u00a1\u00a2\7B\2\2\u00a2\u00a3\7\"\2\2")
-        buf.write("\u00a3\u00a4\7#\2\2\u00a4\u00a5\7\22\2\2\u00a5\u00a6\5")
-        buf.write("*\26\2\u00a6\u00a7\7\23\2\2\u00a7\u00e8\3\2\2\2\u00a8")
-        buf.write("\u00a9\7!\2\2\u00a9\u00aa\7\20\2\2\u00aa\u00ab\7B\2\2")
-        buf.write("\u00ab\u00ac\7\6\2\2\u00ac\u00ad\7#\2\2\u00ad\u00ae\7")
-        buf.write("\22\2\2\u00ae\u00af\5*\26\2\u00af\u00b0\7\23\2\2\u00b0")
-        buf.write("\u00e8\3\2\2\2\u00b1\u00b2\7!\2\2\u00b2\u00b3\7\20\2\2")
-        buf.write("\u00b3\u00b4\7B\2\2\u00b4\u00b5\7\6\2\2\u00b5\u00b6\7")
-        buf.write("$\2\2\u00b6\u00b8\7%\2\2\u00b7\u00b9\7B\2\2\u00b8\u00b7")
-        buf.write("\3\2\2\2\u00b8\u00b9\3\2\2\2\u00b9\u00e8\3\2\2\2\u00ba")
-        buf.write("\u00bb\7!\2\2\u00bb\u00bc\7\20\2\2\u00bc\u00bd\7B\2\2")
-        buf.write("\u00bd\u00be\7\6\2\2\u00be\u00bf\7&\2\2\u00bf\u00c0\7")
-        buf.write("%\2\2\u00c0\u00e8\7B\2\2\u00c1\u00c2\7!\2\2\u00c2\u00c3")
-        buf.write("\7\20\2\2\u00c3\u00c4\7B\2\2\u00c4\u00c5\7\"\2\2\u00c5")
-        buf.write("\u00c6\7\'\2\2\u00c6\u00c7\7B\2\2\u00c7\u00c8\7$\2\2\u00c8")
-        buf.write("\u00c9\7%\2\2\u00c9\u00ca\7\22\2\2\u00ca\u00cb\5*\26\2")
-        buf.write("\u00cb\u00cc\7\23\2\2\u00cc\u00e8\3\2\2\2\u00cd\u00ce")
-        buf.write("\7!\2\2\u00ce\u00cf\7\20\2\2\u00cf\u00d0\7B\2\2\u00d0")
-        buf.write("\u00d1\7\"\2\2\u00d1\u00d2\7\'\2\2\u00d2\u00d3\7B\2\2")
-        buf.write("\u00d3\u00d4\7&\2\2\u00d4\u00d5\7%\2\2\u00d5\u00d6\7\22")
-        buf.write("\2\2\u00d6\u00d7\5*\26\2\u00d7\u00d8\7\23\2\2\u00d8\u00d9")
-        buf.write("\7(\2\2\u00d9\u00da\7B\2\2\u00da\u00db\7\22\2\2\u00db")
-        buf.write("\u00dc\5*\26\2\u00dc\u00dd\7\23\2\2\u00dd\u00e8\3\2\2")
-        buf.write("\2\u00de\u00df\7!\2\2\u00df\u00e0\7\20\2\2\u00e0\u00e1")
-        buf.write("\7B\2\2\u00e1\u00e2\7\"\2\2\u00e2\u00e3\7)\2\2\u00e3\u00e4")
-        buf.write("\7\22\2\2\u00e4\u00e5\5*\26\2\u00e5\u00e6\7\23\2\2\u00e6")
-        buf.write("\u00e8\3\2\2\2\u00e7\u009f\3\2\2\2\u00e7\u00a8\3\2\2\2")
-        buf.write("\u00e7\u00b1\3\2\2\2\u00e7\u00ba\3\2\2\2\u00e7\u00c1\3")
-        buf.write("\2\2\2\u00e7\u00cd\3\2\2\2\u00e7\u00de\3\2\2\2\u00e8\17")
-        buf.write("\3\2\2\2\u00e9\u00ee\5\22\n\2\u00ea\u00eb\7*\2\2\u00eb")
-        buf.write("\u00ed\5\22\n\2\u00ec\u00ea\3\2\2\2\u00ed\u00f0\3\2\2")
-        buf.write("\2\u00ee\u00ec\3\2\2\2\u00ee\u00ef\3\2\2\2\u00ef\21\3")
-        buf.write("\2\2\2\u00f0\u00ee\3\2\2\2\u00f1\u00f2\7B\2\2\u00f2\u00f5")
-        buf.write("\5\24\13\2\u00f3\u00f4\7+\2\2\u00f4\u00f6\7A\2\2\u00f5")
-        buf.write("\u00f3\3\2\2\2\u00f5\u00f6\3\2\2\2\u00f6\u00f9\3\2\2\2")
-        buf.write("\u00f7\u00f8\7,\2\2\u00f8\u00fa\5\32\16\2\u00f9\u00f7")
-        buf.write("\3\2\2\2\u00f9\u00fa\3\2\2\2\u00fa\u0113\3\2\2\2\u00fb")
-        buf.write("\u00fc\7$\2\2\u00fc\u00fe\7%\2\2\u00fd\u00ff\7B\2\2\u00fe")
-        buf.write("\u00fd\3\2\2\2\u00fe\u00ff\3\2\2\2\u00ff\u0100\3\2\2\2")
-        buf.write("\u0100\u0101\7\22\2\2\u0101\u0102\5*\26\2\u0102\u0103")
-        buf.write("\7\23\2\2\u0103\u0113\3\2\2\2\u0104\u0105\7&\2\2\u0105")
-        buf.write("\u0107\7%\2\2\u0106\u0108\7B\2\2\u0107\u0106\3\2\2\2\u0107")
-        buf.write("\u0108\3\2\2\2\u0108\u0109\3\2\2\2\u0109\u010a\7\22\2")
-        buf.write("\2\u010a\u010b\5*\26\2\u010b\u010c\7\23\2\2\u010c\u010d")
-        buf.write("\7(\2\2\u010d\u010e\7B\2\2\u010e\u010f\7\22\2\2\u010f")
-        buf.write("\u0110\5*\26\2\u0110\u0111\7\23\2\2\u0111\u0113\3\2\2")
-        buf.write("\2\u0112\u00f1\3\2\2\2\u0112\u00fb\3\2\2\2\u0112\u0104")
-        buf.write("\3\2\2\2\u0113\23\3\2\2\2\u0114\u011b\7-\2\2\u0115\u0116")
-        buf.write("\7.\2\2\u0116\u0117\7\22\2\2\u0117\u0118\7C\2\2\u0118")
-        buf.write("\u011b\7\23\2\2\u0119\u011b\7/\2\2\u011a\u0114\3\2\2\2")
-        buf.write("\u011a\u0115\3\2\2\2\u011a\u0119\3\2\2\2\u011b\25\3\2")
-        buf.write("\2\2\u011c\u0121\5\30\r\2\u011d\u011e\7*\2\2\u011e\u0120")
-        buf.write("\5\30\r\2\u011f\u011d\3\2\2\2\u0120\u0123\3\2\2\2\u0121")
-        buf.write("\u011f\3\2\2\2\u0121\u0122\3\2\2\2\u0122\27\3\2\2\2\u0123")
-        buf.write("\u0121\3\2\2\2\u0124\u0125\7\22\2\2\u0125\u012a\5\32\16")
-        buf.write("\2\u0126\u0127\7*\2\2\u0127\u0129\5\32\16\2\u0128\u0126")
-        buf.write("\3\2\2\2\u0129\u012c\3\2\2\2\u012a\u0128\3\2\2\2\u012a")
-        buf.write("\u012b\3\2\2\2\u012b\u012d\3\2\2\2\u012c\u012a\3\2\2\2")
-        buf.write("\u012d\u012e\7\23\2\2\u012e\31\3\2\2\2\u012f\u0130\t\2")
-        buf.write("\2\2\u0130\33\3\2\2\2\u0131\u0136\5\36\20\2\u0132\u0133")
-        buf.write("\7\60\2\2\u0133\u0135\5\36\20\2\u0134\u0132\3\2\2\2\u0135")
-        buf.write("\u0138\3\2\2\2\u0136\u0134\3\2\2\2\u0136\u0137\3\2\2\2")
-        buf.write("\u0137\35\3\2\2\2\u0138\u0136\3\2\2\2\u0139\u013a\5 \21")
-        buf.write("\2\u013a\u013b\5,\27\2\u013b\u013c\5\"\22\2\u013c\u0159")
-        buf.write("\3\2\2\2\u013d\u013e\5 \21\2\u013e\u013f\5,\27\2\u013f")
-        buf.write("\u0140\7\22\2\2\u0140\u0141\5\f\7\2\u0141\u0142\7\23\2")
-        buf.write("\2\u0142\u0159\3\2\2\2\u0143\u0144\5 \21\2\u0144\u0146")
-        buf.write("\7\61\2\2\u0145\u0147\7+\2\2\u0146\u0145\3\2\2\2\u0146")
-        buf.write("\u0147\3\2\2\2\u0147\u0148\3\2\2\2\u0148\u0149\7A\2\2")
-        buf.write("\u0149\u0159\3\2\2\2\u014a\u014b\5 \21\2\u014b\u014c\7")
-        buf.write("\62\2\2\u014c\u014d\5\30\r\2\u014d\u0159\3\2\2\2\u014e")
-        buf.write("\u014f\5 \21\2\u014f\u0150\7\62\2\2\u0150\u0151\7\22\2")
-        buf.write("\2\u0151\u0152\5\f\7\2\u0152\u0153\7\23\2\2\u0153\u0159")
-        buf.write("\3\2\2\2\u0154\u0155\5 \21\2\u0155\u0156\7\63\2\2\u0156")
-        buf.write("\u0157\7D\2\2\u0157\u0159\3\2\2\2\u0158\u0139\3\2\2\2")
-        buf.write("\u0158\u013d\3\2\2\2\u0158\u0143\3\2\2\2\u0158\u014a\3")
-        buf.write("\2\2\2\u0158\u014e\3\2\2\2\u0158\u0154\3\2\2\2\u0159\37")
-        buf.write("\3\2\2\2\u015a\u015b\7B\2\2\u015b\u015c\7\64\2\2\u015c")
-        buf.write("\u015d\7B\2\2\u015d!\3\2\2\2\u015e\u0161\5\32\16\2\u015f")
-        buf.write("\u0161\5 \21\2\u0160\u015e\3\2\2\2\u0160\u015f\3\2\2\2")
-        buf.write("\u0161#\3\2\2\2\u0162\u0163\7B\2\2\u0163\u0164\7\66\2")
-        buf.write("\2\u0164\u016b\5\32\16\2\u0165\u0166\7*\2\2\u0166\u0167")
-        buf.write("\7B\2\2\u0167\u0168\7\66\2\2\u0168\u016a\5\32\16\2\u0169")
-        buf.write("\u0165\3\2\2\2\u016a\u016d\3\2\2\2\u016b\u0169\3\2\2\2")
-        buf.write("\u016b\u016c\3\2\2\2\u016c%\3\2\2\2\u016d\u016b\3\2\2")
-        buf.write("\2\u016e\u0178\7\65\2\2\u016f\u0174\5(\25\2\u0170\u0171")
-        buf.write("\7*\2\2\u0171\u0173\5(\25\2\u0172\u0170\3\2\2\2\u0173")
-        buf.write("\u0176\3\2\2\2\u0174\u0172\3\2\2\2\u0174\u0175\3\2\2\2")
-        buf.write("\u0175\u0178\3\2\2\2\u0176\u0174\3\2\2\2\u0177\u016e\3")
-        buf.write("\2\2\2\u0177\u016f\3\2\2\2\u0178\'\3\2\2\2\u0179\u0184")
-        buf.write("\5 \21\2\u017a\u017b\5.\30\2\u017b\u017c\7\22\2\2\u017c")
-        buf.write("\u017d\5 \21\2\u017d\u017e\7\23\2\2\u017e\u0184\3\2\2")
-        buf.write("\2\u017f\u0180\7<\2\2\u0180\u0181\7\22\2\2\u0181\u0182")
-        buf.write("\7\65\2\2\u0182\u0184\7\23\2\2\u0183\u0179\3\2\2\2\u0183")
-        buf.write("\u017a\3\2\2\2\u0183\u017f\3\2\2\2\u0184)\3\2\2\2\u0185")
-        buf.write("\u018a\7B\2\2\u0186\u0187\7*\2\2\u0187\u0189\7B\2\2\u0188")
-        buf.write("\u0186\3\2\2\2\u0189\u018c\3\2\2\2\u018a\u0188\3\2\2\2")
-        buf.write("\u018a\u018b\3\2\2\2\u018b+\3\2\2\2\u018c\u018a\3\2\2")
-        buf.write("\2\u018d\u018e\t\3\2\2\u018e-\3\2\2\2\u018f\u0190\t\4")
-        buf.write("\2\2\u0190/\3\2\2\2\37\63HXh\u0088\u0090\u0095\u009b\u009d")
-        buf.write("\u00b8\u00e7\u00ee\u00f5\u00f9\u00fe\u0107\u0112\u011a")
-        buf.write("\u0121\u012a\u0136\u0146\u0158\u0160\u016b\u0174\u0177")
-        buf.write("\u0183\u018a")
-        return buf.getvalue()
-
+    return [
+        4,1,72,406,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
+        6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,13,
+        2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,19,2,20,
+        7,20,2,21,7,21,2,22,7,22,1,0,5,0,48,8,0,10,0,12,0,51,9,0,1,0,1,0,
+        1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
+        3,1,71,8,1,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,
+        2,1,2,1,2,1,2,1,2,1,2,1,2,3,2,93,8,2,1,3,1,3,1,3,1,3,1,3,1,3,1,3,
+        1,3,1,3,1,3,1,3,1,3,1,3,1,3,3,3,109,8,3,1,4,1,4,1,4,1,4,1,4,1,4,
+        1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,
+        1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,3,4,141,8,4,1,5,1,5,1,5,1,5,1,5,
+        1,5,3,5,149,8,5,1,5,1,5,1,5,3,5,154,8,5,1,5,1,5,1,5,1,5,3,5,160,
+        8,5,3,5,162,8,5,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,
+        1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,3,6,189,8,6,
+        1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,
+        1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,
+        1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,3,6,236,8,6,
+        1,7,1,7,1,7,5,7,241,8,7,10,7,12,7,244,9,7,1,8,1,8,1,8,1,8,3,8,250,
+        8,8,1,8,1,8,3,8,254,8,8,1,8,1,8,1,8,3,8,259,8,8,1,8,1,8,1,8,1,8,
+        1,8,1,8,1,8,3,8,268,8,8,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,8,3,8,
+        279,8,8,1,9,1,9,1,9,1,9,1,9,1,9,3,9,287,8,9,1,10,1,10,1,10,5,10,
+        292,8,10,10,10,12,10,295,9,10,1,11,1,11,1,11,1,11,5,11,301,8,11,
+        10,11,12,11,304,9,11,1,11,1,11,1,12,1,12,1,13,1,13,1,13,5,13,313,
+        8,13,10,13,12,13,316,9,13,1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,14,
+        1,14,1,14,1,14,1,14,1,14,3,14,331,8,14,1,14,1,14,1,14,1,14,1,14,
+        1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,14,3,14,349,
+        8,14,1,15,1,15,1,15,1,15,1,16,1,16,3,16,357,8,16,1,17,1,17,1,17,
+        1,17,1,17,1,17,1,17,5,17,366,8,17,10,17,12,17,369,9,17,1,18,1,18,
+        1,18,1,18,5,18,375,8,18,10,18,12,18,378,9,18,3,18,380,8,18,1,19,
+        1,19,1,19,1,19,1,19,1,19,1,19,1,19,1,19,1,19,3,19,392,8,19,1,20,
+        1,20,1,20,5,20,397,8,20,10,20,12,20,400,9,20,1,21,1,21,1,22,1,22,
+        1,22,0,0,23,0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,30,32,34,36,
+        38,40,42,44,0,3,2,0,66,66,68,70,1,0,55,60,1,0,61,65,438,0,49,1,0,
+        0,0,2,70,1,0,0,0,4,92,1,0,0,0,6,108,1,0,0,0,8,140,1,0,0,0,10,142,
+        1,0,0,0,12,235,1,0,0,0,14,237,1,0,0,0,16,278,1,0,0,0,18,286,1,0,
+        0,0,20,288,1,0,0,0,22,296,1,0,0,0,24,307,1,0,0,0,26,309,1,0,0,0,
+        28,348,1,0,0,0,30,350,1,0,0,0,32,356,1,0,0,0,34,358,1,0,0,0,36,379,
+        1,0,0,0,38,391,1,0,0,0,40,393,1,0,0,0,42,401,1,0,0,0,44,403,1,0,
+        0,0,46,48,3,2,1,0,47,46,1,0,0,0,48,51,1,0,0,0,49,47,1,0,0,0,49,50,
+        1,0,0,0,50,52,1,0,0,0,51,49,1,0,0,0,52,53,5,0,0,1,53,1,1,0,0,0,54,
+        55,3,4,2,0,55,56,5,1,0,0,56,71,1,0,0,0,57,58,3,6,3,0,58,59,5,1,0,
+        0,59,71,1,0,0,0,60,61,3,8,4,0,61,62,5,1,0,0,62,71,1,0,0,0,63,64,
+        3,12,6,0,64,65,5,1,0,0,65,71,1,0,0,0,66,67,5,72,0,0,67,71,5,1,0,
+        0,68,69,5,66,0,0,69,71,5,1,0,0,70,54,1,0,0,0,70,57,1,0,0,0,70,60,
+        1,0,0,0,70,63,1,0,0,0,70,66,1,0,0,0,70,68,1,0,0,0,71,3,1,0,0,0,72,
+        73,5,2,0,0,73,74,5,3,0,0,74,93,5,67,0,0,75,76,5,4,0,0,76,77,5,3,
+        0,0,77,93,5,67,0,0,78,79,5,5,0,0,79,93,5,6,0,0,80,81,5,7,0,0,81,
+        93,5,67,0,0,82,83,5,5,0,0,83,93,5,8,0,0,84,85,5,5,0,0,85,93,5,9,
+        0,0,86,87,5,5,0,0,87,88,5,10,0,0,88,93,5,11,0,0,89,90,5,12,0,0,90,
+        91,5,10,0,0,91,93,5,11,0,0,92,72,1,0,0,0,92,75,1,0,0,0,92,78,1,0,
+        0,0,92,80,1,0,0,0,92,82,1,0,0,0,92,84,1,0,0,0,92,86,1,0,0,0,92,89,
+        1,0,0,0,93,5,1,0,0,0,94,95,5,13,0,0,95,96,5,14,0,0,96,97,5,15,0,
+        0,97,98,5,69,0,0,98,99,5,16,0,0,99,100,5,17,0,0,100,109,5,67,0,0,
+        101,102,5,18,0,0,102,103,5,16,0,0,103,104,5,15,0,0,104,105,5,69,
+        0,0,105,106,5,14,0,0,106,107,5,17,0,0,107,109,5,67,0,0,108,94,1,
+        0,0,0,108,101,1,0,0,0,109,7,1,0,0,0,110,111,5,2,0,0,111,112,5,17,
+        0,0,112,113,5,67,0,0,113,114,5,19,0,0,114,115,3,14,7,0,115,116,5,
+        20,0,0,116,141,1,0,0,0,117,118,5,4,0,0,118,119,5,17,0,0,119,141,
+        5,67,0,0,120,121,5,21,0,0,121,141,5,67,0,0,122,123,5,22,0,0,123,
+        124,5,23,0,0,124,125,5,67,0,0,125,126,5,24,0,0,126,141,3,20,10,0,
+        127,128,5,25,0,0,128,129,5,14,0,0,129,130,5,67,0,0,130,131,5,26,
+        0,0,131,141,3,26,13,0,132,133,5,27,0,0,133,134,5,67,0,0,134,135,
+        5,28,0,0,135,136,3,34,17,0,136,137,5,26,0,0,137,138,3,26,13,0,138,
+        141,1,0,0,0,139,141,3,10,5,0,140,110,1,0,0,0,140,117,1,0,0,0,140,
+        120,1,0,0,0,140,122,1,0,0,0,140,127,1,0,0,0,140,132,1,0,0,0,140,
+        139,1,0,0,0,141,9,1,0,0,0,142,143,5,29,0,0,143,144,3,36,18,0,144,
+        145,5,14,0,0,145,148,3,40,20,0,146,147,5,26,0,0,147,149,3,26,13,
+        0,148,146,1,0,0,0,148,149,1,0,0,0,149,153,1,0,0,0,150,151,5,30,0,
+        0,151,152,5,31,0,0,152,154,3,30,15,0,153,150,1,0,0,0,153,154,1,0,
+        0,0,154,161,1,0,0,0,155,156,5,32,0,0,156,159,5,68,0,0,157,158,5,
+        33,0,0,158,160,5,68,0,0,159,157,1,0,0,0,159,160,1,0,0,0,160,162,
+        1,0,0,0,161,155,1,0,0,0,161,162,1,0,0,0,162,11,1,0,0,0,163,164,5,
+        34,0,0,164,165,5,17,0,0,165,166,5,67,0,0,166,167,5,35,0,0,167,168,
+        5,36,0,0,168,169,5,19,0,0,169,170,3,40,20,0,170,171,5,20,0,0,171,
+        236,1,0,0,0,172,173,5,34,0,0,173,174,5,17,0,0,174,175,5,67,0,0,175,
+        176,5,4,0,0,176,177,5,36,0,0,177,178,5,19,0,0,178,179,3,40,20,0,
+        179,180,5,20,0,0,180,236,1,0,0,0,181,182,5,34,0,0,182,183,5,17,0,
+        0,183,184,5,67,0,0,184,185,5,4,0,0,185,186,5,37,0,0,186,188,5,38,
+        0,0,187,189,5,67,0,0,188,187,1,0,0,0,188,189,1,0,0,0,189,236,1,0,
+        0,0,190,191,5,34,0,0,191,192,5,17,0,0,192,193,5,67,0,0,193,194,5,
+        4,0,0,194,195,5,39,0,0,195,196,5,38,0,0,196,236,5,67,0,0,197,198,
+        5,34,0,0,198,199,5,17,0,0,199,200,5,67,0,0,200,201,5,35,0,0,201,
+        202,5,40,0,0,202,203,5,67,0,0,203,204,5,37,0,0,204,205,5,38,0,0,
+        205,206,5,19,0,0,206,207,3,40,20,0,207,208,5,20,0,0,208,236,1,0,
+        0,0,209,210,5,34,0,0,210,211,5,17,0,0,211,212,5,67,0,0,212,213,5,
+        35,0,0,213,214,5,40,0,0,214,215,5,67,0,0,215,216,5,39,0,0,216,217,
+        5,38,0,0,217,218,5,19,0,0,218,219,3,40,20,0,219,220,5,20,0,0,220,
+        221,5,41,0,0,221,222,5,67,0,0,222,223,5,19,0,0,223,224,3,40,20,0,
+        224,225,5,20,0,0,225,236,1,0,0,0,226,227,5,34,0,0,227,228,5,17,0,
+        0,228,229,5,67,0,0,229,230,5,35,0,0,230,231,5,42,0,0,231,232,5,19,
+        0,0,232,233,3,40,20,0,233,234,5,20,0,0,234,236,1,0,0,0,235,163,1,
+        0,0,0,235,172,1,0,0,0,235,181,1,0,0,0,235,190,1,0,0,0,235,197,1,
+        0,0,0,235,209,1,0,0,0,235,226,1,0,0,0,236,13,1,0,0,0,237,242,3,16,
+        8,0,238,239,5,43,0,0,239,241,3,16,8,0,240,238,1,0,0,0,241,244,1,
+        0,0,0,242,240,1,0,0,0,242,243,1,0,0,0,243,15,1,0,0,0,244,242,1,0,
+        0,0,245,246,5,67,0,0,246,249,3,18,9,0,247,248,5,44,0,0,248,250,5,
+        66,0,0,249,247,1,0,0,0,249,250,1,0,0,0,250,253,1,0,0,0,251,252,5,
+        45,0,0,252,254,3,24,12,0,253,251,1,0,0,0,253,254,1,0,0,0,254,279,
+        1,0,0,0,255,256,5,37,0,0,256,258,5,38,0,0,257,259,5,67,0,0,258,257,
+        1,0,0,0,258,259,1,0,0,0,259,260,1,0,0,0,260,261,5,19,0,0,261,262,
+        3,40,20,0,262,263,5,20,0,0,263,279,1,0,0,0,264,265,5,39,0,0,265,
+        267,5,38,0,0,266,268,5,67,0,0,267,266,1,0,0,0,267,268,1,0,0,0,268,
+        269,1,0,0,0,269,270,5,19,0,0,270,271,3,40,20,0,271,272,5,20,0,0,
+        272,273,5,41,0,0,273,274,5,67,0,0,274,275,5,19,0,0,275,276,3,40,
+        20,0,276,277,5,20,0,0,277,279,1,0,0,0,278,245,1,0,0,0,278,255,1,
+        0,0,0,278,264,1,0,0,0,279,17,1,0,0,0,280,287,5,46,0,0,281,282,5,
+        47,0,0,282,283,5,19,0,0,283,284,5,68,0,0,284,287,5,20,0,0,285,287,
+        5,48,0,0,286,280,1,0,0,0,286,281,1,0,0,0,286,285,1,0,0,0,287,19,
+        1,0,0,0,288,293,3,22,11,0,289,290,5,43,0,0,290,292,3,22,11,0,291,
+        289,1,0,0,0,292,295,1,0,0,0,293,291,1,0,0,0,293,294,1,0,0,0,294,
+        21,1,0,0,0,295,293,1,0,0,0,296,297,5,19,0,0,297,302,3,24,12,0,298,
+        299,5,43,0,0,299,301,3,24,12,0,300,298,1,0,0,0,301,304,1,0,0,0,302,
+        300,1,0,0,0,302,303,1,0,0,0,303,305,1,0,0,0,304,302,1,0,0,0,305,
+        306,5,20,0,0,306,23,1,0,0,0,307,308,7,0,0,0,308,25,1,0,0,0,309,314,
+        3,28,14,0,310,311,5,49,0,0,311,313,3,28,14,0,312,310,1,0,0,0,313,
+        316,1,0,0,0,314,312,1,0,0,0,314,315,1,0,0,0,315,27,1,0,0,0,316,314,
+        1,0,0,0,317,318,3,30,15,0,318,319,3,42,21,0,319,320,3,32,16,0,320,
+        349,1,0,0,0,321,322,3,30,15,0,322,323,3,42,21,0,323,324,5,19,0,0,
+        324,325,3,10,5,0,325,326,5,20,0,0,326,349,1,0,0,0,327,328,3,30,15,
+        0,328,330,5,50,0,0,329,331,5,44,0,0,330,329,1,0,0,0,330,331,1,0,
+        0,0,331,332,1,0,0,0,332,333,5,66,0,0,333,349,1,0,0,0,334,335,3,30,
+        15,0,335,336,5,51,0,0,336,337,3,22,11,0,337,349,1,0,0,0,338,339,
+        3,30,15,0,339,340,5,51,0,0,340,341,5,19,0,0,341,342,3,10,5,0,342,
+        343,5,20,0,0,343,349,1,0,0,0,344,345,3,30,15,0,345,346,5,52,0,0,
+        346,347,5,69,0,0,347,349,1,0,0,0,348,317,1,0,0,0,348,321,1,0,0,0,
+        348,327,1,0,0,0,348,334,1,0,0,0,348,338,1,0,0,0,348,344,1,0,0,0,
+        349,29,1,0,0,0,350,351,5,67,0,0,351,352,5,53,0,0,352,353,5,67,0,
+        0,353,31,1,0,0,0,354,357,3,24,12,0,355,357,3,30,15,0,356,354,1,0,
+        0,0,356,355,1,0,0,0,357,33,1,0,0,0,358,359,5,67,0,0,359,360,5,55,
+        0,0,360,367,3,24,12,0,361,362,5,43,0,0,362,363,5,67,0,0,363,364,
+        5,55,0,0,364,366,3,24,12,0,365,361,1,0,0,0,366,369,1,0,0,0,367,365,
+        1,0,0,0,367,368,1,0,0,0,368,35,1,0,0,0,369,367,1,0,0,0,370,380,5,
+        54,0,0,371,376,3,38,19,0,372,373,5,43,0,0,373,375,3,38,19,0,374,
+        372,1,0,0,0,375,378,1,0,0,0,376,374,1,0,0,0,376,377,1,0,0,0,377,
+        380,1,0,0,0,378,376,1,0,0,0,379,370,1,0,0,0,379,371,1,0,0,0,380,
+        37,1,0,0,0,381,392,3,30,15,0,382,383,3,44,22,0,383,384,5,19,0,0,
+        384,385,3,30,15,0,385,386,5,20,0,0,386,392,1,0,0,0,387,388,5,61,
+        0,0,388,389,5,19,0,0,389,390,5,54,0,0,390,392,5,20,0,0,391,381,1,
+        0,0,0,391,382,1,0,0,0,391,387,1,0,0,0,392,39,1,0,0,0,393,398,5,67,
+        0,0,394,395,5,43,0,0,395,397,5,67,0,0,396,394,1,0,0,0,397,400,1,
+        0,0,0,398,396,1,0,0,0,398,399,1,0,0,0,399,41,1,0,0,0,400,398,1,0,
+        0,0,401,402,7,1,0,0,402,43,1,0,0,0,403,404,7,2,0,0,404,45,1,0,0,
+        0,29,49,70,92,108,140,148,153,159,161,188,235,242,249,253,258,267,
+        278,286,293,302,314,330,348,356,367,376,379,391,398
+    ]
 
 class SQLParser ( Parser ):
 
@@ -205,16 +167,17 @@ class SQLParser ( Parser ):
 
     literalNames = [ "<INVALID>", "';'", "'CREATE'", "'DATABASE'", "'DROP'", 
                      "'SHOW'", "'DATABASES'", "'USE'", "'TABLES'", "'INDEXES'", 
-                     "'LOAD'", "'FROM'", "'FILE'", "'TO'", "'TABLE'", "'DUMP'", 
-                     "'('", "')'", "'DESC'", "'INSERT'", "'INTO'", "'VALUES'", 
-                     "'DELETE'", "'WHERE'", "'UPDATE'", "'SET'", "'SELECT'", 
-                     "'GROUP'", "'BY'", "'LIMIT'", "'OFFSET'", "'ALTER'", 
-                     "'ADD'", "'INDEX'", "'PRIMARY'", "'KEY'", "'FOREIGN'", 
-                     "'CONSTRAINT'", "'REFERENCES'", "'UNIQUE'", "','", 
-                     "'NOT'", "'DEFAULT'", "'INT'", "'VARCHAR'", "'FLOAT'", 
-                     "'AND'", "'IS'", "'IN'", "'LIKE'", "'.'", "'*'", "'='", 
-                     "'<'", "'<='", "'>'", "'>='", "'<>'", "'COUNT'", "'AVG'", 
-                     "'MAX'", "'MIN'", "'SUM'", "'NULL'" ]
+                     "'BUFFER'", "'STATUS'", "'RESET'", "'LOAD'", "'FROM'", 
+                     "'FILE'", "'TO'", "'TABLE'", "'DUMP'", "'('", "')'", 
+                     "'DESC'", "'INSERT'", "'INTO'", "'VALUES'", "'DELETE'", 
+                     "'WHERE'", "'UPDATE'", "'SET'", "'SELECT'", "'GROUP'", 
+                     "'BY'", "'LIMIT'", "'OFFSET'", "'ALTER'", "'ADD'", 
+                     "'INDEX'", "'PRIMARY'", "'KEY'", "'FOREIGN'", "'CONSTRAINT'", 
+                     "'REFERENCES'", "'UNIQUE'", "','", "'NOT'", "'DEFAULT'", 
+                     "'INT'", "'VARCHAR'", "'FLOAT'", "'AND'", "'IS'", "'IN'", 
+                     "'LIKE'", "'.'", "'*'", "'='", "'<'", "'<='", "'>'", 
+                     "'>='", "'<>'", "'COUNT'", "'AVG'", "'MAX'", "'MIN'", 
+                     "'SUM'", "'NULL'" ]
 
     symbolicNames = [ "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
@@ -229,10 +192,10 @@ class SQLParser ( Parser ):
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
-                      "EqualOrAssign", "Less", "LessEqual", "Greater", "GreaterEqual", 
-                      "NotEqual", "Count", "Average", "Max", "Min", "Sum", 
-                      "Null", "Identifier", "Integer", "String", "Float", 
-                      "Whitespace", "Annotation" ]
+                      "<INVALID>", "<INVALID>", "<INVALID>", "EqualOrAssign", 
+                      "Less", "LessEqual", "Greater", "GreaterEqual", "NotEqual", 
+                      "Count", "Average", "Max", "Min", "Sum", "Null", "Identifier", 
+                      "Integer", "String", "Float", "Whitespace", "Annotation" ]
 
     RULE_program = 0
     RULE_statement = 1
@@ -317,28 +280,31 @@ class SQLParser ( Parser ):
     T__48=49
     T__49=50
     T__50=51
-    EqualOrAssign=52
-    Less=53
-    LessEqual=54
-    Greater=55
-    GreaterEqual=56
-    NotEqual=57
-    Count=58
-    Average=59
-    Max=60
-    Min=61
-    Sum=62
-    Null=63
-    Identifier=64
-    Integer=65
-    String=66
-    Float=67
-    Whitespace=68
-    Annotation=69
+    T__51=52
+    T__52=53
+    T__53=54
+    EqualOrAssign=55
+    Less=56
+    LessEqual=57
+    Greater=58
+    GreaterEqual=59
+    NotEqual=60
+    Count=61
+    Average=62
+    Max=63
+    Min=64
+    Sum=65
+    Null=66
+    Identifier=67
+    Integer=68
+    String=69
+    Float=70
+    Whitespace=71
+    Annotation=72
 
     def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
         super().__init__(input, output)
-        self.checkVersion("4.7.2")
+        self.checkVersion("4.13.2")
         self._interp = ParserATNSimulator(self, self.atn, self.decisionsToDFA, self.sharedContextCache)
         self._predicates = None
 
@@ -346,6 +312,7 @@ class SQLParser ( Parser ):
 
 
     class ProgramContext(ParserRuleContext):
+        __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
@@ -391,7 +358,7 @@ class SQLParser ( Parser ):
             self.state = 49
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << SQLParser.T__1) | (1 << SQLParser.T__3) | (1 << SQLParser.T__4) | (1 << SQLParser.T__6) | (1 << SQLParser.T__9) | (1 << SQLParser.T__14) | (1 << SQLParser.T__17) | (1 << SQLParser.T__18) | (1 << SQLParser.T__21) | (1 << SQLParser.T__23) | (1 << SQLParser.T__25) | (1 << SQLParser.T__30) | (1 << SQLParser.Null))) != 0) or _la==SQLParser.Annotation:
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 17891078324) != 0) or _la==66 or _la==72:
                 self.state = 46
                 self.statement()
                 self.state = 51
@@ -410,6 +377,7 @@ class SQLParser ( Parser ):
 
 
     class StatementContext(ParserRuleContext):
+        __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
@@ -524,6 +492,7 @@ class SQLParser ( Parser ):
 
 
     class Db_statementContext(ParserRuleContext):
+        __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
@@ -539,6 +508,28 @@ class SQLParser ( Parser ):
 
 
 
+    class Reset_buffer_statusContext(Db_statementContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a SQLParser.Db_statementContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterReset_buffer_status" ):
+                listener.enterReset_buffer_status(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitReset_buffer_status" ):
+                listener.exitReset_buffer_status(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReset_buffer_status" ):
+                return visitor.visitReset_buffer_status(self)
+            else:
+                return visitor.visitChildren(self)
+
+
     class Show_dbsContext(Db_statementContext):
 
         def __init__(self, parser, ctx:ParserRuleContext): # actually a SQLParser.Db_statementContext
@@ -607,6 +598,28 @@ class SQLParser ( Parser ):
                 return visitor.visitChildren(self)
 
 
+    class Show_buffer_statusContext(Db_statementContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a SQLParser.Db_statementContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterShow_buffer_status" ):
+                listener.enterShow_buffer_status(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitShow_buffer_status" ):
+                listener.exitShow_buffer_status(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitShow_buffer_status" ):
+                return visitor.visitShow_buffer_status(self)
+            else:
+                return visitor.visitChildren(self)
+
+
     class Create_dbContext(Db_statementContext):
 
         def __init__(self, parser, ctx:ParserRuleContext): # actually a SQLParser.Db_statementContext
@@ -683,7 +696,7 @@ class SQLParser ( Parser ):
         localctx = SQLParser.Db_statementContext(self, self._ctx, self.state)
         self.enterRule(localctx, 4, self.RULE_db_statement)
         try:
-            self.state = 86
+            self.state = 92
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,2,self._ctx)
             if la_ == 1:
@@ -744,6 +757,28 @@ class SQLParser ( Parser ):
                 self.match(SQLParser.T__8)
                 pass
 
+            elif la_ == 7:
+                localctx = SQLParser.Show_buffer_statusContext(self, localctx)
+                self.enterOuterAlt(localctx, 7)
+                self.state = 86
+                self.match(SQLParser.T__4)
+                self.state = 87
+                self.match(SQLParser.T__9)
+                self.state = 88
+                self.match(SQLParser.T__10)
+                pass
+
+            elif la_ == 8:
+                localctx = SQLParser.Reset_buffer_statusContext(self, localctx)
+                self.enterOuterAlt(localctx, 8)
+                self.state = 89
+                self.match(SQLParser.T__11)
+                self.state = 90
+                self.match(SQLParser.T__9)
+                self.state = 91
+                self.match(SQLParser.T__10)
+                pass
+
 
         except RecognitionException as re:
             localctx.exception = re
@@ -755,6 +790,7 @@ class SQLParser ( Parser ):
 
 
     class Io_statementContext(ParserRuleContext):
+        __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
@@ -828,43 +864,43 @@ class SQLParser ( Parser ):
         localctx = SQLParser.Io_statementContext(self, self._ctx, self.state)
         self.enterRule(localctx, 6, self.RULE_io_statement)
         try:
-            self.state = 102
+            self.state = 108
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [SQLParser.T__9]:
+            if token in [13]:
                 localctx = SQLParser.Load_dataContext(self, localctx)
                 self.enterOuterAlt(localctx, 1)
-                self.state = 88
-                self.match(SQLParser.T__9)
-                self.state = 89
-                self.match(SQLParser.T__10)
-                self.state = 90
-                self.match(SQLParser.T__11)
-                self.state = 91
-                self.match(SQLParser.String)
-                self.state = 92
+                self.state = 94
                 self.match(SQLParser.T__12)
-                self.state = 93
+                self.state = 95
                 self.match(SQLParser.T__13)
-                self.state = 94
+                self.state = 96
+                self.match(SQLParser.T__14)
+                self.state = 97
+                self.match(SQLParser.String)
+                self.state = 98
+                self.match(SQLParser.T__15)
+                self.state = 99
+                self.match(SQLParser.T__16)
+                self.state = 100
                 self.match(SQLParser.Identifier)
                 pass
-            elif token in [SQLParser.T__14]:
+            elif token in [18]:
                 localctx = SQLParser.Dump_dataContext(self, localctx)
                 self.enterOuterAlt(localctx, 2)
-                self.state = 95
+                self.state = 101
+                self.match(SQLParser.T__17)
+                self.state = 102
+                self.match(SQLParser.T__15)
+                self.state = 103
                 self.match(SQLParser.T__14)
-                self.state = 96
-                self.match(SQLParser.T__12)
-                self.state = 97
-                self.match(SQLParser.T__11)
-                self.state = 98
+                self.state = 104
                 self.match(SQLParser.String)
-                self.state = 99
-                self.match(SQLParser.T__10)
-                self.state = 100
+                self.state = 105
                 self.match(SQLParser.T__13)
-                self.state = 101
+                self.state = 106
+                self.match(SQLParser.T__16)
+                self.state = 107
                 self.match(SQLParser.Identifier)
                 pass
             else:
@@ -880,6 +916,7 @@ class SQLParser ( Parser ):
 
 
     class Table_statementContext(ParserRuleContext):
+        __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
@@ -1085,91 +1122,91 @@ class SQLParser ( Parser ):
         localctx = SQLParser.Table_statementContext(self, self._ctx, self.state)
         self.enterRule(localctx, 8, self.RULE_table_statement)
         try:
-            self.state = 134
+            self.state = 140
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [SQLParser.T__1]:
+            if token in [2]:
                 localctx = SQLParser.Create_tableContext(self, localctx)
                 self.enterOuterAlt(localctx, 1)
-                self.state = 104
+                self.state = 110
                 self.match(SQLParser.T__1)
-                self.state = 105
-                self.match(SQLParser.T__13)
-                self.state = 106
+                self.state = 111
+                self.match(SQLParser.T__16)
+                self.state = 112
                 self.match(SQLParser.Identifier)
-                self.state = 107
-                self.match(SQLParser.T__15)
-                self.state = 108
+                self.state = 113
+                self.match(SQLParser.T__18)
+                self.state = 114
                 self.field_list()
-                self.state = 109
-                self.match(SQLParser.T__16)
+                self.state = 115
+                self.match(SQLParser.T__19)
                 pass
-            elif token in [SQLParser.T__3]:
+            elif token in [4]:
                 localctx = SQLParser.Drop_tableContext(self, localctx)
                 self.enterOuterAlt(localctx, 2)
-                self.state = 111
+                self.state = 117
                 self.match(SQLParser.T__3)
-                self.state = 112
-                self.match(SQLParser.T__13)
-                self.state = 113
+                self.state = 118
+                self.match(SQLParser.T__16)
+                self.state = 119
                 self.match(SQLParser.Identifier)
                 pass
-            elif token in [SQLParser.T__17]:
+            elif token in [21]:
                 localctx = SQLParser.Describe_tableContext(self, localctx)
                 self.enterOuterAlt(localctx, 3)
-                self.state = 114
-                self.match(SQLParser.T__17)
-                self.state = 115
+                self.state = 120
+                self.match(SQLParser.T__20)
+                self.state = 121
                 self.match(SQLParser.Identifier)
                 pass
-            elif token in [SQLParser.T__18]:
+            elif token in [22]:
                 localctx = SQLParser.Insert_into_tableContext(self, localctx)
                 self.enterOuterAlt(localctx, 4)
-                self.state = 116
-                self.match(SQLParser.T__18)
-                self.state = 117
-                self.match(SQLParser.T__19)
-                self.state = 118
+                self.state = 122
+                self.match(SQLParser.T__21)
+                self.state = 123
+                self.match(SQLParser.T__22)
+                self.state = 124
                 self.match(SQLParser.Identifier)
-                self.state = 119
-                self.match(SQLParser.T__20)
-                self.state = 120
+                self.state = 125
+                self.match(SQLParser.T__23)
+                self.state = 126
                 self.value_lists()
                 pass
-            elif token in [SQLParser.T__21]:
+            elif token in [25]:
                 localctx = SQLParser.Delete_from_tableContext(self, localctx)
                 self.enterOuterAlt(localctx, 5)
-                self.state = 121
-                self.match(SQLParser.T__21)
-                self.state = 122
-                self.match(SQLParser.T__10)
-                self.state = 123
+                self.state = 127
+                self.match(SQLParser.T__24)
+                self.state = 128
+                self.match(SQLParser.T__13)
+                self.state = 129
                 self.match(SQLParser.Identifier)
-                self.state = 124
-                self.match(SQLParser.T__22)
-                self.state = 125
+                self.state = 130
+                self.match(SQLParser.T__25)
+                self.state = 131
                 self.where_and_clause()
                 pass
-            elif token in [SQLParser.T__23]:
+            elif token in [27]:
                 localctx = SQLParser.Update_tableContext(self, localctx)
                 self.enterOuterAlt(localctx, 6)
-                self.state = 126
-                self.match(SQLParser.T__23)
-                self.state = 127
+                self.state = 132
+                self.match(SQLParser.T__26)
+                self.state = 133
                 self.match(SQLParser.Identifier)
-                self.state = 128
-                self.match(SQLParser.T__24)
-                self.state = 129
+                self.state = 134
+                self.match(SQLParser.T__27)
+                self.state = 135
                 self.set_clause()
-                self.state = 130
-                self.match(SQLParser.T__22)
-                self.state = 131
+                self.state = 136
+                self.match(SQLParser.T__25)
+                self.state = 137
                 self.where_and_clause()
                 pass
-            elif token in [SQLParser.T__25]:
+            elif token in [29]:
                 localctx = SQLParser.Select_table_Context(self, localctx)
                 self.enterOuterAlt(localctx, 7)
-                self.state = 133
+                self.state = 139
                 self.select_table()
                 pass
             else:
@@ -1185,6 +1222,7 @@ class SQLParser ( Parser ):
 
 
     class Select_tableContext(ParserRuleContext):
+        __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
@@ -1239,51 +1277,51 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 136
-            self.match(SQLParser.T__25)
-            self.state = 137
+            self.state = 142
+            self.match(SQLParser.T__28)
+            self.state = 143
             self.selectors()
-            self.state = 138
-            self.match(SQLParser.T__10)
-            self.state = 139
+            self.state = 144
+            self.match(SQLParser.T__13)
+            self.state = 145
             self.identifiers()
-            self.state = 142
+            self.state = 148
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==SQLParser.T__22:
-                self.state = 140
-                self.match(SQLParser.T__22)
-                self.state = 141
+            if _la==26:
+                self.state = 146
+                self.match(SQLParser.T__25)
+                self.state = 147
                 self.where_and_clause()
 
 
-            self.state = 147
+            self.state = 153
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==SQLParser.T__26:
-                self.state = 144
-                self.match(SQLParser.T__26)
-                self.state = 145
-                self.match(SQLParser.T__27)
-                self.state = 146
+            if _la==30:
+                self.state = 150
+                self.match(SQLParser.T__29)
+                self.state = 151
+                self.match(SQLParser.T__30)
+                self.state = 152
                 self.column()
 
 
-            self.state = 155
+            self.state = 161
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==SQLParser.T__28:
-                self.state = 149
-                self.match(SQLParser.T__28)
-                self.state = 150
+            if _la==32:
+                self.state = 155
+                self.match(SQLParser.T__31)
+                self.state = 156
                 self.match(SQLParser.Integer)
-                self.state = 153
+                self.state = 159
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==SQLParser.T__29:
-                    self.state = 151
-                    self.match(SQLParser.T__29)
-                    self.state = 152
+                if _la==33:
+                    self.state = 157
+                    self.match(SQLParser.T__32)
+                    self.state = 158
                     self.match(SQLParser.Integer)
 
 
@@ -1299,6 +1337,7 @@ class SQLParser ( Parser ):
 
 
     class Alter_statementContext(ParserRuleContext):
+        __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
@@ -1519,71 +1558,71 @@ class SQLParser ( Parser ):
         self.enterRule(localctx, 12, self.RULE_alter_statement)
         self._la = 0 # Token type
         try:
-            self.state = 229
+            self.state = 235
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,10,self._ctx)
             if la_ == 1:
                 localctx = SQLParser.Alter_add_indexContext(self, localctx)
                 self.enterOuterAlt(localctx, 1)
-                self.state = 157
-                self.match(SQLParser.T__30)
-                self.state = 158
-                self.match(SQLParser.T__13)
-                self.state = 159
-                self.match(SQLParser.Identifier)
-                self.state = 160
-                self.match(SQLParser.T__31)
-                self.state = 161
-                self.match(SQLParser.T__32)
-                self.state = 162
-                self.match(SQLParser.T__15)
                 self.state = 163
-                self.identifiers()
+                self.match(SQLParser.T__33)
                 self.state = 164
                 self.match(SQLParser.T__16)
-                pass
-
-            elif la_ == 2:
-                localctx = SQLParser.Alter_drop_indexContext(self, localctx)
-                self.enterOuterAlt(localctx, 2)
+                self.state = 165
+                self.match(SQLParser.Identifier)
                 self.state = 166
-                self.match(SQLParser.T__30)
+                self.match(SQLParser.T__34)
                 self.state = 167
-                self.match(SQLParser.T__13)
+                self.match(SQLParser.T__35)
                 self.state = 168
-                self.match(SQLParser.Identifier)
+                self.match(SQLParser.T__18)
                 self.state = 169
-                self.match(SQLParser.T__3)
+                self.identifiers()
                 self.state = 170
-                self.match(SQLParser.T__32)
-                self.state = 171
-                self.match(SQLParser.T__15)
+                self.match(SQLParser.T__19)
+                pass
+
+            elif la_ == 2:
+                localctx = SQLParser.Alter_drop_indexContext(self, localctx)
+                self.enterOuterAlt(localctx, 2)
                 self.state = 172
-                self.identifiers()
+                self.match(SQLParser.T__33)
                 self.state = 173
                 self.match(SQLParser.T__16)
-                pass
-
-            elif la_ == 3:
-                localctx = SQLParser.Alter_table_drop_pkContext(self, localctx)
-                self.enterOuterAlt(localctx, 3)
+                self.state = 174
+                self.match(SQLParser.Identifier)
                 self.state = 175
-                self.match(SQLParser.T__30)
+                self.match(SQLParser.T__3)
                 self.state = 176
-                self.match(SQLParser.T__13)
+                self.match(SQLParser.T__35)
                 self.state = 177
-                self.match(SQLParser.Identifier)
+                self.match(SQLParser.T__18)
                 self.state = 178
-                self.match(SQLParser.T__3)
+                self.identifiers()
                 self.state = 179
+                self.match(SQLParser.T__19)
+                pass
+
+            elif la_ == 3:
+                localctx = SQLParser.Alter_table_drop_pkContext(self, localctx)
+                self.enterOuterAlt(localctx, 3)
+                self.state = 181
                 self.match(SQLParser.T__33)
-                self.state = 180
-                self.match(SQLParser.T__34)
                 self.state = 182
+                self.match(SQLParser.T__16)
+                self.state = 183
+                self.match(SQLParser.Identifier)
+                self.state = 184
+                self.match(SQLParser.T__3)
+                self.state = 185
+                self.match(SQLParser.T__36)
+                self.state = 186
+                self.match(SQLParser.T__37)
+                self.state = 188
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==SQLParser.Identifier:
-                    self.state = 181
+                if _la==67:
+                    self.state = 187
                     self.match(SQLParser.Identifier)
 
 
@@ -1592,105 +1631,105 @@ class SQLParser ( Parser ):
             elif la_ == 4:
                 localctx = SQLParser.Alter_table_drop_foreign_keyContext(self, localctx)
                 self.enterOuterAlt(localctx, 4)
-                self.state = 184
-                self.match(SQLParser.T__30)
-                self.state = 185
-                self.match(SQLParser.T__13)
-                self.state = 186
+                self.state = 190
+                self.match(SQLParser.T__33)
+                self.state = 191
+                self.match(SQLParser.T__16)
+                self.state = 192
                 self.match(SQLParser.Identifier)
-                self.state = 187
+                self.state = 193
                 self.match(SQLParser.T__3)
-                self.state = 188
-                self.match(SQLParser.T__35)
-                self.state = 189
-                self.match(SQLParser.T__34)
-                self.state = 190
+                self.state = 194
+                self.match(SQLParser.T__38)
+                self.state = 195
+                self.match(SQLParser.T__37)
+                self.state = 196
                 self.match(SQLParser.Identifier)
                 pass
 
             elif la_ == 5:
                 localctx = SQLParser.Alter_table_add_pkContext(self, localctx)
                 self.enterOuterAlt(localctx, 5)
-                self.state = 191
-                self.match(SQLParser.T__30)
-                self.state = 192
-                self.match(SQLParser.T__13)
-                self.state = 193
-                self.match(SQLParser.Identifier)
-                self.state = 194
-                self.match(SQLParser.T__31)
-                self.state = 195
-                self.match(SQLParser.T__36)
-                self.state = 196
-                self.match(SQLParser.Identifier)
                 self.state = 197
                 self.match(SQLParser.T__33)
                 self.state = 198
-                self.match(SQLParser.T__34)
+                self.match(SQLParser.T__16)
                 self.state = 199
-                self.match(SQLParser.T__15)
+                self.match(SQLParser.Identifier)
                 self.state = 200
-                self.identifiers()
+                self.match(SQLParser.T__34)
                 self.state = 201
-                self.match(SQLParser.T__16)
-                pass
-
-            elif la_ == 6:
-                localctx = SQLParser.Alter_table_add_foreign_keyContext(self, localctx)
-                self.enterOuterAlt(localctx, 6)
+                self.match(SQLParser.T__39)
+                self.state = 202
+                self.match(SQLParser.Identifier)
                 self.state = 203
-                self.match(SQLParser.T__30)
+                self.match(SQLParser.T__36)
                 self.state = 204
-                self.match(SQLParser.T__13)
+                self.match(SQLParser.T__37)
                 self.state = 205
-                self.match(SQLParser.Identifier)
+                self.match(SQLParser.T__18)
                 self.state = 206
-                self.match(SQLParser.T__31)
+                self.identifiers()
                 self.state = 207
-                self.match(SQLParser.T__36)
-                self.state = 208
-                self.match(SQLParser.Identifier)
+                self.match(SQLParser.T__19)
+                pass
+
+            elif la_ == 6:
+                localctx = SQLParser.Alter_table_add_foreign_keyContext(self, localctx)
+                self.enterOuterAlt(localctx, 6)
                 self.state = 209
-                self.match(SQLParser.T__35)
+                self.match(SQLParser.T__33)
                 self.state = 210
-                self.match(SQLParser.T__34)
+                self.match(SQLParser.T__16)
                 self.state = 211
-                self.match(SQLParser.T__15)
+                self.match(SQLParser.Identifier)
                 self.state = 212
-                self.identifiers()
+                self.match(SQLParser.T__34)
                 self.state = 213
-                self.match(SQLParser.T__16)
+                self.match(SQLParser.T__39)
                 self.state = 214
-                self.match(SQLParser.T__37)
-                self.state = 215
                 self.match(SQLParser.Identifier)
+                self.state = 215
+                self.match(SQLParser.T__38)
                 self.state = 216
-                self.match(SQLParser.T__15)
+                self.match(SQLParser.T__37)
                 self.state = 217
-                self.identifiers()
+                self.match(SQLParser.T__18)
                 self.state = 218
-                self.match(SQLParser.T__16)
-                pass
-
-            elif la_ == 7:
-                localctx = SQLParser.Alter_table_add_uniqueContext(self, localctx)
-                self.enterOuterAlt(localctx, 7)
+                self.identifiers()
+                self.state = 219
+                self.match(SQLParser.T__19)
                 self.state = 220
-                self.match(SQLParser.T__30)
+                self.match(SQLParser.T__40)
                 self.state = 221
-                self.match(SQLParser.T__13)
-                self.state = 222
                 self.match(SQLParser.Identifier)
+                self.state = 222
+                self.match(SQLParser.T__18)
                 self.state = 223
-                self.match(SQLParser.T__31)
+                self.identifiers()
                 self.state = 224
-                self.match(SQLParser.T__38)
-                self.state = 225
-                self.match(SQLParser.T__15)
+                self.match(SQLParser.T__19)
+                pass
+
+            elif la_ == 7:
+                localctx = SQLParser.Alter_table_add_uniqueContext(self, localctx)
+                self.enterOuterAlt(localctx, 7)
                 self.state = 226
-                self.identifiers()
+                self.match(SQLParser.T__33)
                 self.state = 227
                 self.match(SQLParser.T__16)
+                self.state = 228
+                self.match(SQLParser.Identifier)
+                self.state = 229
+                self.match(SQLParser.T__34)
+                self.state = 230
+                self.match(SQLParser.T__41)
+                self.state = 231
+                self.match(SQLParser.T__18)
+                self.state = 232
+                self.identifiers()
+                self.state = 233
+                self.match(SQLParser.T__19)
                 pass
 
 
@@ -1704,6 +1743,7 @@ class SQLParser ( Parser ):
 
 
     class Field_listContext(ParserRuleContext):
+        __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
@@ -1743,17 +1783,17 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 231
+            self.state = 237
             self.field()
-            self.state = 236
+            self.state = 242
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==SQLParser.T__39:
-                self.state = 232
-                self.match(SQLParser.T__39)
-                self.state = 233
-                self.field()
+            while _la==43:
                 self.state = 238
+                self.match(SQLParser.T__42)
+                self.state = 239
+                self.field()
+                self.state = 244
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -1767,6 +1807,7 @@ class SQLParser ( Parser ):
 
 
     class FieldContext(ParserRuleContext):
+        __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
@@ -1881,90 +1922,90 @@ class SQLParser ( Parser ):
         self.enterRule(localctx, 16, self.RULE_field)
         self._la = 0 # Token type
         try:
-            self.state = 272
+            self.state = 278
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [SQLParser.Identifier]:
+            if token in [67]:
                 localctx = SQLParser.Normal_fieldContext(self, localctx)
                 self.enterOuterAlt(localctx, 1)
-                self.state = 239
+                self.state = 245
                 self.match(SQLParser.Identifier)
-                self.state = 240
+                self.state = 246
                 self.type_()
-                self.state = 243
+                self.state = 249
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==SQLParser.T__40:
-                    self.state = 241
-                    self.match(SQLParser.T__40)
-                    self.state = 242
+                if _la==44:
+                    self.state = 247
+                    self.match(SQLParser.T__43)
+                    self.state = 248
                     self.match(SQLParser.Null)
 
 
-                self.state = 247
+                self.state = 253
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==SQLParser.T__41:
-                    self.state = 245
-                    self.match(SQLParser.T__41)
-                    self.state = 246
+                if _la==45:
+                    self.state = 251
+                    self.match(SQLParser.T__44)
+                    self.state = 252
                     self.value()
 
 
                 pass
-            elif token in [SQLParser.T__33]:
+            elif token in [37]:
                 localctx = SQLParser.Primary_key_fieldContext(self, localctx)
                 self.enterOuterAlt(localctx, 2)
-                self.state = 249
-                self.match(SQLParser.T__33)
-                self.state = 250
-                self.match(SQLParser.T__34)
-                self.state = 252
+                self.state = 255
+                self.match(SQLParser.T__36)
+                self.state = 256
+                self.match(SQLParser.T__37)
+                self.state = 258
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==SQLParser.Identifier:
-                    self.state = 251
+                if _la==67:
+                    self.state = 257
                     self.match(SQLParser.Identifier)
 
 
-                self.state = 254
-                self.match(SQLParser.T__15)
-                self.state = 255
+                self.state = 260
+                self.match(SQLParser.T__18)
+                self.state = 261
                 self.identifiers()
-                self.state = 256
-                self.match(SQLParser.T__16)
+                self.state = 262
+                self.match(SQLParser.T__19)
                 pass
-            elif token in [SQLParser.T__35]:
+            elif token in [39]:
                 localctx = SQLParser.Foreign_key_fieldContext(self, localctx)
                 self.enterOuterAlt(localctx, 3)
-                self.state = 258
-                self.match(SQLParser.T__35)
-                self.state = 259
-                self.match(SQLParser.T__34)
-                self.state = 261
+                self.state = 264
+                self.match(SQLParser.T__38)
+                self.state = 265
+                self.match(SQLParser.T__37)
+                self.state = 267
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==SQLParser.Identifier:
-                    self.state = 260
+                if _la==67:
+                    self.state = 266
                     self.match(SQLParser.Identifier)
 
 
-                self.state = 263
-                self.match(SQLParser.T__15)
-                self.state = 264
+                self.state = 269
+                self.match(SQLParser.T__18)
+                self.state = 270
                 self.identifiers()
-                self.state = 265
-                self.match(SQLParser.T__16)
-                self.state = 266
-                self.match(SQLParser.T__37)
-                self.state = 267
+                self.state = 271
+                self.match(SQLParser.T__19)
+                self.state = 272
+                self.match(SQLParser.T__40)
+                self.state = 273
                 self.match(SQLParser.Identifier)
-                self.state = 268
-                self.match(SQLParser.T__15)
-                self.state = 269
+                self.state = 274
+                self.match(SQLParser.T__18)
+                self.state = 275
                 self.identifiers()
-                self.state = 270
-                self.match(SQLParser.T__16)
+                self.state = 276
+                self.match(SQLParser.T__19)
                 pass
             else:
                 raise NoViableAltException(self)
@@ -1979,6 +2020,7 @@ class SQLParser ( Parser ):
 
 
     class Type_Context(ParserRuleContext):
+        __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
@@ -2012,29 +2054,29 @@ class SQLParser ( Parser ):
         localctx = SQLParser.Type_Context(self, self._ctx, self.state)
         self.enterRule(localctx, 18, self.RULE_type_)
         try:
-            self.state = 280
+            self.state = 286
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [SQLParser.T__42]:
+            if token in [46]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 274
-                self.match(SQLParser.T__42)
+                self.state = 280
+                self.match(SQLParser.T__45)
                 pass
-            elif token in [SQLParser.T__43]:
+            elif token in [47]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 275
-                self.match(SQLParser.T__43)
-                self.state = 276
-                self.match(SQLParser.T__15)
-                self.state = 277
+                self.state = 281
+                self.match(SQLParser.T__46)
+                self.state = 282
+                self.match(SQLParser.T__18)
+                self.state = 283
                 self.match(SQLParser.Integer)
-                self.state = 278
-                self.match(SQLParser.T__16)
+                self.state = 284
+                self.match(SQLParser.T__19)
                 pass
-            elif token in [SQLParser.T__44]:
+            elif token in [48]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 279
-                self.match(SQLParser.T__44)
+                self.state = 285
+                self.match(SQLParser.T__47)
                 pass
             else:
                 raise NoViableAltException(self)
@@ -2049,6 +2091,7 @@ class SQLParser ( Parser ):
 
 
     class Value_listsContext(ParserRuleContext):
+        __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
@@ -2088,17 +2131,17 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 282
+            self.state = 288
             self.value_list()
-            self.state = 287
+            self.state = 293
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==SQLParser.T__39:
-                self.state = 283
-                self.match(SQLParser.T__39)
-                self.state = 284
-                self.value_list()
+            while _la==43:
                 self.state = 289
+                self.match(SQLParser.T__42)
+                self.state = 290
+                self.value_list()
+                self.state = 295
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -2112,6 +2155,7 @@ class SQLParser ( Parser ):
 
 
     class Value_listContext(ParserRuleContext):
+        __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
@@ -2151,24 +2195,24 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 290
-            self.match(SQLParser.T__15)
-            self.state = 291
-            self.value()
             self.state = 296
+            self.match(SQLParser.T__18)
+            self.state = 297
+            self.value()
+            self.state = 302
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==SQLParser.T__39:
-                self.state = 292
-                self.match(SQLParser.T__39)
-                self.state = 293
-                self.value()
+            while _la==43:
                 self.state = 298
+                self.match(SQLParser.T__42)
+                self.state = 299
+                self.value()
+                self.state = 304
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 299
-            self.match(SQLParser.T__16)
+            self.state = 305
+            self.match(SQLParser.T__19)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -2179,6 +2223,7 @@ class SQLParser ( Parser ):
 
 
     class ValueContext(ParserRuleContext):
+        __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
@@ -2223,9 +2268,9 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 301
+            self.state = 307
             _la = self._input.LA(1)
-            if not(((((_la - 63)) & ~0x3f) == 0 and ((1 << (_la - 63)) & ((1 << (SQLParser.Null - 63)) | (1 << (SQLParser.Integer - 63)) | (1 << (SQLParser.String - 63)) | (1 << (SQLParser.Float - 63)))) != 0)):
+            if not(((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & 29) != 0)):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -2240,6 +2285,7 @@ class SQLParser ( Parser ):
 
 
     class Where_and_clauseContext(ParserRuleContext):
+        __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
@@ -2279,17 +2325,17 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 303
+            self.state = 309
             self.where_clause()
-            self.state = 308
+            self.state = 314
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==SQLParser.T__45:
-                self.state = 304
-                self.match(SQLParser.T__45)
-                self.state = 305
-                self.where_clause()
+            while _la==49:
                 self.state = 310
+                self.match(SQLParser.T__48)
+                self.state = 311
+                self.where_clause()
+                self.state = 316
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -2303,6 +2349,7 @@ class SQLParser ( Parser ):
 
 
     class Where_clauseContext(ParserRuleContext):
+        __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
@@ -2497,88 +2544,88 @@ class SQLParser ( Parser ):
         self.enterRule(localctx, 28, self.RULE_where_clause)
         self._la = 0 # Token type
         try:
-            self.state = 342
+            self.state = 348
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,22,self._ctx)
             if la_ == 1:
                 localctx = SQLParser.Where_operator_expressionContext(self, localctx)
                 self.enterOuterAlt(localctx, 1)
-                self.state = 311
+                self.state = 317
                 self.column()
-                self.state = 312
+                self.state = 318
                 self.operator()
-                self.state = 313
+                self.state = 319
                 self.expression()
                 pass
 
             elif la_ == 2:
                 localctx = SQLParser.Where_operator_selectContext(self, localctx)
                 self.enterOuterAlt(localctx, 2)
-                self.state = 315
+                self.state = 321
                 self.column()
-                self.state = 316
+                self.state = 322
                 self.operator()
-                self.state = 317
-                self.match(SQLParser.T__15)
-                self.state = 318
+                self.state = 323
+                self.match(SQLParser.T__18)
+                self.state = 324
                 self.select_table()
-                self.state = 319
-                self.match(SQLParser.T__16)
+                self.state = 325
+                self.match(SQLParser.T__19)
                 pass
 
             elif la_ == 3:
                 localctx = SQLParser.Where_nullContext(self, localctx)
                 self.enterOuterAlt(localctx, 3)
-                self.state = 321
+                self.state = 327
                 self.column()
-                self.state = 322
-                self.match(SQLParser.T__46)
-                self.state = 324
+                self.state = 328
+                self.match(SQLParser.T__49)
+                self.state = 330
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==SQLParser.T__40:
-                    self.state = 323
-                    self.match(SQLParser.T__40)
+                if _la==44:
+                    self.state = 329
+                    self.match(SQLParser.T__43)
 
 
-                self.state = 326
+                self.state = 332
                 self.match(SQLParser.Null)
                 pass
 
             elif la_ == 4:
                 localctx = SQLParser.Where_in_listContext(self, localctx)
                 self.enterOuterAlt(localctx, 4)
-                self.state = 328
+                self.state = 334
                 self.column()
-                self.state = 329
-                self.match(SQLParser.T__47)
-                self.state = 330
+                self.state = 335
+                self.match(SQLParser.T__50)
+                self.state = 336
                 self.value_list()
                 pass
 
             elif la_ == 5:
                 localctx = SQLParser.Where_in_selectContext(self, localctx)
                 self.enterOuterAlt(localctx, 5)
-                self.state = 332
+                self.state = 338
                 self.column()
-                self.state = 333
-                self.match(SQLParser.T__47)
-                self.state = 334
-                self.match(SQLParser.T__15)
-                self.state = 335
+                self.state = 339
+                self.match(SQLParser.T__50)
+                self.state = 340
+                self.match(SQLParser.T__18)
+                self.state = 341
                 self.select_table()
-                self.state = 336
-                self.match(SQLParser.T__16)
+                self.state = 342
+                self.match(SQLParser.T__19)
                 pass
 
             elif la_ == 6:
                 localctx = SQLParser.Where_like_stringContext(self, localctx)
                 self.enterOuterAlt(localctx, 6)
-                self.state = 338
+                self.state = 344
                 self.column()
-                self.state = 339
-                self.match(SQLParser.T__48)
-                self.state = 340
+                self.state = 345
+                self.match(SQLParser.T__51)
+                self.state = 346
                 self.match(SQLParser.String)
                 pass
 
@@ -2593,6 +2640,7 @@ class SQLParser ( Parser ):
 
 
     class ColumnContext(ParserRuleContext):
+        __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
@@ -2630,11 +2678,11 @@ class SQLParser ( Parser ):
         self.enterRule(localctx, 30, self.RULE_column)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 344
+            self.state = 350
             self.match(SQLParser.Identifier)
-            self.state = 345
-            self.match(SQLParser.T__49)
-            self.state = 346
+            self.state = 351
+            self.match(SQLParser.T__52)
+            self.state = 352
             self.match(SQLParser.Identifier)
         except RecognitionException as re:
             localctx.exception = re
@@ -2646,6 +2694,7 @@ class SQLParser ( Parser ):
 
 
     class ExpressionContext(ParserRuleContext):
+        __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
@@ -2684,17 +2733,17 @@ class SQLParser ( Parser ):
         localctx = SQLParser.ExpressionContext(self, self._ctx, self.state)
         self.enterRule(localctx, 32, self.RULE_expression)
         try:
-            self.state = 350
+            self.state = 356
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [SQLParser.Null, SQLParser.Integer, SQLParser.String, SQLParser.Float]:
+            if token in [66, 68, 69, 70]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 348
+                self.state = 354
                 self.value()
                 pass
-            elif token in [SQLParser.Identifier]:
+            elif token in [67]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 349
+                self.state = 355
                 self.column()
                 pass
             else:
@@ -2710,6 +2759,7 @@ class SQLParser ( Parser ):
 
 
     class Set_clauseContext(ParserRuleContext):
+        __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
@@ -2761,25 +2811,25 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 352
+            self.state = 358
             self.match(SQLParser.Identifier)
-            self.state = 353
+            self.state = 359
             self.match(SQLParser.EqualOrAssign)
-            self.state = 354
+            self.state = 360
             self.value()
-            self.state = 361
+            self.state = 367
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==SQLParser.T__39:
-                self.state = 355
-                self.match(SQLParser.T__39)
-                self.state = 356
+            while _la==43:
+                self.state = 361
+                self.match(SQLParser.T__42)
+                self.state = 362
                 self.match(SQLParser.Identifier)
-                self.state = 357
+                self.state = 363
                 self.match(SQLParser.EqualOrAssign)
-                self.state = 358
+                self.state = 364
                 self.value()
-                self.state = 363
+                self.state = 369
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -2793,6 +2843,7 @@ class SQLParser ( Parser ):
 
 
     class SelectorsContext(ParserRuleContext):
+        __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
@@ -2831,27 +2882,27 @@ class SQLParser ( Parser ):
         self.enterRule(localctx, 36, self.RULE_selectors)
         self._la = 0 # Token type
         try:
-            self.state = 373
+            self.state = 379
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [SQLParser.T__50]:
+            if token in [54]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 364
-                self.match(SQLParser.T__50)
+                self.state = 370
+                self.match(SQLParser.T__53)
                 pass
-            elif token in [SQLParser.Count, SQLParser.Average, SQLParser.Max, SQLParser.Min, SQLParser.Sum, SQLParser.Identifier]:
+            elif token in [61, 62, 63, 64, 65, 67]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 365
+                self.state = 371
                 self.selector()
-                self.state = 370
+                self.state = 376
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                while _la==SQLParser.T__39:
-                    self.state = 366
-                    self.match(SQLParser.T__39)
-                    self.state = 367
-                    self.selector()
+                while _la==43:
                     self.state = 372
+                    self.match(SQLParser.T__42)
+                    self.state = 373
+                    self.selector()
+                    self.state = 378
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
@@ -2869,6 +2920,7 @@ class SQLParser ( Parser ):
 
 
     class SelectorContext(ParserRuleContext):
+        __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
@@ -2910,37 +2962,37 @@ class SQLParser ( Parser ):
         localctx = SQLParser.SelectorContext(self, self._ctx, self.state)
         self.enterRule(localctx, 38, self.RULE_selector)
         try:
-            self.state = 385
+            self.state = 391
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,27,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 375
+                self.state = 381
                 self.column()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 376
+                self.state = 382
                 self.aggregator()
-                self.state = 377
-                self.match(SQLParser.T__15)
-                self.state = 378
+                self.state = 383
+                self.match(SQLParser.T__18)
+                self.state = 384
                 self.column()
-                self.state = 379
-                self.match(SQLParser.T__16)
+                self.state = 385
+                self.match(SQLParser.T__19)
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 381
+                self.state = 387
                 self.match(SQLParser.Count)
-                self.state = 382
-                self.match(SQLParser.T__15)
-                self.state = 383
-                self.match(SQLParser.T__50)
-                self.state = 384
-                self.match(SQLParser.T__16)
+                self.state = 388
+                self.match(SQLParser.T__18)
+                self.state = 389
+                self.match(SQLParser.T__53)
+                self.state = 390
+                self.match(SQLParser.T__19)
                 pass
 
 
@@ -2954,6 +3006,7 @@ class SQLParser ( Parser ):
 
 
     class IdentifiersContext(ParserRuleContext):
+        __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
@@ -2992,17 +3045,17 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 387
+            self.state = 393
             self.match(SQLParser.Identifier)
-            self.state = 392
+            self.state = 398
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==SQLParser.T__39:
-                self.state = 388
-                self.match(SQLParser.T__39)
-                self.state = 389
-                self.match(SQLParser.Identifier)
+            while _la==43:
                 self.state = 394
+                self.match(SQLParser.T__42)
+                self.state = 395
+                self.match(SQLParser.Identifier)
+                self.state = 400
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -3016,6 +3069,7 @@ class SQLParser ( Parser ):
 
 
     class OperatorContext(ParserRuleContext):
+        __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
@@ -3066,9 +3120,9 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 395
+            self.state = 401
             _la = self._input.LA(1)
-            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << SQLParser.EqualOrAssign) | (1 << SQLParser.Less) | (1 << SQLParser.LessEqual) | (1 << SQLParser.Greater) | (1 << SQLParser.GreaterEqual) | (1 << SQLParser.NotEqual))) != 0)):
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 2269814212194729984) != 0)):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -3083,6 +3137,7 @@ class SQLParser ( Parser ):
 
 
     class AggregatorContext(ParserRuleContext):
+        __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
@@ -3130,9 +3185,9 @@ class SQLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 397
+            self.state = 403
             _la = self._input.LA(1)
-            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << SQLParser.Count) | (1 << SQLParser.Average) | (1 << SQLParser.Max) | (1 << SQLParser.Min) | (1 << SQLParser.Sum))) != 0)):
+            if not(((((_la - 61)) & ~0x3f) == 0 and ((1 << (_la - 61)) & 31) != 0)):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
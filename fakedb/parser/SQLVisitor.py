@@ -1,6 +1,6 @@
-# Generated from SQL.g4 by ANTLR 4.7.2
+# Generated from SQL.g4 by ANTLR 4.13.2
 from antlr4 import *
-if __name__ is not None and "." in __name__:
+if "." in __name__:
     from .SQLParser import SQLParser
 else:
     from SQLParser import SQLParser
@@ -49,6 +49,16 @@ class SQLVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by SQLParser#show_buffer_status.
+    def visitShow_buffer_status(self, ctx:SQLParser.Show_buffer_statusContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by SQLParser#reset_buffer_status.
+    def visitReset_buffer_status(self, ctx:SQLParser.Reset_buffer_statusContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by SQLParser#load_data.
     def visitLoad_data(self, ctx:SQLParser.Load_dataContext):
         return self.visitChildren(ctx)
@@ -1,5 +1,6 @@
 # TODO:
 from .rid import RID
 from .record_manager import RecordManager
+from .table_handle import TableHandle
 from .record import Record
-from .utils import get_all_records
\ No newline at end of file
+from .utils import scan_records
\ No newline at end of file
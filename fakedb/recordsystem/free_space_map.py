@@ -0,0 +1,92 @@
+import numpy as np
+from ..config import NEXT_AVAILABLE_PAGE_OFFSET, NEXT_AVAILABLE_PAGE_SIZE, FSM_ENTRY_OFFSET
+
+
+class FreeSpaceMap:
+    '''
+    空闲空间表(FSM): 表中每一页的空闲槽数, 插入时据此选页, 删除空出的槽之后还能用到
+    - 存储: 从文件头的fsm_page开始的FSM页链表, 每页是[下一个FSM页, 补位, 大端uint16的空闲槽数...]
+      第k个FSM页记录页号在[k * entries, (k + 1) * entries)之间的页
+    - 第0页和FSM页自身的空闲槽数为0, 不会被选中
+    - 打开表时整个读入内存, 修改时只把对应的FSM页标记为脏, flush时写回
+    - 没有FSM页的旧文件由TableHandle从各页的空闲槽数算出, 只在内存中使用, 不写回
+    '''
+    def __init__(self, file_manager, fd, page_size, counts, fsm_pages=None):
+        '''
+        counts: 页号 -> 空闲槽数
+        fsm_pages: FSM页的页号, 按链表顺序; None表示旧文件, 不写回存储
+        '''
+        self.file_manager = file_manager
+        self.fd = fd
+        self.page_size = page_size
+        self.entries = (page_size - FSM_ENTRY_OFFSET) // 2 # 每个FSM页记录的页数
+        self.counts = np.asarray(counts, dtype=np.int32)
+        self.fsm_pages = fsm_pages
+        self.dirty = set() # 需要写回的FSM页在链表中的序号
+        self.cursor = 0 # 正在插入的页, 满了之后才重新选页
+        self.cursor_free = 0 # 正在插入的页的空闲槽数, 每次插入时不必读numpy数组
+
+    @staticmethod
+    def load(file_manager, fd, header):
+        '''从文件的FSM页链表读入'''
+        entries = (header.page_size - FSM_ENTRY_OFFSET) // 2
+        fsm_pages, chunks = [], []
+        page_id = header.fsm_page
+        while page_id != 0:
+            page = file_manager.read_page(fd, page_id)
+            fsm_pages.append(page_id)
+            chunks.append(page[FSM_ENTRY_OFFSET: FSM_ENTRY_OFFSET + entries * 2].view('>u2'))
+            page_id = int.from_bytes(
+                page[NEXT_AVAILABLE_PAGE_OFFSET: NEXT_AVAILABLE_PAGE_OFFSET + NEXT_AVAILABLE_PAGE_SIZE].tobytes(), 'big')
+        counts = np.zeros(header.page_num, dtype=np.int32)
+        if chunks:
+            stored = np.concatenate(chunks)[:header.page_num]
+            counts[:len(stored)] = stored
+        return FreeSpaceMap(file_manager, fd, header.page_size, counts, fsm_pages)
+
+    def covers(self, page_id):
+        '''FSM页是否已经能记录页号为page_id的页'''
+        return self.fsm_pages is None or page_id < len(self.fsm_pages) * self.entries
+
+    def add_fsm_page(self, page_id):
+        '''接在链表末尾的新FSM页, 页本身记为没有空闲槽'''
+        self.fsm_pages.append(page_id)
+        self.dirty.update((len(self.fsm_pages) - 2, len(self.fsm_pages) - 1)) # 前一个FSM页的链接也要改
+        self.set(page_id, 0)
+
+    def set(self, page_id, count):
+        if page_id >= len(self.counts):
+            counts = np.zeros(max(page_id + 1, len(self.counts) * 2), dtype=np.int32)
+            counts[:len(self.counts)] = self.counts
+            self.counts = counts
+        self.counts[page_id] = count
+        if page_id == self.cursor:
+            self.cursor_free = count
+        if self.fsm_pages is not None:
+            self.dirty.add(page_id // self.entries)
+
+    def find(self):
+        '''
+        一个有空闲槽的页, 没有时返回0
+        当前页满了之前一直选它, 满了再找页号最小的有空闲槽的页
+        '''
+        if self.cursor_free > 0:
+            return self.cursor
+        pages = np.flatnonzero(self.counts)
+        self.cursor = int(pages[0]) if len(pages) else 0
+        self.cursor_free = int(self.counts[self.cursor])
+        return self.cursor
+
+    def flush(self):
+        '''把修改过的FSM页写回'''
+        for k in sorted(self.dirty):
+            if k < 0:
+                continue
+            page = np.zeros(self.page_size, dtype=np.uint8)
+            next_page = self.fsm_pages[k + 1] if k + 1 < len(self.fsm_pages) else 0
+            page[NEXT_AVAILABLE_PAGE_OFFSET: NEXT_AVAILABLE_PAGE_OFFSET + NEXT_AVAILABLE_PAGE_SIZE] = \
+                np.frombuffer(next_page.to_bytes(NEXT_AVAILABLE_PAGE_SIZE, 'big'), dtype=np.uint8)
+            counts = self.counts[k * self.entries: (k + 1) * self.entries]
+            page[FSM_ENTRY_OFFSET: FSM_ENTRY_OFFSET + len(counts) * 2] = counts.astype('>u2').view(np.uint8)
+            self.file_manager.write_page(self.fd, self.fsm_pages[k], page)
+        self.dirty = set()
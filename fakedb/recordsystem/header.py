@@ -1,22 +1,36 @@
 import json
+import struct
 import numpy as np
-# from ..config import PAGE_SIZE
-PAGE_SIZE = 8192
+from ..config import PAGE_SIZE, TABLE_HEADER_MAGIC, TABLE_HEADER_VERSION
 
 class Header:
     '''
     文件头
+    存储格式: 小端int64的[TABLE_HEADER_MAGIC, 版本, FIELDS中的各项], 之后用0补满一页
+    旧文件的文件头是JSON, 读出后下次写回时换成这个格式, 版本为1
+    版本决定了数据页的格式, 写回时保留文件原来的版本
     '''
+    FIELDS = ('record_len', 'record_capacity', 'record_num', 'page_num', 'bitmap_len', 'next_available_page',
+              'free_page', 'page_size', 'fsm_page')
+    STRUCT = struct.Struct(f'<{2 + len(FIELDS)}q')
+
     def __init__(self, **kwargs):
         '''
         record_len: 每条记录的字节数
         record_capacity: 每页最大可存放的记录数
         record_num: 当前记录数
         page_num: 当前页数
-        filename: 文件名
         bitmap_len: bitmap的字节数
-        next_available_page: 下一个可以插入记录的页
+        next_available_page: 下一个可以插入记录的页, 版本3起不再使用, 为0
+        free_page: 空闲页链表头, 旧文件没有这一项, 为0; 版本3起不再使用, 为0
+        page_size: 文件的页大小, 旧文件没有这一项, 为PAGE_SIZE
+        fsm_page: 第一个FSM页, 版本3之前的文件没有FSM页, 为0
+        version: 文件格式的版本, 旧文件为1
         '''
+        self.free_page = 0
+        self.page_size = PAGE_SIZE
+        self.fsm_page = 0
+        self.version = 1
         for k, v in kwargs.items():
             self.__setattr__(k, v)
 
@@ -24,25 +38,29 @@ class Header:
         '''
         导出一整页, 用0补位
         '''
-        output = np.zeros(PAGE_SIZE, dtype=np.uint8)
-        header_bytes = json.dumps(self.__dict__).encode('utf-8')
-        output[: len(header_bytes)] = list(header_bytes)
+        output = np.zeros(self.page_size, dtype=np.uint8)
+        Header.STRUCT.pack_into(output, 0, TABLE_HEADER_MAGIC, self.version,
+                                *(int(getattr(self, field)) for field in Header.FIELDS))
         return output
 
+    @staticmethod
+    def is_legacy(data):
+        '''是否是旧的JSON文件头'''
+        return int.from_bytes(bytes(data[:8]), 'little') != TABLE_HEADER_MAGIC
+
     @staticmethod
     def deserialize(data):
         '''
-        恢复dict, 去掉补位的0
+        从文件开头的字节(bytes或uint8数组)恢复文件头
         '''
-        data = json.loads(data.tobytes().decode('utf-8').rstrip('\0'))
-        header = Header(**data)
-        return header
-
+        if Header.is_legacy(data):
+            return Header(**json.loads(bytes(data).decode('utf-8').rstrip('\0')))
+        magic, version, *values = Header.STRUCT.unpack_from(data)
+        if version > TABLE_HEADER_VERSION:
+            raise Exception(f'table header version {version} is newer than supported version {TABLE_HEADER_VERSION}')
+        return Header(version=version, **dict(zip(Header.FIELDS, values)))
 
-
-
-if __name__ == '__main__':
-    test = Header(a=2, b=3)
-    data = test.serialize()
-    header = Header.deserialize(data)
-    
\ No newline at end of file
+    @staticmethod
+    def peek_page_size(data):
+        '''从文件开头的字节(bytes)中取出页大小, 文件头总在第一个默认大小的页之内'''
+        return Header.deserialize(data[:PAGE_SIZE]).page_size
@@ -0,0 +1,232 @@
+from ..filesystem.file_manager import FileManager
+from .header import Header
+from .rid import RID
+from .record import Record
+from .free_space_map import FreeSpaceMap
+from ..config import NEXT_AVAILABLE_PAGE_OFFSET, NEXT_AVAILABLE_PAGE_SIZE, BITMAP_START_OFFSET, \
+    HINTED_BITMAP_START_OFFSET, SLOT_HINT_OFFSET
+import numpy as np
+import struct
+
+
+class TableHandle:
+    '''
+    一张打开的表: 表文件的fd和解析好的文件头
+    由RecordManager.open_file创建, SystemManager按表缓存, 切换表时不再重新读文件头
+    每个handle只操作自己的文件, 可以同时操作多张表
+    文件头和空闲空间表只在内存中修改并标记为脏, 在flush和close时才写回
+    数据页: [下个空闲页, 空闲槽数, 第一个空闲槽的下界, bitmap, 各槽的记录], bitmap中1表示空闲
+    版本1的旧文件没有空闲槽数和第一个空闲槽, 用到时从bitmap算出
+    版本3起插入时由空闲空间表(FreeSpaceMap)选页, 不再使用下个空闲页和文件头中的两个链表
+    '''
+    SLOT_HINT = struct.Struct('>HH') # 每页最多65536字节, 槽数不超过2字节
+
+    def __init__(self, file_manager: FileManager, fd) -> None:
+        self.file_manager = file_manager
+        self.fd = fd
+        header_page = self.file_manager.read_page(fd, 0)
+        self.header = Header.deserialize(header_page)
+        self.header_dirty = Header.is_legacy(header_page) # 旧的JSON文件头在下次写回时换成新格式
+        self.slot_hint = self.header.version >= 2 # 页中是否记录了空闲槽数和第一个空闲槽
+        self.bitmap_offset = HINTED_BITMAP_START_OFFSET if self.slot_hint else BITMAP_START_OFFSET
+        # 每页实际能放下的记录数: 版本1的文件计算record_capacity时没有算上BITMAP_START_OFFSET, 最后一个槽可能超出页尾
+        self.usable_capacity = min(self.header.record_capacity,
+                                   (self.header.page_size - self.get_byte_offset_by_slotid(0)) // self.header.record_len)
+        # 旧文件没有FSM页, 第一次插入或删除时再从各页算出
+        self.fsm = FreeSpaceMap.load(file_manager, fd, self.header) if self.header.version >= 3 else None
+
+    def close(self):
+        '''写回文件头和空闲空间表后关闭文件, 之后handle不能再使用'''
+        self.flush()
+        self.file_manager.close_file(self.fd)
+        self.fd = None
+
+    def flush_header(self):
+        '''文件头有修改时写回第0页'''
+        if self.header_dirty:
+            self.file_manager.write_page(self.fd, 0, self.header.serialize())
+            self.header_dirty = False
+
+    def flush(self):
+        '''把文件头和空闲空间表的修改写到缓存中'''
+        if self.fsm is not None:
+            self.fsm.flush()
+        self.flush_header()
+
+    def get_fsm(self):
+        '''
+        表的空闲空间表
+        旧文件第一次用到时读一遍各页的空闲槽数, 文件头中的两个链表从此不再维护, 清空以免和FSM不一致
+        '''
+        if self.fsm is None:
+            page_num = self.header.page_num
+            counts = [0] * page_num
+            self.file_manager.prefetch_pages(self.fd, 1, page_num - 1)
+            for page_id in range(1, page_num):
+                page = self.fetch_page(page_id)
+                counts[page_id] = self.get_slot_hint(page)[0]
+                self.unpin_page(page_id)
+            self.fsm = FreeSpaceMap(self.file_manager, self.fd, self.header.page_size, counts)
+            self.header.next_available_page = self.header.free_page = 0
+            self.header_dirty = True
+        return self.fsm
+
+    def data_page_ids(self):
+        '''所有数据页的页号, 不包括文件头和FSM页'''
+        fsm_pages = set(self.fsm.fsm_pages or ()) if self.fsm is not None else set()
+        return [page_id for page_id in range(1, self.header.page_num) if page_id not in fsm_pages]
+
+    def get_byte_offset_by_slotid(self, slotid):
+        return self.bitmap_offset + self.header.bitmap_len + self.header.record_len * slotid
+
+    def get_page_and_offset(self, rid: RID, exclusive=False):
+        '''返回pin住的页和记录在页中的偏移, 用完后调用unpin_page; 要修改记录时exclusive为True'''
+        page = self.fetch_page(rid.page_id, exclusive)
+        byte_offset = self.get_byte_offset_by_slotid(rid.slot_id)
+        return page, byte_offset
+
+    def get_slot_hint(self, page):
+        '''
+        页的空闲槽数和第一个空闲槽的下界
+        旧文件的页中没有记录, 从bitmap算出空闲槽数, 下界为0
+        '''
+        if not self.slot_hint:
+            return int(self.get_bitmap(page).sum()), 0
+        return TableHandle.SLOT_HINT.unpack_from(page, SLOT_HINT_OFFSET)
+
+    def set_slot_hint(self, page, free_count, first_free):
+        if self.slot_hint:
+            TableHandle.SLOT_HINT.pack_into(page, SLOT_HINT_OFFSET, free_count, first_free)
+
+    def find_free_slot(self, page, first_free):
+        '''
+        从first_free开始逐字节找第一个为1的位, 页中须有空闲槽(get_slot_hint的空闲槽数大于0)
+        空闲槽数只数usable_capacity之内的槽, first_free不超过其中第一个空闲槽, 所以找到的位就是这个槽,
+        不会是bitmap末尾补位的1, 也不会是版本1的文件中超出页尾的最后一个槽
+        '''
+        offset = self.bitmap_offset
+        i = first_free >> 3
+        byte = int(page[offset + i]) & (0xFF >> (first_free & 7)) # 去掉first_free之前的槽
+        while byte == 0:
+            i += 1
+            byte = int(page[offset + i])
+        return i * 8 + 8 - byte.bit_length() # 槽号从每个字节的最高位开始
+
+    def empty_page(self):
+        '''没有记录的页, bitmap全为1'''
+        data = np.full(self.header.page_size, -1, dtype=np.uint8)
+        data[NEXT_AVAILABLE_PAGE_OFFSET: NEXT_AVAILABLE_PAGE_OFFSET + NEXT_AVAILABLE_PAGE_SIZE] = 0 # 版本3起不再使用
+        self.set_slot_hint(data, self.usable_capacity, 0)
+        return data
+
+    def append_page(self):
+        '''
+        扩展文件, 新增一个空的数据页
+        超出现有FSM页能记录的范围时先新增一个FSM页
+        '''
+        fsm = self.get_fsm()
+        if not fsm.covers(self.header.page_num):
+            fsm.add_fsm_page(self.file_manager.new_page(self.fd, np.zeros(self.header.page_size, dtype=np.uint8)))
+            self.header.page_num += 1
+        page_id = self.file_manager.new_page(self.fd, self.empty_page())
+        self.header.page_num += 1
+        fsm.set(page_id, self.usable_capacity)
+        self.header_dirty = True
+        return page_id
+
+    def get_bitmap(self, page):
+        '''usable_capacity个槽的bitmap, 版本1的文件中超出页尾的槽不算在内'''
+        offset = self.bitmap_offset
+        l = self.header.bitmap_len
+        return np.unpackbits(page[offset: offset+l])[:self.usable_capacity]
+
+    def set_bitmap(self, page, bitmap):
+        offset = self.bitmap_offset
+        l = self.header.bitmap_len
+        page[offset: offset+l] = np.packbits(bitmap)  # 不足一个byte的话会先补0再pack
+
+    def get_record(self, rid: RID):
+        page, byte_offset = self.get_page_and_offset(rid)
+        record = Record(rid, page[byte_offset: byte_offset + self.header.record_len])
+        self.unpin_page(rid.page_id)
+        return record
+
+    def get_page_data(self, page):
+        '''
+        页中所有记录的数据, page是pin住的页
+        return: (槽号数组, (记录数, record_len)的uint8数组), 数据是复制出来的
+        '''
+        record_len = self.header.record_len
+        start = self.get_byte_offset_by_slotid(0)
+        n = self.usable_capacity
+        slot_ids = np.flatnonzero(self.get_bitmap(page) == 0)
+        slots = page[start: start + n * record_len].reshape(n, record_len)
+        return slot_ids, slots[slot_ids]
+
+    def update_record(self, rid: RID, data):
+        page, byte_offset = self.get_page_and_offset(rid, exclusive=True)
+        # print('record len = ', self.header.record_len)
+        # print('header file = '', self.header.record_len)
+        # print('header file = ', self.header.filename)
+        try:
+            page[byte_offset: byte_offset + self.header.record_len] = data
+        finally: # 出错时也要unpin, 否则这一页一直pin着并latch住
+            self.unpin_page(rid.page_id, dirty=True)
+
+    def fetch_page(self, page_id, exclusive=False):
+        '''读一页并pin住, 用完后调用unpin_page; exclusive为True时独占, 可以直接修改'''
+        return self.file_manager.fetch_page(self.fd, page_id, exclusive)
+
+    def unpin_page(self, page_id, dirty=False):
+        self.file_manager.unpin_page(self.fd, page_id, dirty)
+
+    def insert_record(self, data):
+        fsm = self.fsm or self.get_fsm()
+        page_id = fsm.find()
+        if page_id == 0: # 所有页都满了
+            page_id = self.append_page()
+
+        page = self.fetch_page(page_id, exclusive=True)
+        dirty = False
+        try:
+            free_count, first_free = self.get_slot_hint(page)
+            if free_count == 0:
+                raise Exception(f'page {page_id} is full but the free space map has {fsm.counts[page_id]} free slots')
+            slot_id = self.find_free_slot(page, first_free)
+
+            offset = self.get_byte_offset_by_slotid(slot_id)
+            record_len = self.header.record_len
+            page[offset: offset+record_len] = data
+            dirty = True
+            i = self.bitmap_offset + (slot_id >> 3)
+            page[i] = int(page[i]) & (0xFF ^ (0x80 >> (slot_id & 7))) # 转成int再写回, 比直接对numpy元素做位运算快
+            self.set_slot_hint(page, free_count - 1, slot_id + 1)
+        finally:
+            self.unpin_page(page_id, dirty)
+
+        fsm.set(page_id, free_count - 1)
+        self.header.record_num += 1
+        self.header_dirty = True
+        return RID(page_id, slot_id)
+
+    def delete_record(self, rid: RID):
+        page_id = int(rid.page_id) # 从索引中取出的rid页号是np.int64
+        slot_id = int(rid.slot_id)
+
+        page = self.fetch_page(page_id, exclusive=True)
+        dirty = False
+        try:
+            i = self.bitmap_offset + (slot_id >> 3)
+            bit = 0x80 >> (slot_id & 7)
+            if int(page[i]) & bit:
+                raise Exception(f'record ({rid}) has been deleted')
+            free_count, first_free = self.get_slot_hint(page)
+            page[i] = int(page[i]) | bit
+            dirty = True
+            self.set_slot_hint(page, free_count + 1, min(first_free, slot_id))
+        finally:
+            self.unpin_page(page_id, dirty)
+
+        self.get_fsm().set(page_id, free_count + 1) # 空出的槽之后插入时还能选到
+        self.header.record_num -= 1
+        self.header_dirty = True
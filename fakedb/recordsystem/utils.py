@@ -1,41 +1,37 @@
 from ..config import PAGE_SIZE
 from .rid import RID
 import numpy as np
-from time import time
 
-def get_all_records(record_manager):
-    # t = time()
-    page_num = record_manager.header.page_num
-    # print(f'page num:{page_num}')
-    res = []
-    for page_id in range(1, page_num):
-        page = record_manager.get_page(page_id)
-        # if page_id == 1:
-        #     print(f'page 1:{page.tobytes()}')
-        bitmap = record_manager.get_bitmap(page)
-        for slot_id in np.where(bitmap == 0)[0]:
-            record = record_manager.get_record(RID(page_id, slot_id))
-            res.append(record)
-        # if page_id == 1:
-        #     print(f'in for, res 0:{res[0].data.tobytes()}')
-
-    # if res:
-    #     print(f'res 0:{res[0].data.tobytes()}')
-    # print(f'get all records takes {time() - t} s')
-    return res
+def scan_records(handle):
+    '''
+    顺序扫描表中的所有记录, 每页的记录一次取出, 不为每条记录创建Record
+    return: (RID列表, (记录数, record_len)的uint8数组)
+    '''
+    page_num = handle.header.page_num
+    # 提示文件层开始顺序扫描, 之后的窗口由顺序读检测继续预读
+    handle.file_manager.prefetch_pages(handle.fd, 1, page_num - 1)
+    rids = []
+    chunks = [np.zeros((0, handle.header.record_len), dtype=np.uint8)]
+    for page_id in handle.data_page_ids():
+        page = handle.fetch_page(page_id)
+        slot_ids, data = handle.get_page_data(page)
+        handle.unpin_page(page_id)
+        rids.extend(RID(page_id, slot_id) for slot_id in slot_ids.tolist())
+        chunks.append(data)
+    return rids, np.concatenate(chunks)
 
-def get_record_capacity(record_len):
+def get_record_capacity(record_len, page_size=PAGE_SIZE):
     '''
     计算每页最多能存储的记录条数
     考虑bitmap的占用
     
     设为x, 则有
-    (x + 7) // 8 + x * record_len <= PAGE_SIZE
-    x + 7 + x * record_len * 8 <= PAGE_SIZE * 8
+    (x + 7) // 8 + x * record_len <= page_size
+    x + 7 + x * record_len * 8 <= page_size * 8
     '''
 
-    size = (PAGE_SIZE * 8 - 7) // (1 + record_len * 8)
-    assert ((size + 7) // 8) + size * record_len <= PAGE_SIZE
+    size = (page_size * 8 - 7) // (1 + record_len * 8)
+    assert ((size + 7) // 8) + size * record_len <= page_size
     return size
 
 